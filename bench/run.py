@@ -0,0 +1,399 @@
+"""Benchmark runner for every generation phase and export format.
+
+Each case times one phase for one (employee_count, num_months) pair in a
+fresh worker process, so earlier cases do not affect it. Setup (building the
+phase's inputs, and warming the language profile and Faker name tables) is
+excluded from the timing. The phase then runs --repeat times (short phases
+more often, for at least MIN_TOTAL_SECONDS in total): the fastest run gives rows/s,
+and memory is the largest RSS growth during one run.
+
+    python -m bench.run                        # quick sweep, compared to bench/baseline.json
+    python -m bench.run --profile full --output results.json
+    python -m bench.run --phases generate_dataset --counts 100000 --months 1 12
+    python -m bench.run --save-baseline        # refresh bench/baseline.json
+
+A case regresses when its rows/s falls, or its RSS growth rises, by more
+than --tolerance relative to the baseline; the runner then exits with 1.
+"""
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import date
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+from hr_generator.batch import (
+    assign_forced_performance_batch,
+    audit_columns,
+    columns_to_records,
+    create_employees_batch,
+)
+from hr_generator.employee import create_employee, validate_employee
+from hr_generator.engine import columns_to_frame, concat_columns
+from hr_generator.export import encode_export
+from hr_generator.generator import (
+    _add_concurrent_positions,
+    _base_dates,
+    _draw_concurrent_postings,
+    _shard_month,
+    _shard_timeline,
+    generate_base_employees,
+    generate_dataset,
+)
+from hr_generator.language import get_profile
+from hr_generator.names import name_tables
+from hr_generator.models import GeneratorConfig
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Sweeps: employee counts x month counts
+PROFILES = {
+    "quick": {"counts": [1_000, 10_000], "months": [1, 12]},
+    "full": {"counts": [1_000, 10_000, 100_000, 1_000_000], "months": [1, 12, 60]},
+}
+
+# Row-at-a-time phases are capped so a full sweep finishes in reasonable time
+SCALAR_MAX_EMPLOYEES = 10_000
+EXCEL_MAX_OUTPUT_ROWS = 100_000
+
+EXPORT_FORMATS = ("csv", "json", "xlsx", "parquet", "ndjson")
+
+# Cases faster than this are too noisy to compare against the baseline
+MIN_COMPARE_SECONDS = 0.05
+# RSS growth below this is allocator noise, so smaller baselines compare against it
+MIN_COMPARE_RSS_MB = 20
+
+DEFAULT_REPEAT = 5
+# Short cases keep repeating until they have run this long in total, so that
+# their fastest run is not taken from a single burst of background load
+MIN_TOTAL_SECONDS = 2.0
+MAX_REPEAT = 200
+
+
+def _config(employee_count, num_months, **kwargs):
+    return GeneratorConfig(
+        language="English",
+        employee_count=employee_count,
+        num_months=num_months,
+        age_range=(22, 65),
+        salary_range=(3_000_000, 15_000_000),
+        random_seed=42,
+        as_of_date=date(2024, 6, 1),
+        **kwargs,
+    )
+
+
+def _base_state(config):
+    profile = get_profile(config.language)
+    state = generate_base_employees(config, profile, np.random.default_rng(0))
+    assign_forced_performance_batch(state)
+    return profile, state
+
+
+def _simulate_months(config, profile, state):
+    timeline = _shard_timeline(config, state, _base_dates(config), np.random.SeedSequence(1))
+    return [
+        _shard_month(config, profile, timeline, month_offset)
+        for month_offset in range(config.num_months)
+    ]
+
+
+# Each setup takes a GeneratorConfig and returns (run, rows): run() is the
+# timed call and rows the number of rows it processes or produces (None when
+# the count is only known afterwards; run() then returns it). run() may be
+# called several times.
+
+def _setup_create_employee(config):
+    profile = get_profile(config.language)
+    rng = np.random.default_rng(0)
+    n = config.employee_count
+
+    def run():
+        for i in range(n):
+            create_employee(config, profile, rng, i + 1)
+
+    return run, n
+
+
+def _setup_create_employees_batch(config):
+    profile = get_profile(config.language)
+    rng = np.random.default_rng(0)
+
+    def run():
+        create_employees_batch(config, profile, config.employee_count, rng)
+
+    return run, config.employee_count
+
+
+def _setup_validate_employee(config):
+    profile = get_profile(config.language)
+    records = columns_to_records(
+        create_employees_batch(config, profile, config.employee_count, np.random.default_rng(0))
+    )
+
+    def run():
+        for emp in records:
+            validate_employee(emp, config.age_range, config.salary_range, profile,
+                              as_of_date=config.as_of_date)
+
+    return run, len(records)
+
+
+def _setup_audit_columns(config):
+    profile = get_profile(config.language)
+    columns = create_employees_batch(config, profile, config.employee_count,
+                                     np.random.default_rng(0))
+
+    def run():
+        audit_columns(columns, config.age_range, config.salary_range, profile,
+                      config.as_of_date)
+
+    return run, config.employee_count
+
+
+def _setup_assign_forced_performance(config):
+    profile = get_profile(config.language)
+    columns = create_employees_batch(config, profile, config.employee_count,
+                                     np.random.default_rng(0))
+
+    def run():
+        assign_forced_performance_batch(columns)
+
+    return run, config.employee_count
+
+
+def _setup_simulate_months(config):
+    profile, state = _base_state(config)
+
+    def run():
+        return sum(len(m["emp_id"]) for m in _simulate_months(config, profile, state))
+
+    return run, None
+
+
+def _setup_add_concurrent_positions(config):
+    config = replace(config, include_concurrent_positions=True)
+    profile, state = _base_state(config)
+    month = _draw_concurrent_postings(state, config, profile, np.random.default_rng(2))
+
+    def run():
+        # It pops the posting columns, so each run gets its own dict
+        _add_concurrent_positions(dict(month), config, profile)
+
+    return run, config.employee_count
+
+
+def _setup_columns_to_frame(config):
+    profile, state = _base_state(config)
+    columns = concat_columns(_simulate_months(config, profile, state))
+
+    def run():
+        columns_to_frame(columns)
+
+    return run, len(columns["emp_id"])
+
+
+def _setup_generate_dataset(config):
+    def run():
+        return len(generate_dataset(config))
+
+    return run, None
+
+
+def _export_setup(fmt):
+    def setup(config):
+        df = generate_dataset(config)
+
+        def run():
+            encode_export(df, fmt, config.language)
+
+        return run, len(df)
+
+    return setup
+
+
+# phase -> (setup, max employee_count, sweeps num_months)
+PHASES = {
+    "create_employee": (_setup_create_employee, SCALAR_MAX_EMPLOYEES, False),
+    "create_employees_batch": (_setup_create_employees_batch, None, False),
+    "validate_employee": (_setup_validate_employee, SCALAR_MAX_EMPLOYEES, False),
+    "audit_columns": (_setup_audit_columns, None, False),
+    "assign_forced_performance": (_setup_assign_forced_performance, None, False),
+    "simulate_months": (_setup_simulate_months, None, True),
+    "add_concurrent_positions": (_setup_add_concurrent_positions, None, False),
+    "columns_to_frame": (_setup_columns_to_frame, None, True),
+    "generate_dataset": (_setup_generate_dataset, None, True),
+    **{f"export_{fmt}": (_export_setup(fmt), None, True) for fmt in EXPORT_FORMATS},
+}
+
+
+def _proc_status_mb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    raise OSError(f"{field} missing from /proc/self/status")
+
+
+def _rss_mb():
+    """Return (current RSS, peak RSS since the last _reset_peak_rss()) in MB."""
+    try:
+        return _proc_status_mb("VmRSS"), _proc_status_mb("VmHWM")
+    except OSError:
+        # No procfs: only the process-lifetime peak is known (kilobytes on
+        # Linux, bytes on macOS), so growth is measured above earlier peaks
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak /= 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak, peak
+
+
+def _reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _measure(run):
+    """Run once; return (wall seconds, cpu seconds, rows or None, RSS growth in MB)."""
+    _reset_peak_rss()
+    rss_before, _ = _rss_mb()
+    wall, cpu = time.perf_counter(), time.process_time()
+    rows = run()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return wall, cpu, rows, max(_rss_mb()[1] - rss_before, 0.0)
+
+
+def run_case(phase, employee_count, num_months, repeat=DEFAULT_REPEAT,
+             min_seconds=MIN_TOTAL_SECONDS):
+    """Time one phase for one sweep point (in the current process)."""
+    config = _config(employee_count, num_months)
+    name_tables(get_profile(config.language).faker_locale)
+    setup = PHASES[phase][0]
+    run, rows = setup(config)
+    setup_rss, _ = _rss_mb()
+    runs = []
+    while len(runs) < repeat or (
+        sum(r[0] for r in runs) < min_seconds and len(runs) < MAX_REPEAT
+    ):
+        runs.append(_measure(run))
+    walls = sorted(r[0] for r in runs)
+    best = min(runs)
+    rows = best[2] if rows is None else rows
+    return {
+        "phase": phase,
+        "employee_count": employee_count,
+        "num_months": num_months,
+        "rows": rows,
+        "repeat": len(runs),
+        "seconds": best[0],
+        "median_seconds": walls[len(walls) // 2],
+        "cpu_seconds": best[1],
+        "rows_per_second": rows / best[0] if best[0] else float("inf"),
+        "rss_growth_mb": max(r[3] for r in runs),
+        "setup_rss_mb": setup_rss,
+    }
+
+
+def iter_cases(phases, counts, months):
+    """Yield (phase, employee_count, num_months) for every applicable sweep point."""
+    for phase in phases:
+        _, max_count, sweeps_months = PHASES[phase]
+        for count in counts:
+            if max_count is not None and count > max_count:
+                continue
+            for num_months in (months if sweeps_months else months[:1]):
+                if phase == "export_xlsx" and count * num_months > EXCEL_MAX_OUTPUT_ROWS:
+                    continue
+                yield phase, count, num_months
+
+
+def _case_key(result):
+    return f'{result["phase"]}/{result["employee_count"]}x{result["num_months"]}'
+
+
+def compare(results, baseline, tolerance):
+    """Return regression messages for results that fall outside tolerance."""
+    previous = {_case_key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = previous.get(_case_key(result))
+        if base is None or base["seconds"] < MIN_COMPARE_SECONDS:
+            continue
+        if result["rows_per_second"] < base["rows_per_second"] * (1 - tolerance):
+            regressions.append(
+                f'{_case_key(result)}: {result["rows_per_second"]:,.0f} rows/s '
+                f'(baseline {base["rows_per_second"]:,.0f})'
+            )
+        base_rss = max(base["rss_growth_mb"], MIN_COMPARE_RSS_MB)
+        if result["rss_growth_mb"] > base_rss * (1 + tolerance):
+            regressions.append(
+                f'{_case_key(result)}: RSS growth {result["rss_growth_mb"]:,.0f} MB '
+                f'(baseline {base["rss_growth_mb"]:,.0f} MB)'
+            )
+    return regressions
+
+
+def _run_isolated(case, repeat):
+    ctx = get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+        return executor.submit(run_case, *case, repeat).result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--phases", nargs="+", choices=sorted(PHASES), default=list(PHASES))
+    parser.add_argument("--counts", nargs="+", type=int, help="employee counts to sweep")
+    parser.add_argument("--months", nargs="+", type=int, help="month counts to sweep")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"minimum timed runs per case (default {DEFAULT_REPEAT})")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write the results to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown / RSS growth (default 0.25)")
+    args = parser.parse_args(argv)
+
+    sweep = PROFILES[args.profile]
+    counts = args.counts or sweep["counts"]
+    months = args.months or sweep["months"]
+
+    results = []
+    for case in iter_cases(args.phases, counts, months):
+        result = _run_isolated(case, args.repeat)
+        results.append(result)
+        print(f'{_case_key(result):<45} {result["rows_per_second"]:>14,.0f} rows/s'
+              f'  {result["seconds"]:>8.3f} s (median {result["median_seconds"]:.3f})'
+              f'  +{result["rss_growth_mb"]:>7,.0f} MB',
+              flush=True)
+
+    report = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        return 0
+    if not args.baseline.exists():
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""Vectorized employee factory: samples a whole population as NumPy arrays.
+
+create_employees_batch() produces the same attributes and distributions as
+employee.create_employee(), but draws every field for all employees in one
+pass instead of looping in Python. Every field is sampled within its valid
+range, so no employee has to be rejected and redrawn; audit_columns() is
+the vectorized equivalent of employee.validate_employee() for checking that.
+"""
+from datetime import date
+import numpy as np
+
+from hr_generator.config import (
+    PERFORMANCE_THRESHOLDS,
+    FORCED_PERFORMANCE_DISTRIBUTION,
+    MARRIAGE_RATE_BY_AGE,
+)
+from hr_generator.employee import birth_date_bounds
+from hr_generator.engine import format_dates
+from hr_generator.language import (
+    as_profile,
+    CLEARS_ORG_LV2,
+    CLEARS_ORG_LV3,
+    CLEARS_ORG_LV4,
+    EXECUTIVE,
+    DIRECTOR,
+    MANAGER,
+)
+from hr_generator.names import sample_names
+
+# Column order matches the dict keys produced by create_employee
+EMPLOYEE_FIELDS = (
+    "emp_id", "name", "birth_date", "gender",
+    "org_lv2", "org_lv1", "org_lv3", "org_lv4",
+    "position", "emp_type", "salary", "engagement_score", "performance",
+    "address", "job_category", "job_grade",
+    "hire_date", "resign_date", "contract_end_date",
+    "is_married", "resignation_reason",
+)
+
+# Numeric columns stored as float64 with NaN for missing values
+_INT_FIELDS = ("engagement_score",)
+_FLOAT_FIELDS = ("salary",)
+
+# Date columns stored as datetime64[D] with NaT for missing values
+DATE_FIELDS = ("birth_date", "hire_date", "resign_date", "contract_end_date")
+
+# resign_date of employees who have not resigned
+NO_RESIGN_DATE = np.datetime64("2999-12-31", "D")
+
+
+def _weighted_choice(rng, cum_weights, n):
+    """Draw n indices from cumulative weights (same semantics as random.choices)."""
+    return np.searchsorted(cum_weights, rng.random(n) * cum_weights[-1], side="right")
+
+
+def _weighted_choice_rows(rng, weight_matrix, rows):
+    """Draw one index per element of rows, using weight_matrix[row] as weights."""
+    cum = np.cumsum(weight_matrix, axis=1)[rows]
+    u = rng.random(len(rows)) * cum[:, -1]
+    idx = (cum <= u[:, None]).sum(axis=1)
+    return np.minimum(idx, cum.shape[1] - 1)
+
+
+def _choice_by_group(rng, group_codes, option_lists):
+    """Pick uniformly from option_lists[group] for each group code."""
+    lengths = np.array([len(opts) for opts in option_lists])
+    width = lengths.max()
+    table = np.empty((len(option_lists), width), dtype=object)
+    for g, opts in enumerate(option_lists):
+        table[g, :len(opts)] = opts
+    picks = (rng.random(len(group_codes)) * lengths[group_codes]).astype(int)
+    return table[group_codes, picks]
+
+
+def _bracket_index(values, brackets):
+    """Index of the first (lo, hi) bracket containing each value, -1 if none.
+
+    Callers append a default row to their lookup table so that -1 selects it.
+    """
+    idx = np.full(len(values), -1)
+    for i, (lo, hi) in reversed(list(enumerate(brackets))):
+        idx[(values >= lo) & (values <= hi)] = i
+    return idx
+
+
+def _ym_to_date(year, month):
+    """Build datetime64[D] first-of-month dates from year and month arrays."""
+    months = (np.asarray(year) - 1970) * 12 + (np.asarray(month) - 1)
+    return months.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def format_emp_ids(ids):
+    """Format numeric employee ids as "EMP000001"-style strings."""
+    return np.char.add("EMP", np.char.zfill(np.asarray(ids).astype(str), 6)).astype(object)
+
+
+def performance_levels(scores):
+    """Vectorized get_performance_level over an array of engagement scores."""
+    levels = list(PERFORMANCE_THRESHOLDS)
+    conditions = [scores >= PERFORMANCE_THRESHOLDS[lv] for lv in levels]
+    return np.select(conditions, levels, default="C").astype(object)
+
+
+def create_employees_batch(config, lang_data, n, rng, start_id=1):
+    """Create n employees at once as a dict of column arrays.
+
+    Args:
+        config: GeneratorConfig.
+        lang_data: LanguageProfile (or LANGUAGE_DATA entry).
+        n: Number of employees to create.
+        rng: numpy.random.Generator used for every draw.
+        start_id: Numeric id of the first employee.
+
+    Returns:
+        dict mapping each name in EMPLOYEE_FIELDS to a length-n array.
+        String fields are object arrays with None for missing values;
+        salary and engagement_score are float64 with NaN for missing values;
+        DATE_FIELDS are datetime64[D] with NaT for missing values.
+    """
+    profile = as_profile(lang_data)
+    today = config.as_of_date or date.today()
+    today64 = np.datetime64(today, "D")
+
+    columns = {}
+
+    columns["emp_id"] = format_emp_ids(np.arange(start_id, start_id + n))
+    columns["name"] = None  # filled in once gender is known
+
+    # Birth date uniformly within the age range
+    from_date, to_date = (
+        np.datetime64(d, "D") for d in birth_date_bounds(today, config.age_range)
+    )
+    span = int((to_date - from_date).astype(int))
+    birth = from_date + rng.integers(0, span + 1, n).astype("timedelta64[D]")
+    columns["birth_date"] = birth
+    age = (today64 - birth).astype(int) / 365.25
+
+    gender_codes = _weighted_choice(rng, profile.gender_cum_weights, n)
+    columns["gender"] = profile.gender_choices[gender_codes]
+
+    # First names follow gender; "Other" gets a 50/50 split like fake.name()
+    is_female = np.where(gender_codes == 2, rng.random(n) < 0.5, gender_codes == 1)
+    columns["name"] = sample_names(rng, profile.faker_locale, n, is_female=is_female)
+
+    # C1: Department distribution with weights
+    org_lv2_codes = _weighted_choice(rng, profile.org_lv2_cum_weights, n)
+    org_lv2 = profile.org_lv2_choices[org_lv2_codes]
+
+    org_lv1_options = profile.org_lv1_choices
+    org_lv1 = org_lv1_options[rng.integers(0, len(org_lv1_options), n)]
+
+    org_lv3 = _choice_by_group(rng, org_lv2_codes, profile.org_lv3_options)
+    org_lv4_options = profile.org_lv4_choices
+    org_lv4 = org_lv4_options[rng.integers(0, len(org_lv4_options), n)]
+
+    # A1: Age-adjusted position weights
+    position_codes = _weighted_choice_rows(
+        rng, profile.position_weight_matrix, _bracket_index(age, profile.age_brackets)
+    )
+
+    emp_type_codes = _weighted_choice(rng, profile.emp_type_cum_weights, n)
+    is_contract = emp_type_codes == 1
+    is_temporary = emp_type_codes == 2
+
+    # Contract and temporary employees are always Staff level
+    position_codes[is_contract | is_temporary] = 0
+
+    # C3: Age factor for salary calculation (older = higher within band)
+    age_min, age_max = config.age_range
+    if age_max > age_min:
+        age_factor = np.clip((age - age_min) / (age_max - age_min), 0.0, 1.0)
+    else:
+        age_factor = np.full(n, 0.5)
+
+    min_salary, max_salary = config.salary_range
+    salary_span = max_salary - min_salary
+    grade_min = min_salary + salary_span * profile.grade_band_low[position_codes]
+    grade_max = min_salary + salary_span * profile.grade_band_high[position_codes]
+    blended = age_factor * 0.6 + rng.random(n) * 0.4
+    salary = np.round(grade_min + (grade_max - grade_min) * blended, -3)
+    salary = np.clip(salary, min_salary, max_salary)
+    salary[is_contract] = np.maximum(np.round(salary[is_contract] * 0.8, -3), min_salary)
+    salary[is_temporary] = np.nan
+
+    # Adjust organisation based on final position
+    position = profile.position_choices[position_codes]
+    flags = profile.position_flags[position_codes]
+    is_executive = (flags & CLEARS_ORG_LV2) != 0
+    org_lv2_out = org_lv2.copy()
+    org_lv2_out[is_executive] = None
+    org_lv3[(flags & CLEARS_ORG_LV3) != 0] = None
+    org_lv4[(flags & CLEARS_ORG_LV4) != 0] = None
+
+    columns["org_lv2"] = org_lv2_out
+    columns["org_lv1"] = org_lv1
+    columns["org_lv3"] = org_lv3
+    columns["org_lv4"] = org_lv4
+    columns["position"] = position
+    columns["emp_type"] = profile.emp_type_choices[emp_type_codes]
+    columns["salary"] = salary
+
+    # Engagement and performance (C4 forced distribution applied later)
+    engagement = np.clip(np.round(rng.normal(70, 15, n)), 0, 100)
+    engagement[is_temporary] = np.nan
+    columns["engagement_score"] = engagement
+    performance = performance_levels(engagement)
+    performance[is_temporary] = None
+    columns["performance"] = performance
+
+    # Address
+    major = profile.major_cities
+    other = profile.other_cities
+    use_major = rng.random(n) < 0.8
+    address = np.where(
+        use_major,
+        major[rng.integers(0, len(major), n)],
+        other[rng.integers(0, len(other), n)],
+    )
+    address[is_temporary] = None
+    columns["address"] = address
+
+    # Job category
+    job_category = _choice_by_group(rng, org_lv2_codes, profile.job_category_options)
+    job_category[is_executive] = "Management"
+    job_category[is_temporary] = None
+    columns["job_category"] = job_category
+
+    job_grade = profile.position_grades[position_codes]
+    job_grade[is_temporary] = None
+    columns["job_grade"] = job_grade
+
+    # A2 + C2: Hire date with tenure-position correlation and seasonality
+    min_tenure = np.minimum(position_codes * 2, 12) * 365
+    max_tenure = np.minimum(10 + position_codes * 2, 20) * 365
+    tenure_days = rng.integers(min_tenure, max_tenure + 1)
+    hire_month = profile.hire_months[_weighted_choice(rng, profile.hire_month_cum_weights, n)]
+    base_year = (today64 - tenure_days.astype("timedelta64[D]")).astype("datetime64[Y]").astype(int) + 1970
+    hire = _ym_to_date(base_year, hire_month)
+    hire = np.where(hire > today64, _ym_to_date(base_year - 1, hire_month), hire)
+
+    # C5: 70% of young Japanese regular employees are April new grads
+    if config.language == "Japanese":
+        new_grad = (age < 26) & ~is_contract & ~is_temporary & (rng.random(n) < 0.70)
+        grad_year = today.year - rng.integers(0, 4, n)
+        grad_hire = _ym_to_date(grad_year, 4)
+        grad_hire = np.where(grad_hire > today64, _ym_to_date(grad_year - 1, 4), grad_hire)
+        hire = np.where(new_grad, grad_hire, hire)
+
+    columns["hire_date"] = hire
+    columns["resign_date"] = np.full(n, NO_RESIGN_DATE)
+
+    # A5: Contract end date 1-3 years after hire
+    contract_years = rng.integers(1, 4, n)
+    contract_end = (hire.astype("datetime64[M]") + contract_years * 12).astype("datetime64[D]")
+    contract_end[~is_contract] = np.datetime64("NaT")
+    columns["contract_end_date"] = contract_end
+
+    # A7: Marriage rate by age
+    marriage_brackets = list(MARRIAGE_RATE_BY_AGE)
+    rates = np.array([MARRIAGE_RATE_BY_AGE[b] for b in marriage_brackets] + [0.5])
+    married_rate = rates[_bracket_index(age, marriage_brackets)]
+    columns["is_married"] = rng.random(n) < married_rate
+
+    # A6: Resignation reason (None for active employees)
+    columns["resignation_reason"] = np.full(n, None, dtype=object)
+
+    return {field: columns[field] for field in EMPLOYEE_FIELDS}
+
+
+def audit_columns(columns, age_range, salary_range, lang_data, as_of_date=None):
+    """Vectorized employee.validate_employee over a columns dict.
+
+    Returns:
+        dict mapping the message of each failed check to a boolean mask of
+        the rows that fail it; empty when every row is valid.
+    """
+    profile = as_profile(lang_data)
+    today = np.datetime64(as_of_date or date.today(), "D")
+    birth = columns["birth_date"]
+    hire = columns["hire_date"]
+    resign = columns["resign_date"]
+    salary = columns["salary"]
+    engagement = columns["engagement_score"]
+
+    age = (today - birth).astype(int) / 365.25
+    codes = profile.position_codes(columns["position"])
+    flags = np.where(codes >= 0, profile.position_flags[np.maximum(codes, 0)], 0)
+    has_lv2 = np.not_equal(columns["org_lv2"], None)
+    has_lv3 = np.not_equal(columns["org_lv3"], None)
+    has_lv4 = np.not_equal(columns["org_lv4"], None)
+    is_executive = (flags & EXECUTIVE) != 0
+    is_director = ~is_executive & ((flags & DIRECTOR) != 0)
+    is_manager = ~is_executive & ~is_director & ((flags & MANAGER) != 0)
+
+    checks = {
+        "Hire date is in the future": hire > today,
+        "Resign date before hire date": (resign != NO_RESIGN_DATE) & (resign < hire),
+        "Age out of range": ~((age >= age_range[0]) & (age <= age_range[1] + 1)),
+        "Salary out of range": (salary < salary_range[0]) | (salary > salary_range[1]),
+        "Engagement score out of range": (engagement < 0) | (engagement > 100),
+        "Executive should not have lower org levels":
+            is_executive & (has_lv2 | has_lv3 | has_lv4),
+        "Director should not have org_lv3/lv4": is_director & (has_lv3 | has_lv4),
+        "Manager should not have org_lv4": is_manager & has_lv4,
+    }
+    return {message: mask for message, mask in checks.items() if mask.any()}
+
+
+def assign_forced_performance_batch(columns):
+    """Columnar version of employee.assign_forced_performance (C4).
+
+    Ranks employees with a non-null engagement_score (ties keep their
+    original order) and overwrites columns["performance"] in place.
+    """
+    scores = columns["engagement_score"]
+    scoreable = np.flatnonzero(~np.isnan(scores))
+    if not len(scoreable):
+        return
+    ranked = scoreable[np.argsort(-scores[scoreable], kind="stable")]
+    n = len(ranked)
+
+    s_end = round(n * FORCED_PERFORMANCE_DISTRIBUTION["S"])
+    a_end = s_end + round(n * FORCED_PERFORMANCE_DISTRIBUTION["A"])
+    b_end = a_end + round(n * FORCED_PERFORMANCE_DISTRIBUTION["B"])
+
+    levels = np.full(n, "C", dtype=object)
+    levels[:s_end] = "S"
+    levels[s_end:a_end] = "A"
+    levels[a_end:b_end] = "B"
+    columns["performance"][ranked] = levels
+
+
+def columns_to_records(columns):
+    """Convert a dict of column arrays into a list of employee dicts."""
+    values = []
+    for field, arr in columns.items():
+        if field in _INT_FIELDS:
+            values.append([None if v != v else int(v) for v in arr.tolist()])
+        elif field in _FLOAT_FIELDS:
+            values.append([None if v != v else v for v in arr.tolist()])
+        elif arr.dtype.kind == "M":
+            values.append(format_dates(arr).tolist())
+        else:
+            values.append(arr.tolist())
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def records_to_columns(records):
+    """Convert a list of employee dicts into a dict of column arrays."""
+    columns = {}
+    for field in records[0]:
+        values = [r.get(field) for r in records]
+        if field in _INT_FIELDS or field in _FLOAT_FIELDS:
+            columns[field] = np.array(
+                [np.nan if v is None else v for v in values], dtype=float
+            )
+        elif field in DATE_FIELDS:
+            columns[field] = np.array(values, dtype="datetime64[D]")
+        elif all(isinstance(v, (bool, np.bool_)) for v in values):
+            columns[field] = np.array(values, dtype=bool)
+        else:
+            arr = np.empty(len(values), dtype=object)
+            arr[:] = values
+            columns[field] = arr
+    return columns
@@ -0,0 +1,122 @@
+"""Content-addressed on-disk cache for generated datasets.
+
+Entries are keyed by a hash of the GeneratorConfig (including its as-of
+date, today when unset) and GENERATOR_VERSION, and stored as uncompressed
+Arrow IPC files so a hit can be memory-mapped instead of read and decoded.
+The directory is bounded by size with least-recently-used eviction (hits
+refresh the file mtime).
+Only seeded configs are cached; unseeded output is not reproducible.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from hr_generator.config import CACHE_DIR, CACHE_MAX_BYTES, GENERATOR_VERSION
+from hr_generator.generator import generate_dataset
+from hr_generator.models import resolve_as_of_date
+
+_SUFFIX = ".arrow"
+
+# Fields that do not affect the generated rows
+_IGNORED_FIELDS = ("workers", "audit")
+
+
+def default_cache_dir():
+    """Cache directory: $HRGEN_CACHE_DIR, else CACHE_DIR."""
+    return Path(os.environ.get("HRGEN_CACHE_DIR", CACHE_DIR)).expanduser()
+
+
+def cache_key(config):
+    """Stable hex digest identifying the dataset config generates."""
+    fields = asdict(resolve_as_of_date(config))
+    for name in _IGNORED_FIELDS:
+        fields.pop(name, None)
+    fields["as_of_date"] = fields["as_of_date"].isoformat()
+    payload = {"config": fields, "version": GENERATOR_VERSION}
+    encoded = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _read(path):
+    with pa.memory_map(str(path)) as source:
+        table = ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def _write(df, path, max_bytes):
+    """Store df at path; skip frames that would not fit in max_bytes anyway.
+
+    The file is written under a unique temporary name, so concurrent writers
+    of the same key (threads of one process included) never share it.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if table.nbytes > max_bytes:
+        return False
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return True
+
+
+def evict(cache_dir, max_bytes):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for path in Path(cache_dir).glob(f"*{_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_generate_dataset(config, cache_dir=None, max_bytes=CACHE_MAX_BYTES, progress=None):
+    """generate_dataset(config), served from the on-disk cache when possible.
+
+    Args:
+        config: GeneratorConfig. Configs without a random_seed bypass the cache.
+        cache_dir: Cache directory (default: default_cache_dir()).
+        max_bytes: Total size the cache directory is trimmed to after a write.
+        progress: Passed to generate_dataset on a cache miss.
+
+    Returns:
+        pd.DataFrame identical to generate_dataset(config).
+    """
+    if config.random_seed is None:
+        return generate_dataset(config, progress=progress)
+    config = resolve_as_of_date(config)
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    path = cache_dir / f"{cache_key(config)}{_SUFFIX}"
+    try:
+        df = _read(path)
+    except (FileNotFoundError, pa.ArrowInvalid):
+        pass
+    else:
+        os.utime(path)
+        return df
+
+    df = generate_dataset(config, progress=progress)
+    if df.empty:
+        return df
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if _write(df, path, max_bytes):
+        evict(cache_dir, max_bytes)
+    return df
@@ -4,6 +4,36 @@ MIN_EMPLOYEES = 100
 MAX_EMPLOYEES = 500
 DEFAULT_EMPLOYEES = 300
 
+# Large population mode (load testing): lifts MAX_EMPLOYEES up to 5M.
+# Peak memory is about LARGE_MODE_BYTES_PER_ROW per output row (employees x
+# months, plus concurrent rows), LARGE_MODE_BYTES_PER_EMPLOYEE per employee
+# (base state and timelines, including the shard being built) and
+# LARGE_MODE_BASE_BYTES for the interpreter and libraries. Measured peak
+# RSS stays within these; see README for budgets.
+LARGE_MAX_EMPLOYEES = 5_000_000
+LARGE_DEFAULT_EMPLOYEES = 100_000
+LARGE_MODE_BYTES_PER_ROW = 1000
+LARGE_MODE_BYTES_PER_EMPLOYEE = 300
+LARGE_MODE_BASE_BYTES = 150_000_000
+
+# Excel worksheets hold at most this many rows (including the header)
+EXCEL_MAX_ROWS = 1_048_576
+
+# Employees per shard for sharded generation. Shard boundaries (and so the
+# per-shard random streams) depend only on employee_count, never on workers.
+SHARD_SIZE = 50_000
+
+# Default maximum rows per chunk yielded by generator.iter_dataset
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Bump whenever a change alters the dataset generated for a fixed seed;
+# it is part of the dataset cache key, so stale cache entries stop matching.
+GENERATOR_VERSION = "5"
+
+# On-disk dataset cache (see hr_generator.cache); HRGEN_CACHE_DIR overrides the directory
+CACHE_DIR = "~/.cache/hrdata-generator"
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+
 PERFORMANCE_THRESHOLDS = {
     "S": 90,
     "A": 75,
@@ -204,7 +234,22 @@ TRANSLATIONS = {
         "salary_range": "Salary Range",
         "include_concurrent": "Include Concurrent Positions",
         "concurrent_tooltip": "Some employees will belong to multiple departments",
+        "large_mode": "Large Population Mode",
+        "large_mode_tooltip": (
+            "Generate 100k-5M employees for load testing. Uses all CPU cores; "
+            "see the README for memory and time budgets."
+        ),
+        "random_seed": "Random Seed",
+        "random_seed_tooltip": (
+            "Optional. The same seed and settings reproduce the same dataset, "
+            "which is then served from the on-disk cache."
+        ),
         "generate_button": "Generate HR Data",
+        "generating": "Generating data…",
+        "cancel_button": "Cancel",
+        "generation_cancelled": "Generation cancelled.",
+        "prepare_export": "Encode the file for download",
+        "preparing_export": "Preparing file…",
         "data_preview": "Data Preview",
         "charts_title": "Data Visualization",
         "chart_salary_box": "Salary Distribution by Position",
@@ -251,7 +296,22 @@ TRANSLATIONS = {
         "salary_range": "給与範囲（円）",
         "include_concurrent": "兼務レコードを含める",
         "concurrent_tooltip": "一部の従業員が複数の部門に所属するレコードを生成します",
+        "large_mode": "大規模モード",
+        "large_mode_tooltip": (
+            "負荷試験用に10万〜500万人の従業員を生成します。全CPUコアを使用します。"
+            "メモリと処理時間の目安はREADMEを参照してください。"
+        ),
+        "random_seed": "乱数シード",
+        "random_seed_tooltip": (
+            "任意。同じシードと設定で同じデータセットを再現し、"
+            "2回目以降はディスクキャッシュから読み込みます。"
+        ),
         "generate_button": "データを生成",
+        "generating": "データを生成中…",
+        "cancel_button": "キャンセル",
+        "generation_cancelled": "データ生成をキャンセルしました。",
+        "prepare_export": "ダウンロード用にファイルを作成します",
+        "preparing_export": "ファイルを作成中…",
         "data_preview": "データプレビュー",
         "charts_title": "データ可視化",
         "chart_salary_box": "役職別給与分布",
@@ -1,6 +1,10 @@
-"""Pure functions for creating and validating individual employees."""
-import random
-from datetime import datetime, timedelta
+"""Pure functions for creating and validating individual employees.
+
+Every random draw comes from a numpy Generator passed in by the caller, so
+independent generations never share random state.
+"""
+import math
+from datetime import date, datetime, time, timedelta
 
 import numpy as np
 from dateutil.relativedelta import relativedelta
@@ -9,23 +13,19 @@ from hr_generator.config import (
     PERFORMANCE_THRESHOLDS,
     SALARY_ADJUSTMENT_RATES,
     JOB_GRADE_SALARY_BANDS,
-    AGE_POSITION_WEIGHT_MODIFIERS,
     MARRIAGE_RATE_BY_AGE,
-    DEPARTMENT_WEIGHTS,
-    HIRE_MONTH_WEIGHTS,
     FORCED_PERFORMANCE_DISTRIBUTION,
 )
-
-
-def get_department_key(org_lv2):
-    """Map org_lv2 name to department key for org_lv3 lookup."""
-    if "Engineering" in org_lv2 or "エンジニアリング" in org_lv2:
-        return "Engineering"
-    elif "HR" in org_lv2 or "人事" in org_lv2:
-        return "HR"
-    elif "Finance" in org_lv2 or "財務" in org_lv2:
-        return "Finance"
-    return "Sales"
+from hr_generator.language import (
+    as_profile,
+    CLEARS_ORG_LV2,
+    CLEARS_ORG_LV3,
+    CLEARS_ORG_LV4,
+    EXECUTIVE,
+    DIRECTOR,
+    MANAGER,
+)
+from hr_generator.names import sample_names
 
 
 def get_performance_level(engagement_score):
@@ -74,19 +74,14 @@ def get_age_adjusted_position_weights(age, lang_data):
     Younger employees get higher weight for junior roles;
     older employees get higher weight for senior roles.
     """
-    base_weights = lang_data["positions"]["weights"]
-    modifiers = [1.0] * len(base_weights)
-
-    for (age_min, age_max), mods in AGE_POSITION_WEIGHT_MODIFIERS.items():
+    profile = as_profile(lang_data)
+    # The last matrix row holds the unmodified weights for ages outside every bracket
+    row = len(profile.age_brackets)
+    for i, (age_min, age_max) in enumerate(profile.age_brackets):
         if age_min <= age <= age_max:
-            modifiers = mods
+            row = i
             break
-
-    adjusted = [
-        max(base_weights[i] * modifiers[i], 0.01)
-        for i in range(len(base_weights))
-    ]
-    return adjusted
+    return profile.position_weight_matrix[row].tolist()
 
 
 def adjust_organization_by_position(employee, position_data, position):
@@ -103,7 +98,28 @@ def adjust_organization_by_position(employee, position_data, position):
     return employee
 
 
-def calculate_salary(base_range, job_grade, age_factor=0.5):
+def _clear_org_levels(employee, flags):
+    """Nullify org levels for a position with the given hierarchy bits."""
+    if flags & CLEARS_ORG_LV2:
+        employee["org_lv2"] = None
+    if flags & CLEARS_ORG_LV3:
+        employee["org_lv3"] = None
+    if flags & CLEARS_ORG_LV4:
+        employee["org_lv4"] = None
+    return employee
+
+
+def _pick(rng, cum_weights):
+    """Draw one index from cumulative weights."""
+    return int(np.searchsorted(cum_weights, rng.random() * cum_weights[-1], side="right"))
+
+
+def _choice(rng, options):
+    """Pick one element of options uniformly."""
+    return options[rng.integers(len(options))]
+
+
+def calculate_salary(base_range, job_grade, age_factor=0.5, rng=None):
     """Calculate salary within the job grade's band with random variation.
 
     Args:
@@ -111,6 +127,7 @@ def calculate_salary(base_range, job_grade, age_factor=0.5):
         job_grade: Grade string like "Lv1" ~ "Lv6".
         age_factor: 0.0 (youngest) to 1.0 (oldest) within the grade band.
                     Used to bias older employees toward the upper end (C3).
+        rng: numpy Generator (default: a fresh unseeded one).
 
     Returns:
         Salary rounded to nearest 1000.
@@ -123,11 +140,13 @@ def calculate_salary(base_range, job_grade, age_factor=0.5):
     grade_max = min_salary + salary_span * band_high
 
     # Blend age_factor with randomness: 60% age influence, 40% random
-    random_component = random.random()
+    if rng is None:
+        rng = np.random.default_rng()
+    random_component = rng.random()
     blended = age_factor * 0.6 + random_component * 0.4
 
     salary = grade_min + (grade_max - grade_min) * blended
-    return round(salary, -3)
+    return min(max(round(salary, -3), min_salary), max_salary)
 
 
 def adjust_salary_by_performance(current_salary, performance):
@@ -136,47 +155,44 @@ def adjust_salary_by_performance(current_salary, performance):
     return round(current_salary * adjustment_rate, -3)
 
 
-def _build_position_hierarchy(lang_data):
-    """Build position -> numeric level mapping."""
-    return {
-        lang_data["positions"]["choices"][i]: 1 + (i * 0.5)
-        for i in range(len(lang_data["positions"]["choices"]))
-    }
-
+def birth_date_bounds(as_of_date, age_range):
+    """Earliest and latest birth dates whose age on as_of_date is within age_range.
 
-def _build_position_to_grade(lang_data):
-    """Build position -> grade string mapping."""
-    return {
-        lang_data["positions"]["choices"][i]: f"Lv{i+1}"
-        for i in range(len(lang_data["positions"]["choices"]))
-    }
+    Age is measured as days / 365.25, as in validate_employee, so the latest
+    date is moved back when a calendar year count falls short of age_range[0].
+    """
+    age_min, age_max = age_range
+    latest = min(
+        as_of_date - relativedelta(years=age_min),
+        as_of_date - timedelta(days=math.ceil(age_min * 365.25)),
+    )
+    earliest = min(as_of_date - relativedelta(years=age_max), latest)
+    return earliest, latest
 
 
-def _generate_hire_date(config, lang_data, current_date, position_index):
+def _generate_hire_date(config, lang_data, current_date, position_index, rng):
     """Generate a hire date with seasonality (C2) and tenure-position correlation (A2).
 
     Args:
         config: GeneratorConfig.
-        lang_data: Language-specific data.
+        lang_data: LanguageProfile (or LANGUAGE_DATA entry).
         current_date: Current datetime.
         position_index: 0 (Staff) to 5 (C-level).
+        rng: numpy Generator.
 
     Returns:
         hire_date as datetime.
     """
-    language = config.language
+    profile = as_profile(lang_data)
 
     # A2: Senior positions get longer tenure
     # Staff: 0-10 years, Team Lead: 2-12, Manager: 5-15, GM: 8-18, VP: 10-20, C-level: 12-20
     min_tenure_years = min(position_index * 2, 12)
     max_tenure_years = min(10 + position_index * 2, 20)
-    tenure_days = random.randint(min_tenure_years * 365, max_tenure_years * 365)
+    tenure_days = int(rng.integers(min_tenure_years * 365, max_tenure_years * 365 + 1))
 
     # C2: Hire month seasonality
-    month_weights = HIRE_MONTH_WEIGHTS.get(language, HIRE_MONTH_WEIGHTS["English"])
-    months = list(month_weights.keys())
-    weights = list(month_weights.values())
-    hire_month = random.choices(months, weights=weights, k=1)[0]
+    hire_month = int(profile.hire_months[_pick(rng, profile.hire_month_cum_weights)])
 
     # Build the hire date
     base_date = current_date - timedelta(days=tenure_days)
@@ -193,10 +209,10 @@ def _generate_hire_date(config, lang_data, current_date, position_index):
     return hire_date
 
 
-def _generate_new_grad_hire_date(current_date):
+def _generate_new_grad_hire_date(current_date, rng):
     """Generate April 1st hire date for Japanese new graduates (C5)."""
     # Pick a random year in the past 0-3 years
-    years_ago = random.randint(0, 3)
+    years_ago = int(rng.integers(0, 4))
     year = current_date.year - years_ago
     hire_date = datetime(year, 4, 1)
     if hire_date > current_date:
@@ -204,79 +220,55 @@ def _generate_new_grad_hire_date(current_date):
     return hire_date
 
 
-def create_employee(config, lang_data, fake, employee_id):
-    """Create a single employee dict. Always returns a valid employee."""
-    position_to_grade = _build_position_to_grade(lang_data)
-    current_date = datetime.now()
+def create_employee(config, lang_data, rng, employee_id):
+    """Create a single employee dict. Always returns a valid employee.
+
+    Args:
+        config: GeneratorConfig.
+        lang_data: LanguageProfile (or LANGUAGE_DATA entry).
+        rng: numpy Generator used for every draw.
+        employee_id: Numeric employee id.
+    """
+    profile = as_profile(lang_data)
+    current_date = datetime.combine(config.as_of_date or date.today(), time())
 
     employee = {}
 
     # Basic information
     employee["emp_id"] = f"EMP{str(employee_id).zfill(6)}"
-    employee["name"] = fake.name()
+    employee["name"] = None  # filled in once gender is known
 
     # Birth date from age range
-    from_date = current_date - relativedelta(years=config.age_range[1])
-    to_date = current_date - relativedelta(years=config.age_range[0])
-    birth_date = fake.date_between_dates(date_start=from_date, date_end=to_date)
+    from_date, to_date = birth_date_bounds(current_date.date(), config.age_range)
+    birth_date = from_date + timedelta(days=int(rng.integers((to_date - from_date).days + 1)))
     employee["birth_date"] = birth_date.strftime("%Y-%m-%d")
 
     # Calculate age for age-dependent logic
     age = (current_date.date() - birth_date).days / 365.25
 
-    employee["gender"] = random.choices(
-        lang_data["genders"]["choices"],
-        weights=lang_data["genders"]["weights"],
-        k=1,
-    )[0]
+    gender_code = _pick(rng, profile.gender_cum_weights)
+    employee["gender"] = profile.gender_choices[gender_code]
+    # First names follow gender; "Other" gets a 50/50 split
+    is_female = rng.random() < 0.5 if gender_code == 2 else gender_code == 1
+    employee["name"] = sample_names(rng, profile.faker_locale, 1, is_female=[is_female])[0]
 
     # C1: Department distribution with weights
-    language = config.language
-    dept_weights = DEPARTMENT_WEIGHTS.get(language, {})
-    org_lv2_options = lang_data["organizations"]["org_lv2"]
-    if dept_weights:
-        dept_weight_list = [dept_weights.get(d, 10) for d in org_lv2_options]
-        employee["org_lv2"] = random.choices(
-            org_lv2_options, weights=dept_weight_list, k=1
-        )[0]
-    else:
-        employee["org_lv2"] = random.choice(org_lv2_options)
-
-    employee["org_lv1"] = random.choice(lang_data["organizations"]["org_lv1"])
-    dept_key = get_department_key(employee["org_lv2"])
-
-    org_lv3_options = lang_data["organizations"]["org_lv3"].get(dept_key, [])
-    if not org_lv3_options:
-        dept_key = "Sales"
-        org_lv3_options = lang_data["organizations"]["org_lv3"].get(dept_key, ["Default Department"])
-
-    employee["org_lv3"] = random.choice(org_lv3_options)
-    employee["org_lv4"] = random.choice(lang_data["organizations"]["org_lv4"])
+    org_lv2_code = _pick(rng, profile.org_lv2_cum_weights)
+    employee["org_lv2"] = profile.org_lv2_choices[org_lv2_code]
+    employee["org_lv1"] = _choice(rng, profile.org_lv1_choices)
+    employee["org_lv3"] = _choice(rng, profile.org_lv3_options[org_lv2_code])
+    employee["org_lv4"] = _choice(rng, profile.org_lv4_choices)
 
     # A1: Age-adjusted position weights
-    age_adjusted_weights = get_age_adjusted_position_weights(age, lang_data)
-    employee["position"] = random.choices(
-        lang_data["positions"]["choices"],
-        weights=age_adjusted_weights,
-        k=1,
-    )[0]
-
-    employee["emp_type"] = random.choices(
-        lang_data["emp_types"]["choices"],
-        weights=lang_data["emp_types"]["weights"],
-        k=1,
-    )[0]
+    age_adjusted_weights = get_age_adjusted_position_weights(age, profile)
+    position_index = _pick(rng, np.cumsum(age_adjusted_weights))
 
-    # Employment-type specific logic
-    emp_type_choices = lang_data["emp_types"]["choices"]
-    is_contract = employee["emp_type"] == emp_type_choices[1]
-    is_temporary = employee["emp_type"] == emp_type_choices[2]
+    emp_type_code = _pick(rng, profile.emp_type_cum_weights)
+    employee["emp_type"] = profile.emp_type_choices[emp_type_code]
 
-    # Determine job_grade early (needed for salary calculation)
-    if is_temporary:
-        job_grade = None
-    else:
-        job_grade = position_to_grade.get(employee["position"], "Lv1")
+    # Employment-type specific logic
+    is_contract = emp_type_code == 1
+    is_temporary = emp_type_code == 2
 
     # C3: Age factor for salary calculation (older = higher within band)
     age_min, age_max = config.age_range
@@ -285,29 +277,31 @@ def create_employee(config, lang_data, fake, employee_id):
     else:
         age_factor = 0.5
 
+    # Contract and temporary employees are always Staff level
+    if is_contract or is_temporary:
+        position_index = 0
+    employee["position"] = profile.position_choices[position_index]
+    job_grade = None if is_temporary else profile.position_grades[position_index]
+
     if is_contract:
-        employee["position"] = lang_data["positions"]["choices"][0]  # Staff level
-        job_grade = "Lv1"  # Contract employees are always Lv1
-        base_salary = calculate_salary(config.salary_range, job_grade, age_factor)
+        base_salary = calculate_salary(config.salary_range, job_grade, age_factor, rng)
         contract_salary = round(base_salary * 0.8, -3)
         employee["salary"] = max(contract_salary, config.salary_range[0])
     elif is_temporary:
-        employee["position"] = lang_data["positions"]["choices"][0]  # Staff level
         employee["salary"] = None
     else:
-        employee["salary"] = calculate_salary(config.salary_range, job_grade, age_factor)
+        employee["salary"] = calculate_salary(config.salary_range, job_grade, age_factor, rng)
 
     # Adjust organisation based on final position (after any contract/temp override)
-    employee = adjust_organization_by_position(
-        employee, lang_data["positions"], employee["position"]
-    )
+    position_flags = int(profile.position_flags[position_index])
+    employee = _clear_org_levels(employee, position_flags)
 
     # Engagement and performance (initial; C4 forced distribution applied later in generator)
     if is_temporary:
         employee["engagement_score"] = None
         employee["performance"] = None
     else:
-        engagement_score = np.random.normal(70, 15)
+        engagement_score = rng.normal(70, 15)
         engagement_score = max(0, min(100, round(engagement_score)))
         employee["engagement_score"] = engagement_score
         # Temporary performance; will be overwritten by assign_forced_performance
@@ -317,42 +311,38 @@ def create_employee(config, lang_data, fake, employee_id):
     if is_temporary:
         employee["address"] = None
     else:
-        employee["address"] = random.choice(
-            lang_data["cities"]["major"] if random.random() < 0.8 else lang_data["cities"]["other"]
+        employee["address"] = _choice(
+            rng, profile.major_cities if rng.random() < 0.8 else profile.other_cities
         )
 
     # Job category
     if is_temporary:
         employee["job_category"] = None
-    elif employee["position"] in lang_data["positions"]["hierarchy"].get("executive", []):
+    elif position_flags & EXECUTIVE:
         employee["job_category"] = "Management"
     else:
-        employee["job_category"] = random.choice(
-            lang_data["job_categories"].get(dept_key, ["Default"])
-        )
+        employee["job_category"] = _choice(rng, profile.job_category_options[org_lv2_code])
 
     # Job grade (already computed above for salary calculation)
     employee["job_grade"] = job_grade
 
     # A2 + C2 + C5: Hire date with tenure-position correlation and seasonality
-    position_index = lang_data["positions"]["choices"].index(employee["position"])
-
     # C5: Japanese new graduates (young employees, age < 26)
-    is_japanese = language == "Japanese"
+    is_japanese = config.language == "Japanese"
     is_new_grad_candidate = is_japanese and age < 26 and not is_contract and not is_temporary
 
-    if is_new_grad_candidate and random.random() < 0.70:
+    if is_new_grad_candidate and rng.random() < 0.70:
         # 70% of young Japanese employees are new grads
-        hire_date = _generate_new_grad_hire_date(current_date)
+        hire_date = _generate_new_grad_hire_date(current_date, rng)
     else:
-        hire_date = _generate_hire_date(config, lang_data, current_date, position_index)
+        hire_date = _generate_hire_date(config, profile, current_date, position_index, rng)
 
     employee["hire_date"] = hire_date.strftime("%Y-%m-%d")
     employee["resign_date"] = "2999-12-31"
 
     # A5: Contract end date
     if is_contract:
-        contract_years = random.randint(1, 3)
+        contract_years = int(rng.integers(1, 4))
         contract_end = hire_date + relativedelta(years=contract_years)
         employee["contract_end_date"] = contract_end.strftime("%Y-%m-%d")
     else:
@@ -364,7 +354,7 @@ def create_employee(config, lang_data, fake, employee_id):
         if age_min_bracket <= age <= age_max_bracket:
             married_rate = rate
             break
-    employee["is_married"] = random.random() < married_rate
+    employee["is_married"] = bool(rng.random() < married_rate)
 
     # A6: Resignation reason (None for active employees)
     employee["resignation_reason"] = None
@@ -372,19 +362,22 @@ def create_employee(config, lang_data, fake, employee_id):
     return employee
 
 
-def validate_employee(employee, age_range, salary_range, lang_data):
-    """Validate employee data consistency. Returns (is_valid, message)."""
+def validate_employee(employee, age_range, salary_range, lang_data, as_of_date=None):
+    """Validate employee data consistency as of as_of_date (default: today).
+
+    Returns (is_valid, message).
+    """
     # Date consistency
-    hire_date = datetime.strptime(employee["hire_date"], "%Y-%m-%d")
-    birth_date = datetime.strptime(employee["birth_date"], "%Y-%m-%d")
-    current_date = datetime.now()
+    hire_date = date.fromisoformat(employee["hire_date"])
+    birth_date = date.fromisoformat(employee["birth_date"])
+    current_date = as_of_date or date.today()
 
     if hire_date > current_date:
         return False, "Hire date is in the future"
 
     resign_date_str = employee["resign_date"]
     if resign_date_str != "2999-12-31":
-        resign_date = datetime.strptime(resign_date_str, "%Y-%m-%d")
+        resign_date = date.fromisoformat(resign_date_str)
         if resign_date < hire_date:
             return False, "Resign date before hire date"
 
@@ -404,15 +397,16 @@ def validate_employee(employee, age_range, salary_range, lang_data):
             return False, f"Engagement score out of range: {employee['engagement_score']}"
 
     # Org hierarchy consistency
-    position = employee["position"]
-    positions = lang_data["positions"]
-    if position in positions["hierarchy"]["executive"]:
+    profile = as_profile(lang_data)
+    position_index = profile.position_index.get(employee["position"])
+    flags = 0 if position_index is None else int(profile.position_flags[position_index])
+    if flags & EXECUTIVE:
         if any([employee["org_lv2"], employee["org_lv3"], employee["org_lv4"]]):
             return False, "Executive should not have lower org levels"
-    elif position in positions["hierarchy"]["director"]:
+    elif flags & DIRECTOR:
         if any([employee["org_lv3"], employee["org_lv4"]]):
             return False, "Director should not have org_lv3/lv4"
-    elif position in positions["hierarchy"]["manager"]:
+    elif flags & MANAGER:
         if employee["org_lv4"]:
             return False, "Manager should not have org_lv4"
 
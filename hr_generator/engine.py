@@ -0,0 +1,77 @@
+"""Columnar dataset engine: employee state and monthly snapshots as NumPy arrays.
+
+A "columns" object is a plain dict mapping field name -> 1-D array, with all
+arrays the same length. Monthly snapshots are built by masking the state
+arrays and are only turned into a DataFrame once, at the very end.
+Dates are datetime64[D] arrays (NaT for missing) and are formatted as
+"YYYY-MM-DD" strings only there.
+"""
+import numpy as np
+import pandas as pd
+
+
+def num_rows(columns):
+    """Number of rows in a columns dict."""
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def take_columns(columns, index):
+    """Return a new columns dict holding the rows at index (int array or mask)."""
+    return {field: arr[index] for field, arr in columns.items()}
+
+
+def concat_columns(chunks):
+    """Concatenate a list of columns dicts sharing the same fields."""
+    chunks = [c for c in chunks if num_rows(c)]
+    if not chunks:
+        return {}
+    return {
+        field: np.concatenate([c[field] for c in chunks])
+        for field in chunks[0]
+    }
+
+
+def format_dates(values):
+    """Format datetime64[D] values as "YYYY-MM-DD" strings (NaT -> None).
+
+    Each distinct date is formatted once and the cells share its str object,
+    so a column costs one pointer per row rather than one string per row.
+    """
+    uniq, inverse = np.unique(values, return_inverse=True)
+    strings = np.datetime_as_string(uniq, unit="D").astype(object)
+    strings[np.isnat(uniq)] = None
+    return strings[inverse.reshape(-1)]
+
+
+def format_columns(columns):
+    """Return columns with every datetime64 array formatted as strings."""
+    return {
+        field: format_dates(arr) if arr.dtype.kind == "M" else arr
+        for field, arr in columns.items()
+    }
+
+
+def columns_to_frame(columns):
+    """Build the output DataFrame from a columns dict."""
+    if not num_rows(columns):
+        return pd.DataFrame()
+    return pd.DataFrame(format_columns(columns), copy=False)
+
+
+def columns_to_record_batch(columns):
+    """Build a pyarrow.RecordBatch from a columns dict.
+
+    Types come from the array dtypes (float64, bool, date32 for dates, or
+    string for object arrays), so every batch of a dataset shares one schema
+    even when a string column is entirely null in a given batch. NaN and NaT
+    become null.
+    """
+    import pyarrow as pa
+
+    arrays = []
+    for arr in columns.values():
+        if arr.dtype == object:
+            arrays.append(pa.array(arr, type=pa.string()))
+        else:
+            arrays.append(pa.array(arr, from_pandas=True))
+    return pa.RecordBatch.from_arrays(arrays, names=list(columns))
@@ -0,0 +1,343 @@
+"""Columnar file writers (Parquet, Arrow IPC) fed straight from the generator.
+
+Repetitive string columns are dictionary-encoded against a fixed
+per-language vocabulary, so every batch of a file shares one dictionary,
+and date columns are stored as date32 instead of "YYYY-MM-DD" strings.
+
+encode_export() builds the app's download files from an in-memory dataset
+on demand, encoding text formats a chunk of rows at a time.
+"""
+import io
+import os
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from openpyxl import Workbook
+
+from hr_generator.config import DEFAULT_CHUNK_ROWS, EXCEL_MAX_ROWS
+from hr_generator.generator import iter_dataset
+from hr_generator.language import get_profile
+
+DATE_FIELDS = ("birth_date", "hire_date", "resign_date", "contract_end_date", "base_date")
+FLOAT_FIELDS = ("salary", "engagement_score")
+BOOL_FIELDS = ("is_married", "is_primary_position")
+
+# Download formats: key -> (file name, MIME type)
+EXPORT_FORMATS = {
+    "csv": ("hr_data.csv", "text/csv"),
+    "xlsx": (
+        "hr_data.xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+    "json": ("hr_data.json", "application/json"),
+    "parquet": ("hr_data.parquet", "application/vnd.apache.parquet"),
+    "ndjson": ("hr_data.ndjson.gz", "application/gzip"),
+}
+
+NDJSON_COMPRESSIONS = (None, "gzip", "zstd")
+
+
+def dataset_schema(language, field_names):
+    """Arrow schema for a dataset with the given column order."""
+    vocab = get_profile(language).categories
+    fields = []
+    for name in field_names:
+        if name in vocab:
+            fields.append(pa.field(name, pa.dictionary(pa.int16(), pa.string())))
+        elif name in DATE_FIELDS:
+            fields.append(pa.field(name, pa.date32()))
+        elif name in FLOAT_FIELDS:
+            fields.append(pa.field(name, pa.float64()))
+        elif name in BOOL_FIELDS:
+            fields.append(pa.field(name, pa.bool_()))
+        else:
+            fields.append(pa.field(name, pa.string()))
+    return pa.schema(fields)
+
+
+def encode_batch(batch, language):
+    """Convert a plain RecordBatch (see iter_dataset) to the export schema."""
+    vocab = get_profile(language).categories
+    schema = dataset_schema(language, batch.schema.names)
+    arrays = []
+    for name in batch.schema.names:
+        column = batch.column(name)
+        if name in vocab:
+            dictionary = pa.array(vocab[name], type=pa.string())
+            indices = pc.index_in(column, value_set=dictionary)
+            if indices.null_count != column.null_count:
+                raise ValueError(f"{name} has values outside the {language} vocabulary")
+            column = pa.DictionaryArray.from_arrays(indices.cast(pa.int16()), dictionary)
+        else:
+            column = column.cast(schema.field(name).type)
+        arrays.append(column)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def frame_to_table(df, language):
+    """Convert a generated DataFrame to an Arrow table in the export schema."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Columns that are entirely null come through as the null type
+    table = table.cast(pa.schema([
+        pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+        for f in table.schema
+    ]))
+    return pa.Table.from_batches(
+        [encode_batch(batch, language) for batch in table.to_batches()],
+        schema=dataset_schema(language, table.schema.names),
+    )
+
+
+def _iter_encoded_months(config, chunk_rows):
+    """Yield (base_date, [encoded batches]) for each generated month."""
+    current_date = None
+    pending = []
+    for batch in iter_dataset(config, chunk_rows=chunk_rows, as_arrow=True):
+        base_date = batch.column("base_date")[0].as_py()
+        if pending and base_date != current_date:
+            yield current_date, pending
+            pending = []
+        current_date = base_date
+        pending.append(encode_batch(batch, config.language))
+    if pending:
+        yield current_date, pending
+
+
+def write_parquet(config, sink, chunk_rows=DEFAULT_CHUNK_ROWS, row_group_per_month=True,
+                  compression="zstd"):
+    """Generate a dataset and write it to a Parquet file.
+
+    Args:
+        config: GeneratorConfig.
+        sink: Path or writable binary file object.
+        chunk_rows: Rows per generated chunk (see iter_dataset).
+        row_group_per_month: Write each month as exactly one row group.
+            Otherwise each generated chunk becomes its own row group.
+        compression: Parquet compression codec.
+
+    Returns:
+        Number of rows written.
+    """
+    rows = 0
+    writer = None
+    try:
+        for _, batches in _iter_encoded_months(config, chunk_rows):
+            if writer is None:
+                writer = pq.ParquetWriter(sink, batches[0].schema, compression=compression)
+            if row_group_per_month:
+                table = pa.Table.from_batches(batches)
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            else:
+                for batch in batches:
+                    writer.write_batch(batch)
+            rows += sum(batch.num_rows for batch in batches)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_arrow_ipc(config, sink, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Generate a dataset and write it to an Arrow IPC (Feather v2) file.
+
+    Returns:
+        Number of rows written.
+    """
+    rows = 0
+    writer = None
+    try:
+        for _, batches in _iter_encoded_months(config, chunk_rows):
+            for batch in batches:
+                if writer is None:
+                    writer = ipc.new_file(sink, batch.schema)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _write_excel_sheets(chunks, sink):
+    """Write DataFrame chunks to a write-only workbook, one sheet per base_date.
+
+    Rows are streamed to the sheets' temporary files as they arrive. A month
+    longer than an Excel sheet continues on "<base_date> (2)", and so on.
+
+    Returns:
+        Number of data rows written.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = None
+    sheet_date = None
+    sheet_rows = part = rows = 0
+    for chunk in chunks:
+        values = chunk.astype(object).where(chunk.notna(), None)
+        dates = chunk["base_date"] if "base_date" in chunk else [None] * len(chunk)
+        for base_date, row in zip(dates, values.itertuples(index=False, name=None)):
+            if sheet is None or base_date != sheet_date or sheet_rows == EXCEL_MAX_ROWS:
+                part = part + 1 if sheet is not None and base_date == sheet_date else 1
+                title = str(base_date or "Sheet") + (f" ({part})" if part > 1 else "")
+                sheet = workbook.create_sheet(title)
+                sheet.append(list(chunk.columns))
+                sheet_date, sheet_rows = base_date, 1
+            sheet.append(row)
+            sheet_rows += 1
+            rows += 1
+    if sheet is None:
+        workbook.create_sheet("Sheet")
+    workbook.save(sink)
+    return rows
+
+
+def write_excel(config, sink, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Generate a dataset and write it to an .xlsx file, one sheet per month.
+
+    Uses openpyxl's write-only mode, so memory stays bounded by chunk_rows
+    rather than growing with the workbook.
+
+    Returns:
+        Number of rows written.
+    """
+    return _write_excel_sheets(iter_dataset(config, chunk_rows=chunk_rows), sink)
+
+
+class _KeepOpen:
+    """File proxy whose close() only flushes, so a caller's sink stays open."""
+
+    def __init__(self, handle):
+        self._handle = handle
+        self.closed = False
+
+    def write(self, data):
+        return self._handle.write(data)
+
+    def flush(self):
+        self._handle.flush()
+
+    def close(self):
+        self.flush()
+        self.closed = True
+
+
+def _ndjson_lines(df):
+    """Encode a DataFrame as NDJSON bytes, one record per line."""
+    if df.empty:
+        return b""
+    text = df.to_json(orient="records", lines=True, force_ascii=False)
+    return (text if text.endswith("\n") else text + "\n").encode()
+
+
+def _write_ndjson_chunks(chunks, sink, compression):
+    """Write DataFrame chunks to sink as (optionally compressed) NDJSON."""
+    if compression not in NDJSON_COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression!r}")
+    if isinstance(sink, (str, os.PathLike)):
+        stream = pa.OSFile(os.fspath(sink), "wb")
+    else:
+        stream = pa.PythonFile(_KeepOpen(sink), mode="w")
+    if compression is not None:
+        stream = pa.CompressedOutputStream(stream, compression)
+    rows = 0
+    with stream:
+        for chunk in chunks:
+            stream.write(_ndjson_lines(chunk))
+            rows += len(chunk)
+    return rows
+
+
+def write_ndjson(config, sink, chunk_rows=DEFAULT_CHUNK_ROWS, compression=None):
+    """Generate a dataset and write it as NDJSON (JSON Lines).
+
+    Each chunk from iter_dataset is encoded and written before the next is
+    generated, so memory stays bounded by chunk_rows for any dataset size.
+
+    Args:
+        config: GeneratorConfig.
+        sink: Path or writable binary file object (for a socket, use
+            sock.makefile("wb")). File objects are left open.
+        chunk_rows: Rows per generated chunk (see iter_dataset).
+        compression: None, "gzip" or "zstd".
+
+    Returns:
+        Number of rows written.
+    """
+    return _write_ndjson_chunks(iter_dataset(config, chunk_rows=chunk_rows), sink, compression)
+
+
+def frame_to_parquet_bytes(df, language):
+    """Encode an in-memory dataset as Parquet bytes, one row group per month."""
+    table = frame_to_table(df, language)
+    sink = pa.BufferOutputStream()
+    with pq.ParquetWriter(sink, table.schema, compression="zstd") as writer:
+        if "base_date" in table.column_names and table.num_rows:
+            dates = table.column("base_date")
+            for base_date in pc.unique(dates).to_pylist():
+                month = table.filter(pc.equal(dates, base_date))
+                writer.write_table(month, row_group_size=max(month.num_rows, 1))
+        else:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _chunk_frame(df, chunk_rows):
+    """Yield consecutive row slices of df with at most chunk_rows rows."""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_csv_chunks(df, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield df.to_csv(index=False) as UTF-8 bytes, chunk_rows rows at a time."""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=start == 0).encode()
+
+
+def iter_json_chunks(df, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield df.to_json(orient="records") as UTF-8 bytes, chunk_rows rows at a time."""
+    yield b"["
+    for start in range(0, len(df), chunk_rows):
+        records = df.iloc[start:start + chunk_rows].to_json(orient="records")[1:-1]
+        yield (b"," if start else b"") + records.encode()
+    yield b"]"
+
+
+def frame_to_excel_bytes(df, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Encode an in-memory dataset as an .xlsx workbook, one sheet per month.
+
+    Rows are converted chunk_rows at a time, so only one chunk's object copy
+    exists at once.
+    """
+    buf = io.BytesIO()
+    _write_excel_sheets(_chunk_frame(df, chunk_rows), buf)
+    return buf.getvalue()
+
+
+def encode_export(df, fmt, language, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Encode a generated DataFrame as one of EXPORT_FORMATS.
+
+    Returns:
+        bytes with the file contents.
+    """
+    if fmt == "csv":
+        chunks = iter_csv_chunks(df, chunk_rows)
+    elif fmt == "json":
+        chunks = iter_json_chunks(df, chunk_rows)
+    elif fmt == "xlsx":
+        return frame_to_excel_bytes(df, chunk_rows)
+    elif fmt == "parquet":
+        return frame_to_parquet_bytes(df, language)
+    elif fmt == "ndjson":
+        buf = io.BytesIO()
+        _write_ndjson_chunks(_chunk_frame(df, chunk_rows), buf, "gzip")
+        return buf.getvalue()
+    else:
+        raise ValueError(f"Unknown export format: {fmt!r}")
+
+    buf = io.BytesIO()
+    for chunk in chunks:
+        buf.write(chunk)
+    return buf.getvalue()
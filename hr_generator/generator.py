@@ -1,153 +1,583 @@
 """Top-level orchestrator for HR dataset generation."""
-import random
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from multiprocessing import get_all_start_methods, get_context
 
 import numpy as np
 import pandas as pd
-from faker import Faker
-from dateutil.relativedelta import relativedelta
-
-from hr_generator.config import LANGUAGE_DATA
-from hr_generator.employee import (
-    create_employee,
-    validate_employee,
-    get_department_key,
-    assign_forced_performance,
-    adjust_organization_by_position,
+
+from hr_generator.batch import (
+    _choice_by_group,
+    create_employees_batch,
+    assign_forced_performance_batch,
+    audit_columns,
+)
+from hr_generator.config import SHARD_SIZE, DEFAULT_CHUNK_ROWS
+from hr_generator.language import (
+    get_profile,
+    CLEARS_ORG_LV2,
+    CLEARS_ORG_LV3,
+    CLEARS_ORG_LV4,
+)
+from hr_generator.engine import (
+    num_rows,
+    take_columns,
+    concat_columns,
+    columns_to_frame,
+    columns_to_record_batch,
+)
+from hr_generator.instrument import no_phase, phase_timer
+from hr_generator.names import name_tables
+from hr_generator.models import GeneratorConfig, resolve_as_of_date
+from hr_generator.timeline import (
+    POSTINGS_STREAM,
+    build_timeline,
+    shard_seed,
+    snapshot,
+    versions,
 )
-from hr_generator.monthly import generate_monthly_snapshot
-from hr_generator.models import GeneratorConfig
 
 
-def _seed_all(seed):
-    """Seed all random generators for reproducibility."""
-    random.seed(seed)
-    np.random.seed(seed)
+# Columns carrying each employee's concurrent posting through the timeline
+_POSTING_FIELDS = {
+    "org_lv2": "concurrent_org_lv2",
+    "org_lv3": "concurrent_org_lv3",
+    "org_lv4": "concurrent_org_lv4",
+}
 
 
-def _add_concurrent_positions(rows, config, lang_data):
-    """Add concurrent position records for some employees.
+def _draw_concurrent_postings(state, config, profile, rng):
+    """Decide once per employee whether they hold a concurrent position, and where.
 
-    Returns new list of rows with concurrent positions added.
-    Each employee's primary position is marked as is_primary_position=True.
-    Concurrent positions are marked as is_primary_position=False.
+    Non-temporary, non-executive employees get a posting with probability
+    config.concurrent_position_rate, in an org_lv2 other than their own.
+
+    Returns:
+        state with the postings added as concurrent_org_lv* columns (None
+        for employees without one).
+    """
+    n = num_rows(state)
+    org_lv2_options = profile.org_lv2_choices
+    org_lv2_codes = profile.category_codes("org_lv2", state["org_lv2"])
+
+    eligible = (state["emp_type"] != profile.emp_type_choices[2]) & (org_lv2_codes >= 0)
+    holders = np.flatnonzero(eligible & (rng.random(n) < config.concurrent_position_rate))
+    if len(org_lv2_options) < 2:
+        holders = holders[:0]
+
+    # A uniform non-zero shift picks any org_lv2 but the employee's own
+    shift = rng.integers(1, len(org_lv2_options), len(holders)) if len(holders) else holders
+    codes = (org_lv2_codes[holders] + shift) % len(org_lv2_options)
+    posting = {
+        "org_lv2": org_lv2_options[codes],
+        "org_lv3": _choice_by_group(rng, codes, profile.org_lv3_options),
+        "org_lv4": profile.org_lv4_choices[
+            rng.integers(len(profile.org_lv4_choices), size=len(holders))
+        ],
+    }
+
+    state = dict(state)
+    for field, column in _POSTING_FIELDS.items():
+        state[column] = np.full(n, None, dtype=object)
+        state[column][holders] = posting[field]
+    return state
+
+
+def _add_concurrent_positions(columns, config, profile):
+    """Add concurrent position records for the employees holding a posting.
+
+    Takes and returns a columns dict (a month, or SCD versions) carrying the
+    concurrent_org_lv* columns from _draw_concurrent_postings, which are
+    removed. Each employee's primary row is marked is_primary_position=True
+    and their concurrent row, a copy with the posting's organization, is
+    appended directly after it with is_primary_position=False.
     """
+    n = num_rows(columns)
     if not config.include_concurrent_positions:
-        # Add is_primary_position=True to all rows
-        for row in rows:
-            row["is_primary_position"] = True
-        return rows
-
-    result = []
-    org_lv2_options = lang_data["organizations"]["org_lv2"]
-
-    for row in rows:
-        # Mark original as primary
-        row["is_primary_position"] = True
-        result.append(row)
-
-        # Only non-temporary, non-executive employees can have concurrent positions.
-        # Executives have org_lv2=None so any concurrent row would be identical to the primary.
-        emp_type_choices = lang_data["emp_types"]["choices"]
-        if row["emp_type"] == emp_type_choices[2]:  # Temporary
-            continue
-        if row["org_lv2"] is None:  # Executive (VP / C-level)
-            continue
-
-        # Randomly assign concurrent position
-        if random.random() < config.concurrent_position_rate:
-            # Create concurrent position row
-            concurrent = row.copy()
-            concurrent["is_primary_position"] = False
-
-            # Assign different org_lv2
-            current_org_lv2 = row["org_lv2"]
-            other_orgs = [o for o in org_lv2_options if o != current_org_lv2]
-            if other_orgs:
-                concurrent["org_lv2"] = random.choice(other_orgs)
-                # Update org_lv3 based on new org_lv2
-                dept_key = get_department_key(concurrent["org_lv2"])
-                org_lv3_options = lang_data["organizations"]["org_lv3"].get(dept_key, [])
-                if org_lv3_options:
-                    concurrent["org_lv3"] = random.choice(org_lv3_options)
-                concurrent["org_lv4"] = random.choice(lang_data["organizations"]["org_lv4"])
-
-                # Re-apply position hierarchy rules to concurrent position
-                concurrent = adjust_organization_by_position(
-                    concurrent, lang_data["positions"], concurrent["position"]
-                )
-
-                result.append(concurrent)
-
+        columns["is_primary_position"] = np.ones(n, dtype=bool)
+        return columns
+
+    postings = {field: columns.pop(column) for field, column in _POSTING_FIELDS.items()}
+    # Executives have org_lv2=None, so a concurrent row would be identical to the primary
+    has_posting = np.not_equal(postings["org_lv2"], None) & np.not_equal(columns["org_lv2"], None)
+
+    copies = 1 + has_posting
+    result = take_columns(columns, np.repeat(np.arange(n), copies))
+    concurrent = (np.cumsum(copies) - 1)[has_posting]
+
+    # Re-apply position hierarchy rules to the concurrent organization
+    flags = profile.position_flags[profile.position_codes(columns["position"][has_posting])]
+    for field, clears in (
+        ("org_lv2", CLEARS_ORG_LV2), ("org_lv3", CLEARS_ORG_LV3), ("org_lv4", CLEARS_ORG_LV4),
+    ):
+        values = postings[field][has_posting]
+        values[(flags & clears) != 0] = None
+        result[field][concurrent] = values
+
+    is_primary = np.ones(num_rows(result), dtype=bool)
+    is_primary[concurrent] = False
+    result["is_primary_position"] = is_primary
     return result
 
 
-def generate_base_employees(config, lang_data, fake):
-    """Generate exactly config.employee_count valid base employees.
+def generate_base_employees(config, profile, rng, count=None, start_id=1):
+    """Generate exactly count valid base employees (default: config.employee_count).
+
+    create_employees_batch samples every field within its valid range, so a
+    single batch is always enough and no employee is redrawn. With
+    config.audit set, the batch is checked with audit_columns and a
+    ValueError is raised if any row fails. Employees are numbered
+    consecutively from start_id.
 
-    Unlike the old code, this has no attempt cap. It retries until the
-    exact count is met. Since create_employee produces valid data for
-    any reasonable config, this converges quickly.
+    Returns:
+        dict of column arrays, one row per employee.
     """
-    employees = []
-    employee_id = 1
+    if count is None:
+        count = config.employee_count
+    columns = create_employees_batch(config, profile, count, rng, start_id=start_id)
 
-    while len(employees) < config.employee_count:
-        emp = create_employee(config, lang_data, fake, employee_id)
-        is_valid, _ = validate_employee(
-            emp,
+    if config.audit:
+        failures = audit_columns(
+            columns,
             age_range=config.age_range,
             salary_range=config.salary_range,
-            lang_data=lang_data,
+            lang_data=profile,
+            as_of_date=config.as_of_date,
         )
-        if is_valid:
-            employees.append(emp)
-        employee_id += 1
+        if failures:
+            summary = ", ".join(f"{msg} ({int(mask.sum())})" for msg, mask in failures.items())
+            raise ValueError(f"Generated employees failed validation: {summary}")
+    return columns
 
-    return employees
 
+class GenerationCancelled(Exception):
+    """Raised by a progress callback to stop generate_dataset early."""
 
-def generate_dataset(config):
-    """Generate the full HR dataset as a DataFrame.
 
-    Args:
-        config: GeneratorConfig with all parameters.
+class _InProcessExecutor:
+    """Executor stand-in that runs shard tasks sequentially in this process."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _progress_counter(progress, total):
+    """Return step(n=1), which advances a counter and reports it to progress."""
+    done = 0
+
+    def step(n=1):
+        nonlocal done
+        done += n
+        if progress is not None:
+            progress(done, total)
+
+    return step
+
+
+def _shard_bounds(employee_count):
+    """Split the employee index space into [start, stop) shards of SHARD_SIZE."""
+    return [
+        (start, min(start + SHARD_SIZE, employee_count))
+        for start in range(0, employee_count, SHARD_SIZE)
+    ]
+
+
+def _create_shard(config, start, stop, seed_seq):
+    """Create the base employees of one shard (runs in a worker process)."""
+    profile = get_profile(config.language)
+    rng = np.random.default_rng(seed_seq)
+    return generate_base_employees(
+        config, profile, rng, count=stop - start, start_id=start + 1
+    )
+
+
+def _shard_timeline(config, state, base_dates, seed_seq, phase=no_phase):
+    """Build one shard's employee timeline (runs in a worker process).
+
+    With concurrent positions enabled, the postings are drawn first, from
+    the shard's POSTINGS_STREAM, and carried in the timeline's state.
+    """
+    profile = get_profile(config.language)
+    with phase("build_timeline") as stats:
+        if config.include_concurrent_positions:
+            rng = np.random.default_rng(shard_seed(seed_seq, POSTINGS_STREAM))
+            state = _draw_concurrent_postings(state, config, profile, rng)
+        timeline = build_timeline(state, base_dates, config, profile, seed_seq)
+        stats["rows"] = num_rows(state)
+    return timeline
+
+
+def _shard_month(config, profile, timeline, month_offset, phase=no_phase):
+    """Return one month of a shard's rows, with concurrent positions, as columns."""
+    with phase("snapshot", month=month_offset) as stats:
+        month = snapshot(timeline, month_offset)
+        stats["rows"] = num_rows(month)
+    # Add concurrent positions if enabled
+    with phase("concurrent_positions", month=month_offset) as stats:
+        month = _add_concurrent_positions(month, config, profile)
+        stats["rows"] = num_rows(month)
+    return month
+
+
+# Shard workers for _run_shards take (config, state, base_dates, seed_seq,
+# on_step=None, phase=no_phase) and return a list of columns dicts. on_step
+# is called after each progress step and phase wraps the worker's steps
+# (both in-process runs only).
+
+def _simulate_shard(config, state, base_dates, seed_seq, on_step=None, phase=no_phase,
+                    month_offsets=None):
+    """Build one shard's timeline and produce the given months (runs in a worker process).
+
+    The timeline only covers the months up to the last one requested
+    (default: every month). One progress step per month.
 
     Returns:
-        pd.DataFrame with one row per employee per month.
+        list with one columns dict per month in month_offsets.
     """
-    if config.random_seed is not None:
-        _seed_all(config.random_seed)
+    if month_offsets is None:
+        month_offsets = range(len(base_dates))
+    profile = get_profile(config.language)
+    timeline = _shard_timeline(
+        config, state, base_dates[:max(month_offsets) + 1], seed_seq, phase
+    )
+    months = []
+    for month_offset in month_offsets:
+        months.append(_shard_month(config, profile, timeline, month_offset, phase))
+        if on_step is not None:
+            on_step()
+    return months
+
+
+def _shard_versions(config, state, base_dates, seed_seq, on_step=None, phase=no_phase):
+    """Build one shard's timeline and return its SCD Type 2 rows (runs in a worker process).
+
+    One progress step for the shard.
+
+    Returns:
+        list holding the shard's versions as one columns dict.
+    """
+    profile = get_profile(config.language)
+    timeline = _shard_timeline(config, state, base_dates, seed_seq, phase)
+    with phase("versions") as stats:
+        columns = _add_concurrent_positions(versions(timeline), config, profile)
+        stats["rows"] = num_rows(columns)
+    if on_step is not None:
+        on_step()
+    return [columns]
+
+
+def _call_shard(worker_fn, config, state, base_dates, seed_seq, on_step, phase):
+    return worker_fn(config, state, base_dates, seed_seq, on_step=on_step, phase=phase)
+
+
+def _base_dates(config):
+    """Return the first-of-month snapshot date of every simulated month (datetime64[D])."""
+    current_month = np.datetime64(config.as_of_date, "M")
+    offsets = np.arange(config.num_months - 1, -1, -1)
+    return (current_month - offsets).astype("datetime64[D]")
+
+
+def _month_offsets(config, months):
+    """Resolve a months selection (slice of month offsets, or None for all) to a range."""
+    if months is None:
+        return range(config.num_months)
+    if not isinstance(months, slice):
+        raise TypeError(f"months must be a slice, got {type(months).__name__}")
+    return range(config.num_months)[months]
+
+
+def _executor(config, shard_count):
+    """Process pool for config.workers > 1, otherwise an in-process executor.
+
+    Workers are started by a fork server (spawned where there is none), not
+    forked: the caller may be one thread of a multi-threaded server, whose
+    locks and address space a forked child would inherit.
+    """
+    if config.workers > 1 and shard_count > 1:
+        method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+        return ProcessPoolExecutor(
+            max_workers=min(config.workers, shard_count), mp_context=get_context(method)
+        )
+    return _InProcessExecutor()
+
+
+def _stop_executor(executor):
+    """Cancel pending shard tasks and terminate the workers running the others."""
+    # ProcessPoolExecutor has no public way to stop running tasks before 3.14
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def _build_shards(config, shards, executor, step=None, phase=no_phase):
+    """Create every shard's base employees and apply the global C4 ranking.
 
-    lang_data = LANGUAGE_DATA[config.language]
-    locale = lang_data.get("faker_locale", "en_US")
-    fake = Faker(locale)
-    if config.random_seed is not None:
-        fake.seed_instance(config.random_seed)
+    step, if given, is called once per created shard.
+
+    Returns:
+        (list of per-shard state columns, list of per-shard simulation seeds)
+    """
+    shard_seeds = np.random.SeedSequence(config.random_seed).spawn(len(shards))
+    create_seeds, simulate_seeds = zip(*(seq.spawn(2) for seq in shard_seeds))
 
     # Generate base employees (exact count guaranteed)
-    base_employees = generate_base_employees(config, lang_data, fake)
+    starts, stops = zip(*shards)
+    with phase("create_base_employees", shards=len(shards)) as stats:
+        created = []
+        for columns in executor.map(_create_shard, repeat(config), starts, stops, create_seeds):
+            created.append(columns)
+            if step is not None:
+                step()
+        state = concat_columns(created)
+        stats["rows"] = num_rows(state)
 
     # C4: Apply forced performance distribution across all employees
-    assign_forced_performance(base_employees)
+    with phase("forced_performance") as stats:
+        assign_forced_performance_batch(state)
+        stats["rows"] = num_rows(state)
 
-    # Generate monthly snapshots
-    current_date = datetime.now()
-    all_rows = []
+    shard_states = [take_columns(state, slice(start, stop)) for start, stop in shards]
+    return shard_states, list(simulate_seeds)
 
-    for month_offset in range(config.num_months):
-        base_date = (
-            current_date - relativedelta(months=(config.num_months - 1 - month_offset))
-        ).replace(day=1).strftime("%Y-%m-%d")
 
-        rows = generate_monthly_snapshot(
-            base_employees, month_offset, base_date, config, lang_data
+def _run_shards(config, worker_fn, progress=None, observer=None, steps_per_shard=1):
+    """Create every shard's base employees and run worker_fn on each shard.
+
+    Shared by generate_dataset and generate_scd2: loads the language
+    profile, builds the shards (see _build_shards) and maps worker_fn over
+    them in the executor, reporting progress and observer phases. Progress
+    has one step per shard for its base employees plus steps_per_shard per
+    shard for the worker. Any exception, such as GenerationCancelled from
+    the progress callback, cancels the pending shard tasks, terminates the
+    worker processes running the others and is raised at once.
+
+    Returns:
+        list with worker_fn's result (a list of columns dicts) per shard.
+    """
+    shards = _shard_bounds(config.employee_count)
+    base_dates = _base_dates(config)
+    step = _progress_counter(progress, len(shards) * (1 + steps_per_shard))
+    phase = phase_timer(observer)
+
+    with phase("load_profile", language=config.language):
+        name_tables(get_profile(config.language).faker_locale)
+
+    # Not a with block: its exit would wait for the running shards on cancel
+    executor = _executor(config, len(shards))
+    try:
+        shard_states, simulate_seeds = _build_shards(
+            config, shards, executor, step, phase
         )
-        # Add concurrent positions if enabled
-        rows = _add_concurrent_positions(rows, config, lang_data)
-        all_rows.extend(rows)
 
-    if not all_rows:
+        in_process = isinstance(executor, _InProcessExecutor)
+        # In-process runs report each step and phase of the workers instead
+        shards_phase = no_phase if in_process else phase
+        with shards_phase("simulate_shards") as stats:
+            shard_results = []
+            for shard_result in executor.map(
+                _call_shard, repeat(worker_fn), repeat(config), shard_states,
+                repeat(base_dates), simulate_seeds,
+                repeat(step if in_process else None),
+                repeat(phase if in_process else no_phase),
+            ):
+                shard_results.append(shard_result)
+                if not in_process:
+                    step(steps_per_shard)
+            stats["rows"] = sum(
+                num_rows(columns) for shard_result in shard_results for columns in shard_result
+            )
+    except BaseException:
+        _stop_executor(executor)
+        raise
+    executor.shutdown()
+    return shard_results
+
+
+def generate_dataset(config, progress=None, observer=None, months=None):
+    """Generate the HR dataset as a DataFrame.
+
+    Employee state is kept as one NumPy array per field. Each shard's
+    lifecycle events (resignations, year-end promotions and reviews,
+    engagement drift) are recorded once in a timeline (see
+    hr_generator.timeline), each month's snapshot is queried from it, and
+    the DataFrame is built once from the concatenated month columns.
+
+    The employee id space is split into fixed-size shards, each with its own
+    random stream spawned from config.random_seed. With config.workers > 1
+    the shards run in a process pool; because shard boundaries and seeds do
+    not depend on the worker count, the output for a given seed is identical
+    for any number of workers. No global random state is read or modified,
+    so concurrent calls in one process do not interfere.
+
+    Ages, tenures and snapshot months are measured from config.as_of_date
+    (today when unset), fixed once for the whole run.
+
+    months selects a range of month offsets (0 is the oldest month,
+    num_months - 1 the as-of month), e.g. slice(-1, None) for the latest
+    month only. The rows are exactly those of the selected months in a full
+    run with the same config (the index restarts at 0). Timelines are only
+    built up to the last selected month, and only the selected months are
+    snapshotted and turned into rows, so the bulk of the work scales with
+    the output rather than with num_months.
+
+    Progress is counted in shard steps: one per shard for creating its base
+    employees and one per shard and month produced, so the total is
+    shards * (1 + number of months). In a process pool a shard's months are
+    reported together when the shard finishes. The callback may raise
+    GenerationCancelled (or any exception) to stop the run; it returns at
+    once and pending shard tasks are cancelled (see _run_shards).
+
+    observer, if given, receives start/end events for every phase of the
+    run (see hr_generator.instrument); in-process runs report each shard's
+    timeline and each month's snapshot and concurrent positions separately.
+
+    Args:
+        config: GeneratorConfig with all parameters.
+        progress: Optional callable(done, total) called after each step.
+        observer: Optional callable(event dict), e.g. an instrument.PhaseRecorder.
+        months: Optional slice of month offsets to generate (default: all).
+
+    Returns:
+        pd.DataFrame with one row per employee per month.
+    """
+    config = resolve_as_of_date(config)
+    month_offsets = _month_offsets(config, months)
+    if not config.employee_count or not month_offsets:
+        return pd.DataFrame()
+
+    shard_months = _run_shards(
+        config, partial(_simulate_shard, month_offsets=month_offsets),
+        progress, observer, steps_per_shard=len(month_offsets),
+    )
+
+    with phase_timer(observer)("build_frame") as stats:
+        month_columns = [
+            concat_columns([shard_result[i] for shard_result in shard_months])
+            for i in range(len(month_offsets))
+        ]
+        df = columns_to_frame(concat_columns(month_columns))
+        stats["rows"] = len(df)
+    return df
+
+
+def generate_scd2(config, progress=None, observer=None):
+    """Generate the HR dataset as slowly changing dimension (Type 2) rows.
+
+    Instead of a full copy of every employee per month, each employee gets
+    a new row only when their position, organization, salary, engagement,
+    performance or resignation changes, with valid_from / valid_to dates
+    and an is_current flag (see timeline.versions). The states are the same
+    as in generate_dataset(config) for the same seed: every month's
+    snapshot row of an employee equals the version valid in that month.
+    Concurrent positions are emitted as rows directly after the primary
+    version they belong to, as in the snapshots.
+
+    Progress is counted as one step per shard for creating its base
+    employees and one per shard for its versions.
+
+    Args:
+        config: GeneratorConfig with all parameters.
+        progress: Optional callable(done, total) called after each step.
+        observer: Optional callable(event dict), e.g. an instrument.PhaseRecorder.
+
+    Returns:
+        pd.DataFrame with one row per employee version, ordered by emp_id
+        and valid_from.
+    """
+    config = resolve_as_of_date(config)
+    if not config.employee_count or not config.num_months:
         return pd.DataFrame()
 
-    return pd.DataFrame(all_rows)
+    shard_versions = _run_shards(config, _shard_versions, progress, observer)
+
+    with phase_timer(observer)("build_frame") as stats:
+        df = columns_to_frame(concat_columns(
+            [columns for shard_result in shard_versions for columns in shard_result]
+        ))
+        stats["rows"] = len(df)
+    return df
+
+
+def snapshot_at(config, snapshot_date, progress=None):
+    """Generate the single month containing snapshot_date.
+
+    Same rows as that month in generate_dataset(config). Only the months up
+    to snapshot_date are simulated, and only it is produced.
+
+    Args:
+        snapshot_date: date, datetime or "YYYY-MM-DD" within the simulated months.
+
+    Raises:
+        ValueError: snapshot_date is outside the config's months.
+    """
+    config = resolve_as_of_date(config)
+    month = np.datetime64(snapshot_date, "D").astype("datetime64[M]")
+    month_offset = config.num_months - 1 - int(
+        np.datetime64(config.as_of_date, "M") - month
+    )
+    if not 0 <= month_offset < config.num_months:
+        raise ValueError(
+            f"{snapshot_date} is outside the {config.num_months} months "
+            f"ending {config.as_of_date}"
+        )
+    return generate_dataset(
+        config, progress=progress, months=slice(month_offset, month_offset + 1)
+    )
+
+
+def iter_dataset(config, chunk_rows=DEFAULT_CHUNK_ROWS, as_arrow=False):
+    """Generate the HR dataset incrementally, month by month.
+
+    Yields the same rows, in the same order, as generate_dataset, split into
+    chunks of at most chunk_rows rows. Every shard's timeline is built up
+    front; months are then queried one shard at a time, so besides the
+    timelines only one shard-month and one chunk are held in memory. Base
+    employees and timelines are built in a process pool when
+    config.workers > 1.
+    DataFrame chunk dtypes are inferred per chunk (a string column that is
+    entirely null in a chunk comes back as object); Arrow batches always
+    share one schema, with dates as date32 rather than strings.
+
+    Args:
+        config: GeneratorConfig with all parameters.
+        chunk_rows: Maximum number of rows per chunk.
+        as_arrow: Yield pyarrow.RecordBatch objects instead of DataFrames.
+
+    Yields:
+        pd.DataFrame (or pyarrow.RecordBatch) chunks.
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+    config = resolve_as_of_date(config)
+
+    shards = _shard_bounds(config.employee_count)
+    if not shards:
+        return
+
+    base_dates = _base_dates(config)
+    with _executor(config, len(shards)) as executor:
+        shard_states, simulate_seeds = _build_shards(config, shards, executor)
+        timelines = list(executor.map(
+            _shard_timeline, repeat(config), shard_states, repeat(base_dates), simulate_seeds
+        ))
+    del shard_states
+
+    profile = get_profile(config.language)
+    to_chunk = columns_to_record_batch if as_arrow else columns_to_frame
+
+    for month_offset in range(config.num_months):
+        for timeline in timelines:
+            month = _shard_month(config, profile, timeline, month_offset)
+            for start in range(0, num_rows(month), chunk_rows):
+                yield to_chunk(take_columns(month, slice(start, start + chunk_rows)))
@@ -0,0 +1,111 @@
+"""Per-phase timing and memory instrumentation for generate_dataset.
+
+generate_dataset(config, observer=...) wraps each phase of a run (loading
+the language profile, creating base employees, forced performance ranking,
+building each shard's timeline, every month's snapshot, concurrent-position
+expansion, building the DataFrame) and passes the observer a dict per event:
+
+    {"event": "start", "phase": "snapshot", "month": 3}
+    {"event": "end", "phase": "snapshot", "month": 3, "rows": 998,
+     "wall_seconds": 0.004, "cpu_seconds": 0.004, "peak_memory_bytes": 81234}
+
+peak_memory_bytes is only present while tracemalloc is tracing, and CPU
+time is that of the calling process (shards running in a process pool are
+reported as a single "simulate_shards" phase). Without an observer the
+phases are no-ops.
+
+PhaseRecorder is a ready-made observer that collects the events into a
+JSON-serializable report.
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+@contextmanager
+def no_phase(name, **info):
+    """Phase context that records nothing (the default when not observed)."""
+    yield {}
+
+
+def phase_timer(observer):
+    """Return phase(name, **info), a context manager factory reporting to observer.
+
+    The context yields a dict the caller can fill with end-of-phase values
+    such as rows. With observer=None the phases do nothing.
+    """
+    if observer is None:
+        return no_phase
+
+    @contextmanager
+    def phase(name, **info):
+        observer({"event": "start", "phase": name, **info})
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        stats = {}
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield stats
+        end = {
+            "event": "end",
+            "phase": name,
+            **info,
+            **stats,
+            "wall_seconds": time.perf_counter() - wall,
+            "cpu_seconds": time.process_time() - cpu,
+        }
+        if tracing:
+            end["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        observer(end)
+
+    return phase
+
+
+class PhaseRecorder:
+    """Observer that records end-of-phase events and summarizes them.
+
+    Used as a context manager with trace_memory=True, it also runs
+    tracemalloc for the duration so events carry peak_memory_bytes.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.events = []
+        self._started_tracing = False
+
+    def __call__(self, event):
+        if event["event"] == "end":
+            self.events.append(event)
+
+    def __enter__(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    def report(self):
+        """Return {"phases": [end events], "totals": {phase: aggregate}}.
+
+        Totals sum count, rows, wall and CPU seconds per phase and keep the
+        largest peak_memory_bytes.
+        """
+        totals = {}
+        for event in self.events:
+            total = totals.setdefault(event["phase"], {
+                "count": 0, "rows": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+            })
+            total["count"] += 1
+            total["rows"] += event.get("rows", 0)
+            total["wall_seconds"] += event["wall_seconds"]
+            total["cpu_seconds"] += event["cpu_seconds"]
+            if "peak_memory_bytes" in event:
+                total["peak_memory_bytes"] = max(
+                    total.get("peak_memory_bytes", 0), event["peak_memory_bytes"]
+                )
+        return {"phases": list(self.events), "totals": totals}
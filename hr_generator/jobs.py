@@ -0,0 +1,62 @@
+"""Background dataset generation for the Streamlit app.
+
+A GenerationJob runs cached_generate_dataset in a daemon thread so the UI
+can keep rerunning while it works. The job records progress from the
+generator's callback, and cancel() makes that callback raise
+GenerationCancelled at the next step.
+"""
+import threading
+
+from hr_generator.cache import cached_generate_dataset
+from hr_generator.generator import GenerationCancelled
+
+
+class GenerationJob:
+    """One background generation run for a GeneratorConfig."""
+
+    def __init__(self, config, generate=cached_generate_dataset):
+        self.config = config
+        self.done = 0
+        self.total = 0
+        self.result = None  # pd.DataFrame once finished
+        self.error = None  # exception raised by the generator, if any
+        self._generate = generate
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the generator to stop at its next progress step."""
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def fraction(self):
+        """Completed share of the work, 0.0 to 1.0."""
+        return self.done / self.total if self.total else 0.0
+
+    def _progress(self, done, total):
+        if self._cancel.is_set():
+            raise GenerationCancelled()
+        self.done, self.total = done, total
+
+    def _run(self):
+        try:
+            self.result = self._generate(self.config, progress=self._progress)
+        except GenerationCancelled:
+            pass
+        except Exception as e:
+            self.error = e
@@ -0,0 +1,227 @@
+"""Precompiled per-language lookup tables.
+
+LANGUAGE_DATA is convenient to edit but slow to query: position indices are
+list scans, hierarchy checks are `in list`, department keys come from
+substring matching and weight lists are rebuilt on every call. A
+LanguageProfile compiles all of that once per language into integer codes,
+cumulative-weight arrays and lookup tables.
+"""
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from hr_generator.config import (
+    LANGUAGE_DATA,
+    PERFORMANCE_THRESHOLDS,
+    RESIGNATION_REASONS,
+    JOB_GRADE_SALARY_BANDS,
+    AGE_POSITION_WEIGHT_MODIFIERS,
+    DEPARTMENT_WEIGHTS,
+    HIRE_MONTH_WEIGHTS,
+)
+
+# Position hierarchy bits (see LanguageProfile.position_flags)
+EXECUTIVE = 1
+DIRECTOR = 2
+MANAGER = 4
+
+# Org levels cleared for each hierarchy bit
+CLEARS_ORG_LV2 = EXECUTIVE
+CLEARS_ORG_LV3 = EXECUTIVE | DIRECTOR
+CLEARS_ORG_LV4 = EXECUTIVE | DIRECTOR | MANAGER
+
+
+def get_department_key(org_lv2):
+    """Map org_lv2 name to department key for org_lv3 lookup."""
+    if "Engineering" in org_lv2 or "エンジニアリング" in org_lv2:
+        return "Engineering"
+    elif "HR" in org_lv2 or "人事" in org_lv2:
+        return "HR"
+    elif "Finance" in org_lv2 or "財務" in org_lv2:
+        return "Finance"
+    return "Sales"
+
+
+def _frozen(values, dtype=None):
+    arr = np.array(values, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+class LanguageProfile:
+    """Immutable, precompiled view of one language's LANGUAGE_DATA entry.
+
+    Categorical values are identified by their index in the matching
+    `*_choices` array; `codes[field][value]` maps a value back to its code.
+    Cumulative weights are unnormalized running sums, usable directly as
+    random.choices(cum_weights=...) or with searchsorted(u * cum[-1]).
+    """
+
+    __slots__ = (
+        "language", "data", "faker_locale",
+        "gender_choices", "gender_cum_weights",
+        "emp_type_choices", "emp_type_cum_weights",
+        "org_lv1_choices", "org_lv2_choices", "org_lv2_cum_weights",
+        "org_lv4_choices", "dept_keys", "org_lv3_options", "job_category_options",
+        "position_choices", "position_index", "position_grades", "position_flags",
+        "grade_band_low", "grade_band_high", "age_brackets", "position_weight_matrix",
+        "hire_months", "hire_month_cum_weights",
+        "major_cities", "other_cities", "resignation_reasons",
+        "categories", "codes", "code_lookups",
+    )
+
+    def __init__(self, language, lang_data):
+        set_ = super().__setattr__
+        set_("language", language)
+        set_("data", lang_data)
+        set_("faker_locale", lang_data.get("faker_locale", "en_US"))
+
+        orgs = lang_data["organizations"]
+        positions = lang_data["positions"]
+
+        set_("gender_choices", _frozen(lang_data["genders"]["choices"], object))
+        set_("gender_cum_weights", _frozen(np.cumsum(lang_data["genders"]["weights"], dtype=float)))
+        set_("emp_type_choices", _frozen(lang_data["emp_types"]["choices"], object))
+        set_("emp_type_cum_weights",
+             _frozen(np.cumsum(lang_data["emp_types"]["weights"], dtype=float)))
+
+        # C1: Department weights (uniform when the language has none)
+        org_lv2 = orgs["org_lv2"]
+        dept_weights = DEPARTMENT_WEIGHTS.get(language, {})
+        weights = [dept_weights.get(d, 10) for d in org_lv2] if dept_weights else [1] * len(org_lv2)
+        set_("org_lv1_choices", _frozen(orgs["org_lv1"], object))
+        set_("org_lv2_choices", _frozen(org_lv2, object))
+        set_("org_lv2_cum_weights", _frozen(np.cumsum(weights, dtype=float)))
+        set_("org_lv4_choices", _frozen(orgs["org_lv4"], object))
+
+        # org_lv2 code -> department key, org_lv3 options and job categories
+        dept_keys = []
+        for name in org_lv2:
+            key = get_department_key(name)
+            dept_keys.append(key if orgs["org_lv3"].get(key) else "Sales")
+        set_("dept_keys", tuple(dept_keys))
+        set_("org_lv3_options", tuple(
+            tuple(orgs["org_lv3"].get(k, ["Default Department"])) for k in dept_keys
+        ))
+        set_("job_category_options", tuple(
+            tuple(lang_data["job_categories"].get(k, ["Default"])) for k in dept_keys
+        ))
+
+        # Positions: index, grade, hierarchy bits and salary bands per code
+        choices = positions["choices"]
+        grades = [f"Lv{i + 1}" for i in range(len(choices))]
+        hierarchy = positions["hierarchy"]
+        flags = [
+            (EXECUTIVE if p in hierarchy.get("executive", []) else 0)
+            | (DIRECTOR if p in hierarchy.get("director", []) else 0)
+            | (MANAGER if p in hierarchy.get("manager", []) else 0)
+            for p in choices
+        ]
+        set_("position_choices", _frozen(choices, object))
+        set_("position_index", MappingProxyType({p: i for i, p in enumerate(choices)}))
+        set_("position_grades", _frozen(grades, object))
+        set_("position_flags", _frozen(flags))
+        set_("grade_band_low", _frozen([JOB_GRADE_SALARY_BANDS[g][0] for g in grades]))
+        set_("grade_band_high", _frozen([JOB_GRADE_SALARY_BANDS[g][1] for g in grades]))
+
+        # A1: One row of position weights per age bracket, plus a default row
+        base_weights = np.asarray(positions["weights"], dtype=float)
+        brackets = list(AGE_POSITION_WEIGHT_MODIFIERS)
+        set_("age_brackets", tuple(brackets))
+        set_("position_weight_matrix", _frozen(np.vstack(
+            [np.maximum(base_weights * np.asarray(AGE_POSITION_WEIGHT_MODIFIERS[b]), 0.01)
+             for b in brackets]
+            + [np.maximum(base_weights, 0.01)]
+        )))
+
+        # C2: Hire month seasonality
+        month_weights = HIRE_MONTH_WEIGHTS.get(language, HIRE_MONTH_WEIGHTS["English"])
+        set_("hire_months", _frozen(list(month_weights.keys())))
+        set_("hire_month_cum_weights",
+             _frozen(np.cumsum(list(month_weights.values()), dtype=float)))
+
+        set_("major_cities", _frozen(lang_data["cities"]["major"], object))
+        set_("other_cities", _frozen(lang_data["cities"]["other"], object))
+        set_("resignation_reasons", _frozen(
+            RESIGNATION_REASONS.get(language, RESIGNATION_REASONS["English"]), object
+        ))
+
+        # Every value each categorical output column can take
+        categories = {
+            "gender": tuple(lang_data["genders"]["choices"]),
+            "org_lv1": tuple(orgs["org_lv1"]),
+            "org_lv2": tuple(org_lv2),
+            "org_lv3": tuple(dict.fromkeys(
+                [v for values in orgs["org_lv3"].values() for v in values]
+                + ["Default Department"]
+            )),
+            "org_lv4": tuple(orgs["org_lv4"]),
+            "position": tuple(choices),
+            "emp_type": tuple(lang_data["emp_types"]["choices"]),
+            "performance": tuple(PERFORMANCE_THRESHOLDS),
+            "address": tuple(lang_data["cities"]["major"] + lang_data["cities"]["other"]),
+            "job_category": tuple(dict.fromkeys(
+                [v for values in lang_data["job_categories"].values() for v in values]
+                + ["Management", "Default"]
+            )),
+            "job_grade": tuple(grades),
+            "resignation_reason": tuple(self.resignation_reasons),
+        }
+        set_("categories", MappingProxyType(categories))
+        set_("codes", MappingProxyType({
+            field: MappingProxyType({value: code for code, value in enumerate(values)})
+            for field, values in categories.items()
+        }))
+        # Values sorted, with their codes, for vectorized lookups (category_codes)
+        lookups = {}
+        for field, values in categories.items():
+            values = np.array(values, dtype=object)
+            order = np.argsort(values)
+            lookups[field] = (_frozen(values[order], object), _frozen(order))
+        set_("code_lookups", MappingProxyType(lookups))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"LanguageProfile is immutable (cannot set {name!r})")
+
+    def __repr__(self):
+        return f"LanguageProfile({self.language!r})"
+
+    def category_codes(self, field, values):
+        """Map an array of a categorical field's values to codes (-1 for None or unknown)."""
+        sorted_values, sorted_codes = self.code_lookups[field]
+        codes = np.full(len(values), -1)
+        present = np.flatnonzero(np.not_equal(values, None))
+        at = np.minimum(
+            np.searchsorted(sorted_values, values[present]), len(sorted_values) - 1
+        )
+        found = sorted_values[at] == values[present]
+        codes[present[found]] = sorted_codes[at[found]]
+        return codes
+
+    def position_codes(self, positions):
+        """Map an array of position names to codes (-1 if unknown)."""
+        codes = np.full(len(positions), -1)
+        for code, name in enumerate(self.position_choices):
+            codes[positions == name] = code
+        return codes
+
+
+@lru_cache(maxsize=None)
+def get_profile(language):
+    """Return the compiled LanguageProfile for a language name."""
+    return LanguageProfile(language, LANGUAGE_DATA[language])
+
+
+def as_profile(lang_data):
+    """Return the LanguageProfile for lang_data.
+
+    Accepts a LanguageProfile or a LANGUAGE_DATA entry; the shipped entries
+    resolve to their cached profiles, any other dict is compiled on the fly.
+    """
+    if isinstance(lang_data, LanguageProfile):
+        return lang_data
+    for language, data in LANGUAGE_DATA.items():
+        if data is lang_data:
+            return get_profile(language)
+    return LanguageProfile(None, lang_data)
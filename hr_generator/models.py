@@ -1,5 +1,6 @@
 """Data models for HR Data Generator."""
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from datetime import date
 from typing import Optional, Tuple
 
 
@@ -14,3 +15,17 @@ class GeneratorConfig:
     include_concurrent_positions: bool = False  # 兼務レコードを含むか
     concurrent_position_rate: float = 0.05  # 兼務者の割合 (5%)
     random_seed: Optional[int] = None
+    workers: int = 1  # 並列生成のプロセス数
+    as_of_date: Optional[date] = None  # 基準日 (None = 実行日)
+    audit: bool = False  # 生成した社員データを検証するか
+
+
+def resolve_as_of_date(config):
+    """Return config with as_of_date fixed (today's date when unset).
+
+    Called once per run so every step (and every worker process) sees the
+    same date, and seeded runs stay reproducible across midnight.
+    """
+    if config.as_of_date is not None:
+        return config
+    return replace(config, as_of_date=date.today())
@@ -1,200 +1,235 @@
-"""Monthly simulation logic: snapshots, resignations, promotions, performance updates."""
-import random
-from datetime import datetime
-
-from dateutil.relativedelta import relativedelta
-
-from hr_generator.config import JOB_GRADE_SALARY_BANDS, RESIGNATION_REASONS
-from hr_generator.employee import (
-    adjust_organization_by_position,
-    adjust_salary_by_performance,
-    calculate_salary,
-    get_performance_level,
-    _build_position_to_grade,
+"""Monthly simulation logic: snapshots, resignations, promotions, performance updates.
+
+The simulation works on struct-of-arrays employee state (see
+batch.create_employees_batch): every rule is applied as a whole-array
+operation over the active population, so the per-month cost scales with
+NumPy throughput rather than with the number of employees.
+"""
+import numpy as np
+
+from hr_generator.batch import (
+    NO_RESIGN_DATE,
+    columns_to_records,
+    records_to_columns,
+    performance_levels,
 )
+from hr_generator.config import SALARY_ADJUSTMENT_RATES
+from hr_generator.language import as_profile, CLEARS_ORG_LV2, CLEARS_ORG_LV3, CLEARS_ORG_LV4
 
 
-def _get_resignation_reason(employee, config, lang_data, base_date_dt):
-    """Select an appropriate resignation reason (A6).
+def _resignation_probabilities(years_of_service, engagement, config):
+    """Vectorized monthly resignation probability (A3 + A4).
 
-    Considers employee type, age, and engagement to pick a realistic reason.
+    Args:
+        years_of_service: float array of tenure in years.
+        engagement: float array of engagement scores (NaN if none).
+        config: object with a resignation_rate attribute.
     """
-    language = config.language
-    reasons = RESIGNATION_REASONS.get(language, RESIGNATION_REASONS["English"])
-    emp_type_choices = lang_data["emp_types"]["choices"]
+    # Base monthly probability from annual rate
+    base_monthly_prob = 1 - (1 - config.resignation_rate) ** (1 / 12)
 
-    # Contract expiry for contract employees
-    if employee["emp_type"] == emp_type_choices[1]:
-        # Higher chance of contract expiry
-        if random.random() < 0.6:
-            return reasons[3]  # "Contract Expiry" / "契約満了"
+    # A3: Short tenure multiplier (1-3 years: 2x, 3-5 years: 1.5x, 5+ years: 1x)
+    tenure_multiplier = np.select(
+        [years_of_service <= 3, years_of_service <= 5], [2.0, 1.5], default=1.0
+    )
 
-    # Retirement for older employees (age >= 58)
-    birth_date = datetime.strptime(employee["birth_date"], "%Y-%m-%d")
-    age = (base_date_dt - birth_date).days / 365.25
-    if age >= 58:
-        if random.random() < 0.5:
-            return reasons[4]  # "Retirement" / "定年退職"
+    # A4: Low engagement multiplier (1x when there is no score)
+    engagement_multiplier = np.select(
+        [np.isnan(engagement), engagement < 40, engagement < 55, engagement < 70],
+        [1.0, 3.0, 2.0, 1.2],
+        default=0.7,
+    )
 
-    # Voluntary reasons (weighted by engagement)
-    voluntary_reasons = reasons[:3]  # Career change, personal, relocation
-    return random.choice(voluntary_reasons)
+    raw_prob = base_monthly_prob * tenure_multiplier * engagement_multiplier
+    # Cap monthly probability so annualized rate stays reasonable (~30% max)
+    max_monthly_prob = 0.03
+    prob = np.minimum(raw_prob, max_monthly_prob)
+    # Can't resign in first year
+    return np.where(years_of_service < 1, 0.0, prob)
 
 
 def _calculate_resignation_probability(base_employee, base_date_dt, config):
-    """Calculate adjusted resignation probability (A3 + A4).
+    """Calculate adjusted resignation probability (A3 + A4) for one employee.
 
     Short-tenure employees and low-engagement employees resign more often.
     """
-    hire_date_dt = datetime.strptime(base_employee["hire_date"], "%Y-%m-%d")
-    years_of_service = (base_date_dt - hire_date_dt).days / 365.25
+    hire_date = np.datetime64(base_employee["hire_date"], "D")
+    years_of_service = (np.datetime64(base_date_dt, "D") - hire_date).astype(int) / 365.25
+    engagement = base_employee.get("engagement_score")
+    prob = _resignation_probabilities(
+        np.array([years_of_service]),
+        np.array([np.nan if engagement is None else engagement], dtype=float),
+        config,
+    )
+    return float(prob[0])
 
-    if years_of_service < 1:
-        return 0.0  # Can't resign in first year
 
-    # Base monthly probability from annual rate
-    base_monthly_prob = 1 - (1 - config.resignation_rate) ** (1 / 12)
+def _resignation_reasons(rng, is_contract, age, reasons):
+    """Select resignation reasons for the employees resigning this month (A6).
 
-    # A3: Short tenure multiplier (1-3 years: 2x, 3-5 years: 1.5x, 5+ years: 1x)
-    if years_of_service <= 3:
-        tenure_multiplier = 2.0
-    elif years_of_service <= 5:
-        tenure_multiplier = 1.5
-    else:
-        tenure_multiplier = 1.0
-
-    # A4: Low engagement multiplier
-    engagement = base_employee.get("engagement_score")
-    if engagement is not None:
-        if engagement < 40:
-            engagement_multiplier = 3.0
-        elif engagement < 55:
-            engagement_multiplier = 2.0
-        elif engagement < 70:
-            engagement_multiplier = 1.2
-        else:
-            engagement_multiplier = 0.7
-    else:
-        engagement_multiplier = 1.0
+    Contract employees most often leave at contract expiry, employees aged
+    58+ often retire, and everyone else picks a voluntary reason.
+    """
+    n = len(is_contract)
+    contract_expiry = is_contract & (rng.random(n) < 0.6)
+    retirement = ~contract_expiry & (age >= 58) & (rng.random(n) < 0.5)
+    # Voluntary reasons: career change, personal, relocation
+    result = reasons[rng.integers(0, 3, n)]
+    result[contract_expiry] = reasons[3]  # "Contract Expiry" / "契約満了"
+    result[retirement] = reasons[4]  # "Retirement" / "定年退職"
+    return result
+
+
+def is_year_end(month_offset):
+    """Whether the yearly promotion and review steps run in this month."""
+    return (month_offset + 1) % 12 == 0
 
-    raw_prob = base_monthly_prob * tenure_multiplier * engagement_multiplier
-    # Cap monthly probability so annualized rate stays reasonable (~30% max)
-    max_monthly_prob = 0.03
-    return min(raw_prob, max_monthly_prob)
 
+def simulate_month(state, month_offset, base_date, config, lang_data, rng):
+    """Advance columnar employee state by one month.
 
-def generate_monthly_snapshot(base_employees, month_offset, base_date_str, config, lang_data):
+    Resignation hazards, the yearly promotion step, the hire-anniversary
+    performance/salary update and engagement drift are applied to all active
+    employees at once. state is modified in place.
+
+    Args:
+        state: columns dict from create_employees_batch (dates as datetime64[D]).
+        month_offset: 0-based index of the simulated month.
+        base_date: First day of the month, as datetime64 or "YYYY-MM-DD".
+
+    Returns:
+        int array of the row indices that appear in this month's snapshot.
+    """
+    profile = as_profile(lang_data)
+    base_date64 = np.datetime64(base_date, "D")
+    base_month64 = base_date64.astype("datetime64[M]")
+    emp_type_choices = profile.emp_type_choices
+    salary_min, salary_max = config.salary_range
+
+    resign_date = state["resign_date"]
+    engagement = state["engagement_score"]
+    salary = state["salary"]
+    n = len(resign_date)
+
+    # Skip employees who already resigned before this month
+    not_resigned = resign_date == NO_RESIGN_DATE
+    active = not_resigned | (resign_date >= base_date64)
+    regular = active & (state["emp_type"] != emp_type_choices[2])  # not temporary
+    hire64 = state["hire_date"]
+
+    # --- Resignation logic (A3 + A4 + A6) ---
+    candidates = np.flatnonzero(regular & not_resigned)
+    years_of_service = (base_date64 - hire64[candidates]).astype(int) / 365.25
+    resign_prob = _resignation_probabilities(
+        years_of_service, engagement[candidates], config
+    )
+    resigning = candidates[rng.random(len(candidates)) < resign_prob]
+    if len(resigning):
+        # Resign on the last day of the month
+        resign_date[resigning] = (base_month64 + 1).astype("datetime64[D]") - 1
+        age = (base_date64 - state["birth_date"][resigning]).astype(int) / 365.25
+        state["resignation_reason"][resigning] = _resignation_reasons(
+            rng,
+            state["emp_type"][resigning] == emp_type_choices[1],
+            age,
+            profile.resignation_reasons,
+        )
+
+    if is_year_end(month_offset):
+        # --- Promotion logic (yearly, 5% chance) ---
+        position_codes = profile.position_codes(state["position"])
+        promoted = np.flatnonzero(
+            regular
+            & (rng.random(n) < 0.05)
+            & (position_codes < len(profile.position_choices) - 1)
+        )
+        if len(promoted):
+            _promote(state, promoted, position_codes[promoted] + 1, config, profile)
+
+        # --- Performance and salary update (every 12 months) ---
+        hire_month = hire64.astype("datetime64[M]").astype(int) % 12 + 1
+        reviewed = np.flatnonzero(
+            regular
+            & ~np.isnan(engagement)
+            & (hire_month == base_month64.astype(int) % 12 + 1)
+            & (resign_date > base_date64)
+        )
+        if len(reviewed):
+            performance = performance_levels(engagement[reviewed])
+            state["performance"][reviewed] = performance
+            rates = np.array([SALARY_ADJUSTMENT_RATES.get(p, 1.0) for p in performance])
+            adjusted = np.round(salary[reviewed] * rates, -3)
+            # Clamp salary to salary_range bounds (NaN salaries stay NaN)
+            salary[reviewed] = np.clip(adjusted, salary_min, salary_max)
+
+    # --- Engagement score drift (30% chance each month) ---
+    drifting = np.flatnonzero(
+        regular & ~np.isnan(engagement) & (resign_date > base_date64)
+    )
+    drifting = drifting[rng.random(len(drifting)) < 0.3]
+    engagement[drifting] = np.round(
+        np.clip(engagement[drifting] * rng.uniform(0.9, 1.1, len(drifting)), 0, 100)
+    )
+
+    return np.flatnonzero(active)
+
+
+def _promote(state, rows, new_codes, config, profile):
+    """Move the employees at rows up to the positions given by new_codes."""
+    salary_min, salary_max = config.salary_range
+    salary_span = salary_max - salary_min
+
+    state["position"][rows] = profile.position_choices[new_codes]
+    state["job_grade"][rows] = profile.position_grades[new_codes]
+
+    # Nullify org levels based on the new position's hierarchy
+    flags = profile.position_flags[new_codes]
+    state["org_lv2"][rows[(flags & CLEARS_ORG_LV2) != 0]] = None
+    state["org_lv3"][rows[(flags & CLEARS_ORG_LV3) != 0]] = None
+    state["org_lv4"][rows[(flags & CLEARS_ORG_LV4) != 0]] = None
+
+    # Update salary: keep performance raises, ensure within new grade band
+    new_grade_min = salary_min + salary_span * profile.grade_band_low[new_codes]
+    new_grade_max = salary_min + salary_span * profile.grade_band_high[new_codes]
+
+    salary = state["salary"][rows]
+    is_contract = state["emp_type"][rows] == profile.emp_type_choices[1]
+    current = np.where(
+        is_contract & (np.isnan(salary) | (salary == 0)), new_grade_min, salary
+    )
+    promoted_salary = np.clip(current, new_grade_min, new_grade_max)
+    state["salary"][rows] = np.where(
+        is_contract,
+        np.maximum(np.round(promoted_salary * 0.8, -3), salary_min),
+        # Preserve accumulated performance raises (NaN salaries stay NaN)
+        np.round(promoted_salary, -3),
+    )
+
+
+def generate_monthly_snapshot(base_employees, month_offset, base_date_str, config, lang_data,
+                              rng=None):
     """Generate one month's worth of employee data.
 
+    Dict-based wrapper around simulate_month for callers that hold
+    employees as a list of dicts.
+
     Returns:
         list of employee dicts for this month (rows to append to the dataset).
         base_employees is modified in place (resignations, promotions, salary updates).
     """
-    rows = []
-    base_date_dt = datetime.strptime(base_date_str, "%Y-%m-%d")
-    position_to_grade = _build_position_to_grade(lang_data)
-    emp_type_choices = lang_data["emp_types"]["choices"]
-
-    for base_employee in base_employees:
-        # Skip employees who already resigned before this month
-        if base_employee["resign_date"] != "2999-12-31":
-            resign_dt = datetime.strptime(base_employee["resign_date"], "%Y-%m-%d")
-            if base_date_dt > resign_dt:
-                continue
-
-        employee = base_employee.copy()
-        employee["base_date"] = base_date_str
-
-        # --- Resignation logic (A3 + A4 + A6) ---
-        # Only consider resignation for non-temporary, currently active employees
-        if (
-            base_employee["resign_date"] == "2999-12-31"
-            and base_employee["emp_type"] != emp_type_choices[2]  # not temporary
-        ):
-            resign_prob = _calculate_resignation_probability(
-                base_employee, base_date_dt, config
-            )
-            if resign_prob > 0 and random.random() < resign_prob:
-                resign_date = (
-                    base_date_dt + relativedelta(months=1, days=-1)
-                ).strftime("%Y-%m-%d")
-                base_employee["resign_date"] = resign_date
-                employee["resign_date"] = resign_date
-                # A6: Assign resignation reason
-                reason = _get_resignation_reason(employee, config, lang_data, base_date_dt)
-                base_employee["resignation_reason"] = reason
-                employee["resignation_reason"] = reason
-
-        # --- Promotion logic (yearly, 5% chance) ---
-        if (
-            (month_offset + 1) % 12 == 0
-            and random.random() < 0.05
-            and employee["emp_type"] != emp_type_choices[2]  # not temporary
-        ):
-            current_idx = lang_data["positions"]["choices"].index(employee["position"])
-            if current_idx < len(lang_data["positions"]["choices"]) - 1:
-                new_position = lang_data["positions"]["choices"][current_idx + 1]
-                employee["position"] = new_position
-                new_grade = position_to_grade[new_position]
-                employee["job_grade"] = new_grade
-                employee = adjust_organization_by_position(
-                    employee, lang_data["positions"], new_position
-                )
-                # Update salary: keep performance raises, ensure within new grade band
-                band_low, band_high = JOB_GRADE_SALARY_BANDS[new_grade]
-                salary_span = config.salary_range[1] - config.salary_range[0]
-                new_grade_min = config.salary_range[0] + salary_span * band_low
-                new_grade_max = config.salary_range[0] + salary_span * band_high
-
-                if employee["emp_type"] == emp_type_choices[1]:  # contract
-                    promoted_salary = max(employee["salary"] or new_grade_min, new_grade_min)
-                    promoted_salary = min(promoted_salary, new_grade_max)
-                    employee["salary"] = max(round(promoted_salary * 0.8, -3), config.salary_range[0])
-                elif employee["salary"] is not None:
-                    # Preserve accumulated performance raises
-                    promoted_salary = max(employee["salary"], new_grade_min)
-                    promoted_salary = min(promoted_salary, new_grade_max)
-                    employee["salary"] = round(promoted_salary, -3)
-
-                # Persist to base
-                base_employee["position"] = new_position
-                base_employee["job_grade"] = new_grade
-                base_employee["org_lv2"] = employee["org_lv2"]
-                base_employee["org_lv3"] = employee["org_lv3"]
-                base_employee["org_lv4"] = employee["org_lv4"]
-                base_employee["salary"] = employee["salary"]
+    if not base_employees:
+        return []
+    if rng is None:
+        rng = np.random.default_rng()
 
-        # --- Performance and salary update (every 12 months) ---
-        if (month_offset + 1) % 12 == 0:
-            if employee["emp_type"] != emp_type_choices[2] and employee.get("engagement_score") is not None:
-                hire_month = datetime.strptime(employee["hire_date"], "%Y-%m-%d").month
-                current_month = base_date_dt.month
-                if current_month == hire_month and base_date_str < employee["resign_date"]:
-                    employee["performance"] = get_performance_level(employee["engagement_score"])
-                    if employee["salary"] is not None:
-                        adjusted = adjust_salary_by_performance(
-                            employee["salary"], employee["performance"]
-                        )
-                        # Clamp salary to salary_range bounds
-                        adjusted = max(adjusted, config.salary_range[0])
-                        adjusted = min(adjusted, config.salary_range[1])
-                        employee["salary"] = adjusted
-                    base_employee["performance"] = employee["performance"]
-                    base_employee["salary"] = employee["salary"]
-
-        # --- Engagement score drift (30% chance each month) ---
-        if (
-            employee["emp_type"] != emp_type_choices[2]
-            and employee.get("engagement_score") is not None
-            and base_date_str < employee["resign_date"]
-            and random.random() < 0.3
-        ):
-            new_score = int(round(
-                min(max(employee["engagement_score"] * random.uniform(0.9, 1.1), 0), 100)
-            ))
-            employee["engagement_score"] = new_score
-            base_employee["engagement_score"] = new_score
+    state = records_to_columns(base_employees)
+    active = simulate_month(state, month_offset, base_date_str, config, lang_data, rng)
+    for base_employee, updated in zip(base_employees, columns_to_records(state)):
+        base_employee.update(updated)
 
+    rows = []
+    for i in active:
+        employee = base_employees[i].copy()
+        employee["base_date"] = base_date_str
         rows.append(employee)
-
     return rows
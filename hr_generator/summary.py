@@ -0,0 +1,40 @@
+"""Aggregates shown in the app's KPI strip and charts.
+
+summarize_dataset() reduces a generated DataFrame to the small frames and
+numbers the UI draws, so the app can memoize them per dataset instead of
+re-running the groupbys on every rerun.
+"""
+
+
+def summarize_dataset(df, point_limit):
+    """Compute the KPI and chart data for a generated dataset.
+
+    Charts describe the first month's primary positions. The salary frame
+    is sampled down to point_limit rows (fixed random_state) for plotting.
+
+    Returns:
+        dict with "kpis" (total_rows, headcount, months, resignations) and
+        "gender", "org", "salary" DataFrames.
+    """
+    primary = df[df["is_primary_position"]] if "is_primary_position" in df.columns else df
+    first = primary[primary["base_date"] == primary["base_date"].min()]
+
+    kpis = {
+        "total_rows": len(df),
+        "headcount": len(first),
+        "months": primary["base_date"].nunique(),
+        "resignations": df.loc[df["resign_date"] != "2999-12-31", "emp_id"].nunique(),
+    }
+
+    gender = first.groupby("gender")["emp_id"].nunique().reset_index()
+    gender.columns = ["Gender", "Count"]
+
+    org = first.groupby("org_lv2")["emp_id"].nunique().reset_index()
+    org.columns = ["Dept", "Count"]
+    org = org.sort_values("Count")
+
+    salary = first.loc[first["salary"].notna(), ["position", "salary"]]
+    if len(salary) > point_limit:
+        salary = salary.sample(n=point_limit, random_state=0)
+
+    return {"kpis": kpis, "gender": gender, "org": org, "salary": salary}
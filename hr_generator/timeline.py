@@ -0,0 +1,223 @@
+"""Event-sourced employee timelines.
+
+build_timeline() applies the monthly rules (monthly.simulate_month) to a
+shard's employees once, up front, and keeps only what they change over the
+horizon: the month each employee resigns in, the promotion and review
+patches of every year end, and each month's engagement scores. snapshot()
+answers "who is employed, and in what state, as of month m" from those
+events without replaying earlier months, so the months of a timeline can be
+produced in any order, or in parallel. versions() instead returns one row
+per change (slowly changing dimension, Type 2).
+
+Each month's rules draw from their own random stream (see month_seed), so a
+timeline depends only on the employees and the shard's seed.
+"""
+import numpy as np
+
+from hr_generator.batch import NO_RESIGN_DATE
+from hr_generator.engine import num_rows, take_columns
+from hr_generator.monthly import is_year_end, simulate_month
+
+# Fields that only the year-end promotion and review steps change
+YEAR_END_FIELDS = (
+    "position", "job_grade", "org_lv2", "org_lv3", "org_lv4", "salary", "performance",
+)
+
+# Engagement scores are whole numbers 0-100; this code stands for NaN
+_NO_SCORE = 255
+
+# Once-per-shard random streams (see shard_seed)
+POSTINGS_STREAM = 0
+
+
+def month_seed(seed_seq, month_offset, stream=0):
+    """Return the SeedSequence of one month's random stream.
+
+    The seed is derived from seed_seq's spawn key, so it does not depend on
+    other months or on how often seed_seq has been spawned. Stream 0 drives
+    the lifecycle rules; other streams are free for per-month steps.
+    """
+    return np.random.SeedSequence(
+        seed_seq.entropy,
+        spawn_key=(*seed_seq.spawn_key, month_offset, stream),
+        pool_size=seed_seq.pool_size,
+    )
+
+
+def shard_seed(seed_seq, stream):
+    """Return the SeedSequence of a once-per-shard random stream, such as POSTINGS_STREAM.
+
+    Its spawn key is one element longer than seed_seq's, so it can never
+    coincide with a month_seed stream (two elements longer).
+    """
+    return np.random.SeedSequence(
+        seed_seq.entropy,
+        spawn_key=(*seed_seq.spawn_key, stream),
+        pool_size=seed_seq.pool_size,
+    )
+
+
+def _encode_scores(scores):
+    return np.where(np.isnan(scores), _NO_SCORE, scores).astype(np.uint8)
+
+
+def _decode_scores(codes):
+    return np.where(codes == _NO_SCORE, np.nan, codes.astype(float))
+
+
+def _changed(before, after):
+    """Rows whose value differs (NaN equals NaN)."""
+    if after.dtype.kind == "f":
+        return ~((before == after) | (np.isnan(before) & np.isnan(after)))
+    return before != after
+
+
+def build_timeline(state, base_dates, config, lang_data, seed_seq):
+    """Run the monthly rules over every month once and record their events.
+
+    Args:
+        state: columns dict of the shard's employees (not modified).
+        base_dates: datetime64[D] first day of every month, oldest first.
+        seed_seq: np.random.SeedSequence of the shard's simulation.
+
+    Returns:
+        timeline dict for snapshot().
+    """
+    num_months = len(base_dates)
+    work = dict(state)
+    for field in (*YEAR_END_FIELDS, "engagement_score", "resign_date", "resignation_reason"):
+        work[field] = state[field].copy()
+
+    # Month each employee resigned in (-1: before the horizon, num_months: never)
+    resigned_at = np.where(state["resign_date"] == NO_RESIGN_DATE, num_months, -1)
+    engagement = np.empty((num_months, num_rows(state)), dtype=np.uint8)
+    year_ends = []
+
+    for month_offset, base_date in enumerate(base_dates):
+        before = None
+        if is_year_end(month_offset):
+            before = {field: work[field].copy() for field in YEAR_END_FIELDS}
+
+        rng = np.random.default_rng(month_seed(seed_seq, month_offset))
+        simulate_month(work, month_offset, base_date, config, lang_data, rng)
+
+        resigning = (resigned_at == num_months) & (work["resign_date"] != NO_RESIGN_DATE)
+        resigned_at[resigning] = month_offset
+        engagement[month_offset] = _encode_scores(work["engagement_score"])
+
+        if before is not None:
+            changed = np.zeros(len(resigned_at), dtype=bool)
+            for field in YEAR_END_FIELDS:
+                changed |= _changed(before[field], work[field])
+            rows = np.flatnonzero(changed)
+            year_ends.append(
+                (month_offset, rows, {field: work[field][rows] for field in YEAR_END_FIELDS})
+            )
+
+    return {
+        "state": state,
+        "seed_seq": seed_seq,
+        "base_dates": base_dates,
+        "resign_date": work["resign_date"],
+        "resignation_reason": work["resignation_reason"],
+        "resigned_at": resigned_at,
+        "engagement": engagement,
+        "year_ends": year_ends,
+    }
+
+
+def snapshot(timeline, month_offset):
+    """Return the rows of one month as a columns dict, with base_date.
+
+    Employees appear through the month they resign in, and that month's row
+    carries their resign date and reason. Only the year-end patches up to
+    month_offset are applied, so the cost does not depend on the order in
+    which months are requested.
+    """
+    base_date = timeline["base_dates"][month_offset]
+    active = np.flatnonzero(timeline["resign_date"] >= base_date)
+    month = take_columns(timeline["state"], active)
+
+    # Map employee rows to their position in this month's rows
+    position = np.full(len(timeline["resign_date"]), -1)
+    position[active] = np.arange(len(active))
+    for year_end, rows, values in timeline["year_ends"]:
+        if year_end > month_offset:
+            break
+        at = position[rows]
+        present = at >= 0
+        for field, field_values in values.items():
+            month[field][at[present]] = field_values[present]
+
+    resigned = timeline["resigned_at"][active] <= month_offset
+    month["resign_date"] = np.where(resigned, timeline["resign_date"][active], NO_RESIGN_DATE)
+    month["resignation_reason"] = np.where(
+        resigned, timeline["resignation_reason"][active], None
+    )
+    month["engagement_score"] = _decode_scores(timeline["engagement"][month_offset, active])
+    month["base_date"] = np.full(len(active), base_date)
+    return month
+
+
+def _apply_year_ends(columns, timeline, rows, months):
+    """Apply the year-end patches up to months[i] to row i of columns (employee rows[i])."""
+    patch_index = np.full(len(timeline["resign_date"]), -1)
+    for year_end, patched, values in timeline["year_ends"]:
+        patch_index[patched] = np.arange(len(patched))
+        at = patch_index[rows]
+        hit = np.flatnonzero((at >= 0) & (months >= year_end))
+        for field, field_values in values.items():
+            columns[field][hit] = field_values[at[hit]]
+        patch_index[patched] = -1
+
+
+def versions(timeline):
+    """Return the timeline as SCD Type 2 rows, one per employee state.
+
+    A new version starts in the first month an employee appears and in every
+    later month where a year-end promotion or review, an engagement change
+    or the resignation changes their row. Rows are ordered by employee, then
+    valid_from. valid_from is the first day of the version's first month and
+    valid_to the day before the next version starts. The latest version of
+    each employee has is_current=True and ends on the resign date
+    (NO_RESIGN_DATE for employees who have not resigned).
+
+    Returns:
+        columns dict with the snapshot fields (no base_date) plus
+        valid_from, valid_to and is_current.
+    """
+    base_dates = timeline["base_dates"]
+    resigned_at = timeline["resigned_at"]
+    engagement = timeline["engagement"]
+
+    # changed[m, i]: employee i starts a new version in month m
+    changed = np.zeros(engagement.shape, dtype=bool)
+    changed[0] = True
+    changed[1:] = engagement[1:] != engagement[:-1]
+    for year_end, rows, _ in timeline["year_ends"]:
+        changed[year_end, rows] = True
+    resigning = np.flatnonzero((resigned_at >= 0) & (resigned_at < len(base_dates)))
+    changed[resigned_at[resigning], resigning] = True
+    changed &= timeline["resign_date"][None, :] >= base_dates[:, None]
+
+    # Employee-major order
+    rows, months = np.nonzero(changed.T)
+    columns = take_columns(timeline["state"], rows)
+    _apply_year_ends(columns, timeline, rows, months)
+
+    resigned = resigned_at[rows] <= months
+    columns["resign_date"] = np.where(resigned, timeline["resign_date"][rows], NO_RESIGN_DATE)
+    columns["resignation_reason"] = np.where(
+        resigned, timeline["resignation_reason"][rows], None
+    )
+    columns["engagement_score"] = _decode_scores(engagement[months, rows])
+
+    is_current = np.ones(len(rows), dtype=bool)
+    is_current[:-1] = rows[1:] != rows[:-1]
+    next_month = np.append(months[1:], 0)
+    columns["valid_from"] = base_dates[months]
+    columns["valid_to"] = np.where(
+        is_current, columns["resign_date"], base_dates[next_month] - np.timedelta64(1, "D")
+    )
+    columns["is_current"] = is_current
+    return columns
@@ -1,12 +1,22 @@
+import os
+import time
+import uuid
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from io import BytesIO
 
-from hr_generator.config import TRANSLATIONS, LANGUAGE_DATA, MIN_EMPLOYEES, MAX_EMPLOYEES, DEFAULT_EMPLOYEES
+from hr_generator.config import (
+    TRANSLATIONS, LANGUAGE_DATA, MIN_EMPLOYEES, MAX_EMPLOYEES, DEFAULT_EMPLOYEES,
+    LARGE_MAX_EMPLOYEES, LARGE_DEFAULT_EMPLOYEES, LARGE_MODE_BYTES_PER_ROW,
+    LARGE_MODE_BYTES_PER_EMPLOYEE, LARGE_MODE_BASE_BYTES,
+)
 from hr_generator.models import GeneratorConfig
-from hr_generator.generator import generate_dataset
+from hr_generator.cache import cache_key
+from hr_generator.export import EXPORT_FORMATS, encode_export
+from hr_generator.jobs import GenerationJob
+from hr_generator.summary import summarize_dataset
 
 
 # ── Design tokens ────────────────────────────────────────────────────────────
@@ -20,6 +30,16 @@ TEXT_DIM = "#94a3b8"
 BORDER   = "#2d2f45"
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Max points drawn on the salary box plot (large populations are sampled)
+CHART_POINT_LIMIT = 5_000
+
+# Rerun interval while a background generation job is running
+PROGRESS_POLL_SECONDS = 0.3
+
+# Memoized chart/KPI aggregates: lifetime and number of datasets kept
+SUMMARY_CACHE_TTL_SECONDS = 3600
+SUMMARY_CACHE_MAX_ENTRIES = 8
+
 
 def setup_page():
     st.set_page_config(
@@ -253,17 +273,23 @@ def _chart_wrap(title: str) -> str:
 
 # ── Charts ────────────────────────────────────────────────────────────────────
 
-def render_charts(df: pd.DataFrame, t: dict) -> None:
-    first_month = df["base_date"].min()
-    cdf = df[df["base_date"] == first_month].copy()
-    if "is_primary_position" in cdf.columns:
-        cdf = cdf[cdf["is_primary_position"] == True]
+def dataset_id(config: GeneratorConfig) -> str:
+    """Cache key for seeded configs; a fresh id for every unseeded run."""
+    return cache_key(config) if config.random_seed is not None else uuid.uuid4().hex
 
+
+@st.cache_data(ttl=SUMMARY_CACHE_TTL_SECONDS, max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+               show_spinner=False)
+def cached_summary(dataset_id: str, _df: pd.DataFrame) -> dict:
+    """summarize_dataset memoized by dataset id (the frame itself is not hashed)."""
+    return summarize_dataset(_df, CHART_POINT_LIMIT)
+
+
+def render_charts(summary: dict, t: dict) -> None:
     c1, c2, c3 = st.columns(3, gap="medium")
 
     with c1:
-        gc = cdf.groupby("gender")["emp_id"].nunique().reset_index()
-        gc.columns = ["Gender", "Count"]
+        gc = summary["gender"]
         fig = go.Figure(go.Pie(
             labels=gc["Gender"], values=gc["Count"], hole=0.55,
             marker=dict(colors=[ACCENT, "#818cf8", "#a5b4fc"],
@@ -278,9 +304,7 @@ def render_charts(df: pd.DataFrame, t: dict) -> None:
         st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
     with c2:
-        oc = cdf.groupby("org_lv2")["emp_id"].nunique().reset_index()
-        oc.columns = ["Dept", "Count"]
-        oc = oc.sort_values("Count")
+        oc = summary["org"]
         fig = go.Figure(go.Bar(
             x=oc["Count"], y=oc["Dept"], orientation="h",
             marker=dict(color=oc["Count"],
@@ -299,7 +323,7 @@ def render_charts(df: pd.DataFrame, t: dict) -> None:
         st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
     with c3:
-        sdf = cdf[cdf["salary"].notna()].copy()
+        sdf = summary["salary"]
         if not sdf.empty:
             fig = px.box(sdf, x="position", y="salary", points="all",
                          color_discrete_sequence=[ACCENT])
@@ -332,11 +356,23 @@ def render_config_panel(t: dict, selected_language: str):
     )
 
     # ── Core params ──
-    st.markdown(section_label("Employees"), unsafe_allow_html=True)
-    employee_count = st.slider(
-        t["num_employees"], MIN_EMPLOYEES, MAX_EMPLOYEES, DEFAULT_EMPLOYEES,
-        label_visibility="collapsed",
+    large_mode = st.checkbox(
+        t["large_mode"],
+        value=False,
+        help=t["large_mode_tooltip"],
     )
+
+    st.markdown(section_label("Employees"), unsafe_allow_html=True)
+    if large_mode:
+        employee_count = int(st.number_input(
+            t["num_employees"], min_value=MAX_EMPLOYEES, max_value=LARGE_MAX_EMPLOYEES,
+            value=LARGE_DEFAULT_EMPLOYEES, step=50_000, label_visibility="collapsed",
+        ))
+    else:
+        employee_count = st.slider(
+            t["num_employees"], MIN_EMPLOYEES, MAX_EMPLOYEES, DEFAULT_EMPLOYEES,
+            label_visibility="collapsed",
+        )
     st.markdown(
         f'<div style="text-align:right;font-size:0.72rem;color:{ACCENT2};'
         f'margin-top:-10px;margin-bottom:8px;font-weight:600">{employee_count:,}</div>',
@@ -352,6 +388,19 @@ def render_config_panel(t: dict, selected_language: str):
         unsafe_allow_html=True,
     )
 
+    if large_mode:
+        est_rows = employee_count * num_months
+        est_gb = (
+            est_rows * LARGE_MODE_BYTES_PER_ROW
+            + employee_count * LARGE_MODE_BYTES_PER_EMPLOYEE
+            + LARGE_MODE_BASE_BYTES
+        ) / 1e9
+        st.markdown(
+            f'<div style="font-size:0.72rem;color:{TEXT_DIM};margin-bottom:8px">'
+            f'≈ {est_rows:,} rows · ≈ {est_gb:.1f} GB peak memory</div>',
+            unsafe_allow_html=True,
+        )
+
     st.markdown(
         f'<hr style="border-color:{BORDER};margin:0.8rem 0">',
         unsafe_allow_html=True,
@@ -396,6 +445,11 @@ def render_config_panel(t: dict, selected_language: str):
         help=t["concurrent_tooltip"],
     )
 
+    random_seed = st.number_input(
+        t["random_seed"], min_value=0, value=None, step=1, placeholder="—",
+        help=t["random_seed_tooltip"],
+    )
+
     st.markdown(
         f'<hr style="border-color:{BORDER};margin:1rem 0">',
         unsafe_allow_html=True,
@@ -413,7 +467,99 @@ def render_config_panel(t: dict, selected_language: str):
         unsafe_allow_html=True,
     )
 
-    return employee_count, num_months, age_range, salary_range, include_concurrent, generate
+    return (employee_count, num_months, age_range, salary_range, include_concurrent,
+            large_mode, random_seed, generate)
+
+
+# ── Progress ──────────────────────────────────────────────────────────────────
+
+def render_progress(job, t: dict) -> None:
+    """Render the progress bar and cancel button of a running generation job."""
+    st.progress(job.fraction, text=f'{t["generating"]} {job.fraction:.0%}')
+    if st.button(t["cancel_button"]):
+        job.cancel()
+
+
+def render_export_button(col, label: str, fmt: str, df: pd.DataFrame, t: dict,
+                         language: str) -> None:
+    """Encode an export only when requested, then offer it for download.
+
+    Encoded files are kept in st.session_state["exports"] until the next
+    generation replaces the dataset.
+    """
+    exports = st.session_state.setdefault("exports", {})
+    if fmt not in exports:
+        if not col.button(f"⚙  {label}", key=f"prepare_{fmt}", help=t["prepare_export"],
+                          use_container_width=True):
+            return
+        with st.spinner(t["preparing_export"]):
+            exports[fmt] = encode_export(df, fmt, language)
+    file_name, mime = EXPORT_FORMATS[fmt]
+    col.download_button(f"⬇  {label}", exports[fmt], file_name, mime,
+                        key=f"download_{fmt}", use_container_width=True)
+
+
+# ── Results ───────────────────────────────────────────────────────────────────
+
+def render_results(df: pd.DataFrame, dataset_id: str, t: dict, language: str) -> None:
+    """Render KPIs, charts, preview and downloads for a generated dataset."""
+    summary = cached_summary(dataset_id, df)
+
+    # KPI strip
+    k = summary["kpis"]
+    kpis = "".join([
+        stat_block("Total rows", f"{k['total_rows']:,}"),
+        stat_block("Headcount (M1)", f"{k['headcount']:,}"),
+        stat_block("Months", str(k["months"])),
+        stat_block("Resignations", str(k["resignations"]), color="#f87171"),
+    ])
+    st.markdown(
+        f'<div style="display:flex;gap:10px;flex-wrap:wrap;margin:0.2rem 0 1.4rem">'
+        f'{kpis}</div>',
+        unsafe_allow_html=True,
+    )
+
+    st.markdown(
+        f'<hr style="border-color:{BORDER};margin:0 0 1rem">',
+        unsafe_allow_html=True,
+    )
+
+    # Tabs
+    tab_charts, tab_preview, tab_dl = st.tabs([
+        "📊  " + t["charts_title"],
+        "🔍  " + t["data_preview"],
+        "💾  " + t["download_options"],
+    ])
+
+    with tab_charts:
+        st.markdown(
+            f'<p style="font-size:0.75rem;color:{TEXT_DIM};margin:0.6rem 0 1rem">'
+            f'Snapshot based on first month · primary positions only</p>',
+            unsafe_allow_html=True,
+        )
+        render_charts(summary, t)
+
+    with tab_preview:
+        st.markdown(
+            f'<p style="font-size:0.75rem;color:{TEXT_DIM};margin:0.6rem 0 0.8rem">'
+            f'Showing first 50 of {len(df):,} rows · {len(df.columns)} columns</p>',
+            unsafe_allow_html=True,
+        )
+        st.dataframe(df.head(50), use_container_width=True, height=440)
+
+    with tab_dl:
+        st.markdown(
+            f'<p style="font-size:0.82rem;color:{TEXT_DIM};margin:0.6rem 0 1.2rem">'
+            f'{len(df):,} rows · {len(df.columns)} columns</p>',
+            unsafe_allow_html=True,
+        )
+        d1, d2, d3, d4, d5 = st.columns([2, 2, 2, 2, 2])
+
+        render_export_button(d1, "CSV", "csv", df, t, language)
+        render_export_button(d2, "Excel", "xlsx", df, t, language)
+        render_export_button(d3, "JSON", "json", df, t, language)
+        render_export_button(d4, "Parquet", "parquet", df, t, language)
+        render_export_button(d5, "NDJSON", "ndjson", df, t, language)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -457,8 +603,9 @@ def main():
 
     # ── Config panel ──────────────────────────────────────────────────────
     with col_cfg:
-        (employee_count, num_months, age_range,
-         salary_range, include_concurrent, generate) = render_config_panel(t, selected_language)
+        (employee_count, num_months, age_range, salary_range,
+         include_concurrent, large_mode, random_seed,
+         generate) = render_config_panel(t, selected_language)
 
     # ── Main content ──────────────────────────────────────────────────────
     with col_main:
@@ -510,6 +657,7 @@ def main():
             pill("salary", f"{salary_range[0]//1_000_000:.1f}M–{salary_range[1]//1_000_000:.1f}M"),
             pill("concurrent", "on" if include_concurrent else "off"),
             pill("lang", selected_language),
+            pill("seed", "random" if random_seed is None else str(int(random_seed))),
         ])
         st.markdown(
             f'<div style="display:flex;flex-wrap:wrap;gap:2px;margin:0.8rem 0 1.4rem">'
@@ -519,93 +667,52 @@ def main():
 
         # ── Generation result ────────────────────────────────────────────
         if generate:
-            spinner_msg = "Generating data…" if selected_language == "English" else "データを生成中…"
-            with st.spinner(spinner_msg):
-                try:
-                    config = GeneratorConfig(
-                        language=selected_language,
-                        employee_count=employee_count,
-                        num_months=num_months,
-                        age_range=age_range,
-                        salary_range=salary_range,
-                        include_concurrent_positions=include_concurrent,
-                    )
-                    df = generate_dataset(config)
-                except Exception as e:
-                    st.error(f"Generation failed: {e}")
-                    return
-
-            if df.empty:
-                st.warning("No data generated — adjust parameters and try again.")
-                return
-
-            # KPI strip
-            primary_df = df[df["is_primary_position"] == True] if "is_primary_position" in df.columns else df
-            first_count = len(primary_df[primary_df["base_date"] == primary_df["base_date"].min()])
-            resigned = df[df["resign_date"] != "2999-12-31"]["emp_id"].nunique()
-            months_n = primary_df["base_date"].nunique()
-
-            kpis = "".join([
-                stat_block("Total rows", f"{len(df):,}"),
-                stat_block("Headcount (M1)", f"{first_count:,}"),
-                stat_block("Months", str(months_n)),
-                stat_block("Resignations", str(resigned), color="#f87171"),
-            ])
-            st.markdown(
-                f'<div style="display:flex;gap:10px;flex-wrap:wrap;margin:0.2rem 0 1.4rem">'
-                f'{kpis}</div>',
-                unsafe_allow_html=True,
-            )
-
-            st.markdown(
-                f'<hr style="border-color:{BORDER};margin:0 0 1rem">',
-                unsafe_allow_html=True,
+            config = GeneratorConfig(
+                language=selected_language,
+                employee_count=employee_count,
+                num_months=num_months,
+                age_range=age_range,
+                salary_range=salary_range,
+                include_concurrent_positions=include_concurrent,
+                random_seed=None if random_seed is None else int(random_seed),
+                workers=(os.cpu_count() or 1) if large_mode else 1,
             )
-
-            # Tabs
-            tab_charts, tab_preview, tab_dl = st.tabs([
-                "📊  " + t["charts_title"],
-                "🔍  " + t["data_preview"],
-                "💾  " + t["download_options"],
-            ])
-
-            with tab_charts:
-                st.markdown(
-                    f'<p style="font-size:0.75rem;color:{TEXT_DIM};margin:0.6rem 0 1rem">'
-                    f'Snapshot based on first month · primary positions only</p>',
-                    unsafe_allow_html=True,
-                )
-                render_charts(df, t)
-
-            with tab_preview:
-                st.markdown(
-                    f'<p style="font-size:0.75rem;color:{TEXT_DIM};margin:0.6rem 0 0.8rem">'
-                    f'Showing first 50 of {len(df):,} rows · {len(df.columns)} columns</p>',
-                    unsafe_allow_html=True,
-                )
-                st.dataframe(df.head(50), use_container_width=True, height=440)
-
-            with tab_dl:
-                st.markdown(
-                    f'<p style="font-size:0.82rem;color:{TEXT_DIM};margin:0.6rem 0 1.2rem">'
-                    f'{len(df):,} rows · {len(df.columns)} columns</p>',
-                    unsafe_allow_html=True,
+            current = st.session_state.get("dataset")
+            # A seeded config identical to the shown dataset is not regenerated
+            if current is None or current[2] != dataset_id(config):
+                job = st.session_state.get("job")
+                if job is not None:
+                    job.cancel()
+                st.session_state.pop("dataset", None)
+                st.session_state.pop("exports", None)
+                st.session_state["job"] = GenerationJob(config).start()
+
+        job = st.session_state.get("job")
+        if job is not None and job.running:
+            render_progress(job, t)
+            time.sleep(PROGRESS_POLL_SECONDS)
+            st.rerun()
+
+        if job is not None:
+            # Finished: keep the result so later reruns don't regenerate it
+            del st.session_state["job"]
+            if job.error is not None:
+                st.error(f"Generation failed: {job.error}")
+            elif job.cancelled:
+                st.info(t["generation_cancelled"])
+            else:
+                st.session_state["dataset"] = (
+                    job.result, job.config.language, dataset_id(job.config)
                 )
-                d1, d2, d3, _ = st.columns([2, 2, 2, 4])
-
-                csv = df.to_csv(index=False)
-                d1.download_button("⬇  CSV", csv, "hr_data.csv", "text/csv",
-                                   use_container_width=True)
-
-                buf = BytesIO()
-                with pd.ExcelWriter(buf, engine="openpyxl") as w:
-                    df.to_excel(w, index=False)
-                d2.download_button("⬇  Excel", buf.getvalue(), "hr_data.xlsx",
-                                   use_container_width=True)
-
-                d3.download_button("⬇  JSON", df.to_json(orient="records"),
-                                   "hr_data.json", "application/json",
-                                   use_container_width=True)
+                st.session_state["exports"] = {}
+
+        if "dataset" not in st.session_state:
+            return
+        df, language, df_id = st.session_state["dataset"]
+        if df.empty:
+            st.warning("No data generated — adjust parameters and try again.")
+            return
+        render_results(df, df_id, t, language)
 
 
 if __name__ == "__main__":
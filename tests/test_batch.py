@@ -0,0 +1,119 @@
+"""Tests for the vectorized batch employee factory."""
+from dataclasses import replace
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from hr_generator.batch import (
+    EMPLOYEE_FIELDS,
+    NO_RESIGN_DATE,
+    create_employees_batch,
+    columns_to_records,
+    audit_columns,
+)
+from hr_generator.employee import validate_employee
+
+
+@pytest.fixture
+def batch(default_config, english_lang_data):
+    rng = np.random.default_rng(42)
+    return create_employees_batch(default_config, english_lang_data, 1000, rng)
+
+
+class TestCreateEmployeesBatch:
+    def test_all_fields_have_length_n(self, batch):
+        assert tuple(batch) == EMPLOYEE_FIELDS
+        assert all(len(col) == 1000 for col in batch.values())
+
+    def test_emp_ids_sequential(self, default_config, english_lang_data):
+        rng = np.random.default_rng(0)
+        cols = create_employees_batch(default_config, english_lang_data, 3, rng, start_id=41)
+        assert list(cols["emp_id"]) == ["EMP000041", "EMP000042", "EMP000043"]
+
+    def test_deterministic_for_same_seed(self, default_config, english_lang_data):
+        a = create_employees_batch(default_config, english_lang_data, 200, np.random.default_rng(7))
+        b = create_employees_batch(default_config, english_lang_data, 200, np.random.default_rng(7))
+        assert columns_to_records(a) == columns_to_records(b)
+
+    def test_records_pass_validation(self, batch, default_config, english_lang_data):
+        for emp in columns_to_records(batch):
+            is_valid, msg = validate_employee(
+                emp,
+                age_range=default_config.age_range,
+                salary_range=default_config.salary_range,
+                lang_data=english_lang_data,
+            )
+            assert is_valid, f"{emp['emp_id']} invalid: {msg}"
+
+    def test_temporary_has_null_fields(self, batch):
+        records = columns_to_records(batch)
+        temps = [e for e in records if e["emp_type"] == "Temporary"]
+        assert temps, "Expected temporary employees in a sample of 1000"
+        for emp in temps:
+            assert emp["salary"] is None
+            assert emp["engagement_score"] is None
+            assert emp["performance"] is None
+            assert emp["position"] == "Staff"
+
+    def test_contract_has_end_date(self, batch):
+        for emp in columns_to_records(batch):
+            if emp["emp_type"] == "Contract":
+                hire = datetime.strptime(emp["hire_date"], "%Y-%m-%d")
+                end = datetime.strptime(emp["contract_end_date"], "%Y-%m-%d")
+                assert 1 <= end.year - hire.year <= 3
+            else:
+                assert emp["contract_end_date"] is None
+
+    def test_executives_have_no_lower_org(self, batch):
+        executives = np.isin(batch["position"], ["VP", "C-level"])
+        assert executives.any()
+        assert all(v is None for v in batch["org_lv2"][executives])
+        assert all(v is None for v in batch["org_lv4"][executives])
+
+    def test_position_distribution_follows_weights(self, batch):
+        positions, counts = np.unique(batch["position"].astype(str), return_counts=True)
+        share = dict(zip(positions, counts / counts.sum()))
+        assert share["Staff"] > share["Team Lead"] > share["Manager"]
+
+
+class TestSamplingIsValidByConstruction:
+    @pytest.mark.parametrize("age_range, salary_range", [
+        ((22, 22), (4000000, 10000000)),
+        ((30, 30), (1, 2)),
+        ((18, 70), (4000500, 9999999)),
+    ])
+    def test_tight_ranges_need_no_rejection(self, default_config, english_lang_data,
+                                            age_range, salary_range):
+        config = replace(default_config, age_range=age_range, salary_range=salary_range,
+                         as_of_date=date(2024, 1, 1))
+        cols = create_employees_batch(config, english_lang_data, 2000, np.random.default_rng(3))
+        assert audit_columns(cols, age_range, salary_range, english_lang_data,
+                             config.as_of_date) == {}
+
+
+class TestAuditColumns:
+    def test_matches_validate_employee(self, batch, default_config, english_lang_data):
+        batch["hire_date"][0] = np.datetime64("2999-01-01")
+        batch["resign_date"][1] = batch["hire_date"][1] - 1
+        batch["salary"][2] = default_config.salary_range[1] + 1000
+        executive = np.flatnonzero(batch["position"] == "VP")[0]
+        batch["org_lv4"][executive] = "Team 1"
+        failures = audit_columns(batch, default_config.age_range,
+                                 default_config.salary_range, english_lang_data)
+
+        invalid = np.zeros(len(batch["emp_id"]), dtype=bool)
+        for mask in failures.values():
+            invalid |= mask
+        expected = [
+            not validate_employee(emp, default_config.age_range, default_config.salary_range,
+                                  english_lang_data)[0]
+            for emp in columns_to_records(batch)
+        ]
+        assert list(invalid) == expected
+        assert set(np.flatnonzero(invalid)) == {0, 1, 2, executive}
+
+    def test_no_resign_date_is_not_checked(self, batch, default_config, english_lang_data):
+        assert (batch["resign_date"] == NO_RESIGN_DATE).all()
+        assert audit_columns(batch, default_config.age_range,
+                             default_config.salary_range, english_lang_data) == {}
@@ -0,0 +1,37 @@
+"""Tests for the benchmark runner in bench/."""
+from bench.run import PHASES, SCALAR_MAX_EMPLOYEES, compare, iter_cases, run_case
+
+
+class TestBenchRunner:
+    def test_every_phase_runs(self):
+        for phase in PHASES:
+            if phase == "export_xlsx":
+                continue
+            result = run_case(phase, 50, 2, repeat=2, min_seconds=0)
+            assert result["rows"] > 0, phase
+            assert result["rows_per_second"] > 0
+            assert result["seconds"] <= result["median_seconds"]
+            assert result["rss_growth_mb"] >= 0
+
+    def test_scalar_phases_are_capped(self):
+        counts = [1_000, SCALAR_MAX_EMPLOYEES * 10]
+        cases = list(iter_cases(["create_employee", "create_employees_batch"], counts, [1, 12]))
+        assert cases == [
+            ("create_employee", 1_000, 1),
+            ("create_employees_batch", 1_000, 1),
+            ("create_employees_batch", SCALAR_MAX_EMPLOYEES * 10, 1),
+        ]
+
+    def test_compare_flags_slowdown_and_memory(self):
+        base = {"phase": "generate_dataset", "employee_count": 1000, "num_months": 1,
+                "seconds": 1.0, "rows_per_second": 1000.0, "rss_growth_mb": 100.0}
+        baseline = {"results": [base]}
+        assert compare([dict(base, rows_per_second=900.0)], baseline, 0.25) == []
+        slow = dict(base, rows_per_second=500.0, rss_growth_mb=200.0)
+        assert len(compare([slow], baseline, 0.25)) == 2
+        assert compare([dict(slow, num_months=12)], baseline, 0.25) == []
+
+    def test_compare_ignores_small_rss_growth(self):
+        base = {"phase": "audit_columns", "employee_count": 1000, "num_months": 1,
+                "seconds": 1.0, "rows_per_second": 1000.0, "rss_growth_mb": 0.5}
+        assert compare([dict(base, rss_growth_mb=5.0)], {"results": [base]}, 0.25) == []
@@ -0,0 +1,90 @@
+"""Tests for the on-disk dataset cache."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date
+
+import pandas as pd
+
+from hr_generator import cache
+from hr_generator.cache import cache_key, cached_generate_dataset, evict
+from hr_generator.generator import generate_dataset
+
+
+def _entries(cache_dir):
+    return sorted(p.name for p in cache_dir.glob("*.arrow"))
+
+
+class TestCacheKey:
+    def test_stable(self, default_config):
+        assert cache_key(default_config) == cache_key(replace(default_config))
+
+    def test_ignores_workers(self, default_config):
+        assert cache_key(default_config) == cache_key(replace(default_config, workers=8))
+
+    def test_depends_on_config_date_and_version(self, default_config, monkeypatch):
+        config = replace(default_config, as_of_date=date(2025, 1, 1))
+        key = cache_key(config)
+        assert key != cache_key(replace(config, random_seed=43))
+        assert key != cache_key(replace(config, as_of_date=date(2025, 1, 2)))
+        monkeypatch.setattr(cache, "GENERATOR_VERSION", "test")
+        assert key != cache_key(config)
+
+    def test_unset_date_means_today(self, default_config):
+        today = replace(default_config, as_of_date=date.today())
+        assert cache_key(default_config) == cache_key(today)
+
+
+class TestCachedGenerateDataset:
+    def test_hit_matches_generate_dataset(self, multi_month_config, tmp_path):
+        first = cached_generate_dataset(multi_month_config, tmp_path)
+        assert len(_entries(tmp_path)) == 1
+        second = cached_generate_dataset(multi_month_config, tmp_path)
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(second, generate_dataset(multi_month_config))
+
+    def test_hit_skips_generation(self, default_config, tmp_path, monkeypatch):
+        cached_generate_dataset(default_config, tmp_path)
+        monkeypatch.setattr(cache, "generate_dataset", lambda config, progress=None: 1 / 0)
+        assert not cached_generate_dataset(default_config, tmp_path).empty
+
+    def test_unseeded_bypasses_cache(self, default_config, tmp_path):
+        cached_generate_dataset(replace(default_config, random_seed=None), tmp_path)
+        assert _entries(tmp_path) == []
+
+    def test_corrupt_entry_is_regenerated(self, default_config, tmp_path):
+        (tmp_path / f"{cache_key(default_config)}.arrow").write_bytes(b"not arrow")
+        df = cached_generate_dataset(default_config, tmp_path)
+        pd.testing.assert_frame_equal(df, cached_generate_dataset(default_config, tmp_path))
+
+    def test_concurrent_misses_on_one_key(self, multi_month_config, tmp_path):
+        with ThreadPoolExecutor(4) as pool:
+            frames = list(pool.map(
+                lambda _: cached_generate_dataset(multi_month_config, tmp_path), range(4)
+            ))
+        for df in frames:
+            pd.testing.assert_frame_equal(df, frames[0])
+        assert len(_entries(tmp_path)) == 1
+        assert list(tmp_path.glob("*.tmp")) == []
+        pd.testing.assert_frame_equal(cached_generate_dataset(multi_month_config, tmp_path),
+                                      frames[0])
+
+
+class TestEvict:
+    def test_removes_least_recently_used(self, tmp_path):
+        for i, name in enumerate(["old", "mid", "new"]):
+            path = tmp_path / f"{name}.arrow"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (1000 + i, 1000 + i))
+        evict(tmp_path, max_bytes=200)
+        assert _entries(tmp_path) == ["mid.arrow", "new.arrow"]
+
+    def test_size_bound_after_write(self, default_config, tmp_path):
+        cached_generate_dataset(default_config, tmp_path, max_bytes=0)
+        assert _entries(tmp_path) == []
+
+    def test_oversized_frame_keeps_other_entries(self, default_config, tmp_path):
+        (tmp_path / "other.arrow").write_bytes(b"x" * 100)
+        cached_generate_dataset(default_config, tmp_path, max_bytes=1000)
+        assert _entries(tmp_path) == ["other.arrow"]
+        assert list(tmp_path.glob("*.tmp")) == []
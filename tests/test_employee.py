@@ -1,7 +1,7 @@
 """Tests for employee creation and validation - P0 and P1."""
 import inspect
 
-from faker import Faker
+import numpy as np
 
 from hr_generator.employee import (
     create_employee,
@@ -33,9 +33,8 @@ class TestCreateEmployee:
     """create_employee must produce a valid employee dict."""
 
     def test_returns_dict_with_required_keys(self, default_config, english_lang_data):
-        fake = Faker("en_US")
-        fake.seed_instance(42)
-        emp = create_employee(default_config, english_lang_data, fake, 1)
+        rng = np.random.default_rng(42)
+        emp = create_employee(default_config, english_lang_data, rng, 1)
         required_keys = {
             "emp_id", "name", "birth_date", "gender",
             "org_lv1", "org_lv2", "org_lv3", "org_lv4",
@@ -47,27 +46,24 @@ class TestCreateEmployee:
         assert required_keys.issubset(set(emp.keys()))
 
     def test_emp_id_format(self, default_config, english_lang_data):
-        fake = Faker("en_US")
-        fake.seed_instance(42)
-        emp = create_employee(default_config, english_lang_data, fake, 42)
+        rng = np.random.default_rng(42)
+        emp = create_employee(default_config, english_lang_data, rng, 42)
         assert emp["emp_id"] == "EMP000042"
 
     def test_birth_date_within_age_range(self, default_config, english_lang_data):
-        fake = Faker("en_US")
-        fake.seed_instance(42)
+        rng = np.random.default_rng(42)
         from datetime import datetime
-        emp = create_employee(default_config, english_lang_data, fake, 1)
+        emp = create_employee(default_config, english_lang_data, rng, 1)
         birth = datetime.strptime(emp["birth_date"], "%Y-%m-%d")
         now = datetime.now()
         age = (now - birth).days / 365.25
         assert default_config.age_range[0] <= age <= default_config.age_range[1] + 1
 
     def test_salary_within_range_for_fulltime(self, default_config, english_lang_data):
-        fake = Faker("en_US")
-        fake.seed_instance(42)
+        rng = np.random.default_rng(42)
         # Generate multiple employees to find a full-time one
         for i in range(50):
-            emp = create_employee(default_config, english_lang_data, fake, i)
+            emp = create_employee(default_config, english_lang_data, rng, i)
             if emp["emp_type"] == "Full-time" and emp["salary"] is not None:
                 assert default_config.salary_range[0] <= emp["salary"] <= default_config.salary_range[1]
                 return
@@ -76,11 +72,10 @@ class TestCreateEmployee:
 
     def test_contract_salary_is_80_percent_of_base(self, default_config, english_lang_data):
         """Contract employee salary = 80% of position base, floored at salary_range min."""
-        fake = Faker("en_US")
         # Generate multiple to find a contract employee
         for i in range(200):
-            fake.seed_instance(i)
-            emp = create_employee(default_config, english_lang_data, fake, i)
+            rng = np.random.default_rng(i)
+            emp = create_employee(default_config, english_lang_data, rng, i)
             if emp["emp_type"] == "Contract":
                 # Contract employees should have staff-level position
                 assert emp["position"] == "Staff"
@@ -93,10 +88,9 @@ class TestCreateEmployee:
 
     def test_temporary_has_null_salary(self, default_config, english_lang_data):
         """Temporary employees have None salary."""
-        fake = Faker("en_US")
         for i in range(200):
-            fake.seed_instance(i)
-            emp = create_employee(default_config, english_lang_data, fake, i)
+            rng = np.random.default_rng(i)
+            emp = create_employee(default_config, english_lang_data, rng, i)
             if emp["emp_type"] == "Temporary":
                 assert emp["salary"] is None
                 assert emp["engagement_score"] is None
@@ -105,10 +99,9 @@ class TestCreateEmployee:
 
     def test_always_produces_valid_employee(self, default_config, english_lang_data):
         """create_employee should always produce a valid employee (no silent failures)."""
-        fake = Faker("en_US")
         for i in range(100):
-            fake.seed_instance(i)
-            emp = create_employee(default_config, english_lang_data, fake, i)
+            rng = np.random.default_rng(i)
+            emp = create_employee(default_config, english_lang_data, rng, i)
             is_valid, msg = validate_employee(
                 emp,
                 age_range=default_config.age_range,
@@ -116,3 +109,9 @@ class TestCreateEmployee:
                 lang_data=english_lang_data,
             )
             assert is_valid, f"Employee {i} invalid: {msg}"
+
+    def test_same_rng_seed_same_employee(self, default_config, english_lang_data):
+        """create_employee draws only from the rng it is given."""
+        first = create_employee(default_config, english_lang_data, np.random.default_rng(7), 1)
+        second = create_employee(default_config, english_lang_data, np.random.default_rng(7), 1)
+        assert first == second
@@ -0,0 +1,67 @@
+"""Tests for the columnar dataset engine."""
+import numpy as np
+import pandas as pd
+
+from hr_generator.engine import (
+    num_rows,
+    take_columns,
+    concat_columns,
+    columns_to_frame,
+    format_dates,
+)
+from hr_generator.generator import generate_dataset
+
+
+def _columns():
+    return {
+        "emp_id": np.array(["EMP000001", "EMP000002", "EMP000003"], dtype=object),
+        "salary": np.array([4000000.0, np.nan, 5000000.0]),
+        "org_lv3": np.array(["Accounting", None, "Treasury"], dtype=object),
+    }
+
+
+class TestColumnHelpers:
+    def test_take_columns_with_mask(self):
+        taken = take_columns(_columns(), np.array([True, False, True]))
+        assert list(taken["emp_id"]) == ["EMP000001", "EMP000003"]
+        assert num_rows(taken) == 2
+
+    def test_concat_columns_skips_empty_chunks(self):
+        cols = _columns()
+        empty = take_columns(cols, np.array([], dtype=int))
+        merged = concat_columns([cols, empty, cols])
+        assert num_rows(merged) == 6
+
+    def test_concat_no_chunks(self):
+        assert concat_columns([]) == {}
+
+    def test_frame_keeps_missing_values(self):
+        df = columns_to_frame(_columns())
+        assert list(df.columns) == ["emp_id", "salary", "org_lv3"]
+        assert df["salary"].isna().tolist() == [False, True, False]
+        assert df["org_lv3"].isna().tolist() == [False, True, False]
+
+    def test_empty_frame(self):
+        assert columns_to_frame({}).empty
+
+
+    def test_format_dates_shares_strings(self):
+        values = np.array(["2024-01-31", "NaT", "2023-05-01", "2024-01-31", "NaT"],
+                          dtype="datetime64[D]")
+        out = format_dates(values)
+        assert out.tolist() == ["2024-01-31", None, "2023-05-01", "2024-01-31", None]
+        assert out[0] is out[3]
+        assert format_dates(values[:0]).tolist() == []
+
+
+class TestColumnarDataset:
+    def test_column_order_matches_employee_dict(self, default_config):
+        df = generate_dataset(default_config)
+        assert list(df.columns[:4]) == ["emp_id", "name", "birth_date", "gender"]
+        assert list(df.columns[-2:]) == ["base_date", "is_primary_position"]
+
+    def test_zero_months_returns_empty_frame(self, default_config):
+        from dataclasses import replace
+        df = generate_dataset(replace(default_config, num_months=0))
+        assert isinstance(df, pd.DataFrame)
+        assert df.empty
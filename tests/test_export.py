@@ -0,0 +1,202 @@
+"""Tests for the Parquet / Arrow IPC writers."""
+import gzip
+import io
+import json
+from dataclasses import replace
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import pytest
+from openpyxl import load_workbook
+
+from hr_generator import export
+from hr_generator.export import (
+    dataset_schema,
+    encode_batch,
+    encode_export,
+    frame_to_excel_bytes,
+    frame_to_parquet_bytes,
+    write_arrow_ipc,
+    write_excel,
+    write_ndjson,
+    write_parquet,
+)
+from hr_generator.generator import generate_dataset
+
+
+@pytest.fixture
+def export_config(multi_month_config):
+    return replace(multi_month_config, num_months=3, include_concurrent_positions=True)
+
+
+def _read_parquet(config, **kwargs):
+    buf = io.BytesIO()
+    rows = write_parquet(config, buf, **kwargs)
+    buf.seek(0)
+    return rows, pq.ParquetFile(buf)
+
+
+class TestWriteParquet:
+    def test_categoricals_are_dictionary_encoded(self, export_config):
+        _, parquet = _read_parquet(export_config)
+        schema = parquet.schema_arrow
+        for name in ("gender", "org_lv2", "position", "emp_type", "job_grade"):
+            assert pa.types.is_dictionary(schema.field(name).type)
+        assert schema.field("emp_id").type == pa.string()
+
+    def test_dates_are_date32(self, export_config):
+        _, parquet = _read_parquet(export_config)
+        for name in ("birth_date", "hire_date", "resign_date", "base_date"):
+            assert parquet.schema_arrow.field(name).type == pa.date32()
+
+    def test_one_row_group_per_month(self, export_config):
+        _, parquet = _read_parquet(export_config, chunk_rows=25)
+        assert parquet.num_row_groups == export_config.num_months
+        for i in range(parquet.num_row_groups):
+            dates = parquet.read_row_group(i, columns=["base_date"]).column(0)
+            assert len(set(dates.to_pylist())) == 1
+
+    def test_rows_match_generate_dataset(self, export_config):
+        rows, parquet = _read_parquet(export_config, chunk_rows=40)
+        table = parquet.read()
+        df = generate_dataset(export_config)
+        assert rows == table.num_rows == len(df)
+        assert table.column("emp_id").to_pylist() == df["emp_id"].tolist()
+        assert table.column("position").to_pylist() == df["position"].tolist()
+        assert [d.isoformat() for d in table.column("hire_date").to_pylist()] == \
+            df["hire_date"].tolist()
+
+    def test_japanese_vocabulary(self, export_config):
+        config = replace(export_config, language="Japanese")
+        rows, parquet = _read_parquet(config)
+        assert rows == parquet.metadata.num_rows
+
+
+class TestWriteArrowIpc:
+    def test_round_trip(self, export_config):
+        buf = io.BytesIO()
+        rows = write_arrow_ipc(export_config, buf, chunk_rows=50)
+        buf.seek(0)
+        table = ipc.open_file(buf).read_all()
+        assert table.num_rows == rows
+        assert pa.types.is_dictionary(table.schema.field("gender").type)
+
+
+class TestEncoding:
+    def test_unknown_category_raises(self):
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(["Unknown"], type=pa.string())], names=["gender"]
+        )
+        with pytest.raises(ValueError):
+            encode_batch(batch, "English")
+
+    def test_schema_keeps_column_order(self):
+        schema = dataset_schema("English", ["emp_id", "salary", "base_date"])
+        assert schema.names == ["emp_id", "salary", "base_date"]
+
+    def test_frame_to_parquet_bytes(self, export_config):
+        df = generate_dataset(export_config)
+        parquet = pq.ParquetFile(io.BytesIO(frame_to_parquet_bytes(df, "English")))
+        assert parquet.metadata.num_rows == len(df)
+        assert parquet.num_row_groups == export_config.num_months
+
+
+class TestEncodeExport:
+    @pytest.fixture
+    def df(self, export_config):
+        return generate_dataset(export_config)
+
+    def test_csv_matches_pandas(self, df):
+        data = encode_export(df, "csv", "English", chunk_rows=7)
+        assert data == df.to_csv(index=False).encode()
+
+    def test_json_matches_pandas(self, df):
+        data = encode_export(df, "json", "English", chunk_rows=7)
+        assert data == df.to_json(orient="records").encode()
+
+    def test_empty_frame(self):
+        assert encode_export(pd.DataFrame(), "json", "English") == b"[]"
+
+    def test_parquet_and_excel(self, df):
+        table = pq.read_table(io.BytesIO(encode_export(df, "parquet", "English")))
+        assert table.num_rows == len(df)
+        sheets = pd.read_excel(io.BytesIO(encode_export(df, "xlsx", "English")), sheet_name=None)
+        excel = pd.concat(sheets.values())
+        assert list(excel.columns) == list(df.columns)
+        assert len(excel) == len(df)
+
+    def test_unknown_format(self, df):
+        with pytest.raises(ValueError):
+            encode_export(df, "xml", "English")
+
+
+class TestWriteExcel:
+    def _sheets(self, data):
+        workbook = load_workbook(io.BytesIO(data), read_only=True)
+        return {ws.title: list(ws.values) for ws in workbook}
+
+    def test_one_sheet_per_month(self, export_config):
+        buf = io.BytesIO()
+        rows = write_excel(export_config, buf, chunk_rows=40)
+        df = generate_dataset(export_config)
+        assert rows == len(df)
+
+        sheets = self._sheets(buf.getvalue())
+        assert list(sheets) == sorted(df["base_date"].unique())
+        for base_date, values in sheets.items():
+            month = df[df["base_date"] == base_date]
+            assert values[0] == tuple(df.columns)
+            assert len(values) - 1 == len(month)
+        first = df.iloc[0]
+        row = dict(zip(df.columns, sheets[first["base_date"]][1]))
+        assert row["emp_id"] == first["emp_id"]
+        assert row["salary"] == first["salary"]
+
+    def test_long_month_continues_on_next_sheet(self, export_config, monkeypatch):
+        monkeypatch.setattr(export, "EXCEL_MAX_ROWS", 60)
+        df = generate_dataset(replace(export_config, num_months=1))
+        sheets = self._sheets(frame_to_excel_bytes(df))
+        base_date = df["base_date"].iloc[0]
+        assert list(sheets)[:2] == [base_date, f"{base_date} (2)"]
+        assert all(len(values) <= 60 for values in sheets.values())
+        assert sum(len(values) - 1 for values in sheets.values()) == len(df)
+
+    def test_in_memory_chunks_match_whole_frame(self, export_config):
+        df = generate_dataset(export_config)
+        chunked = self._sheets(encode_export(df, "xlsx", "English", chunk_rows=7))
+        assert chunked == self._sheets(frame_to_excel_bytes(df, chunk_rows=len(df)))
+
+
+class TestWriteNdjson:
+    def _records(self, data):
+        return [json.loads(line) for line in data.decode().splitlines()]
+
+    @pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+    def test_round_trip(self, export_config, compression):
+        buf = io.BytesIO()
+        rows = write_ndjson(export_config, buf, chunk_rows=40, compression=compression)
+        assert not buf.closed
+        data = buf.getvalue()
+        if compression is not None:
+            data = pa.CompressedInputStream(io.BytesIO(data), compression).read()
+        df = generate_dataset(export_config)
+        assert rows == len(df)
+        records = self._records(data)
+        assert records == json.loads(df.to_json(orient="records"))
+
+    def test_writes_to_path(self, default_config, tmp_path):
+        path = tmp_path / "hr.ndjson.gz"
+        rows = write_ndjson(default_config, path, compression="gzip")
+        with gzip.open(path) as f:
+            assert len(f.read().splitlines()) == rows == default_config.employee_count
+
+    def test_unsupported_compression(self, default_config):
+        with pytest.raises(ValueError):
+            write_ndjson(default_config, io.BytesIO(), compression="bz2")
+
+    def test_download_is_gzipped(self, default_config):
+        df = generate_dataset(default_config)
+        data = gzip.decompress(encode_export(df, "ndjson", "English", chunk_rows=64))
+        assert len(self._records(data)) == len(df)
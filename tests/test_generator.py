@@ -1,7 +1,21 @@
 """Integration tests for full dataset generation - P0 employee count guarantee."""
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
+from datetime import date
 
-from hr_generator.generator import generate_dataset
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_generator import generator
+from hr_generator.generator import (
+    GenerationCancelled,
+    generate_dataset,
+    generate_scd2,
+    iter_dataset,
+    snapshot_at,
+)
 
 
 class TestEmployeeCountMonth1:
@@ -157,3 +171,284 @@ class TestConcurrentPositions:
         assert "is_primary_position" in df.columns
         # Primary position should be True/False
         assert df["is_primary_position"].dtype == bool
+
+    def test_postings_persist_across_months(self, multi_month_config):
+        """Concurrent postings are decided once, not re-drawn every month."""
+        config = replace(
+            multi_month_config, include_concurrent_positions=True, concurrent_position_rate=0.3
+        )
+        df = generate_dataset(config)
+        concurrent = df[~df["is_primary_position"]]
+        assert concurrent.groupby("emp_id")["org_lv2"].nunique().eq(1).all()
+        holders = concurrent.groupby("base_date")["emp_id"].apply(set).sort_index().tolist()
+        assert len(holders) == config.num_months
+        for earlier, later in zip(holders, holders[1:]):
+            assert later <= earlier
+
+    def test_concurrent_row_follows_primary(self, default_config):
+        config = replace(
+            default_config, include_concurrent_positions=True, concurrent_position_rate=0.5
+        )
+        df = generate_dataset(config)
+        is_primary = df["is_primary_position"].to_numpy()
+        emp_ids = df["emp_id"].to_numpy()
+        concurrent = np.flatnonzero(~is_primary)
+        assert len(concurrent)
+        assert is_primary[concurrent - 1].all()
+        assert (emp_ids[concurrent - 1] == emp_ids[concurrent]).all()
+
+
+class TestShardedGeneration:
+    """workers=N must not change the output for a given seed."""
+
+    def test_output_identical_across_worker_counts(self, multi_month_config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 40)
+        config = replace(
+            multi_month_config, employee_count=130, include_concurrent_positions=True
+        )
+        single = generate_dataset(config)
+        sharded = generate_dataset(replace(config, workers=3))
+        assert single.equals(sharded)
+
+    def test_emp_ids_unique_across_shards(self, default_config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 64)
+        df = generate_dataset(default_config)
+        assert df["emp_id"].is_unique
+        assert df["emp_id"].iloc[-1] == f"EMP{default_config.employee_count:06d}"
+
+
+class TestIterDataset:
+    """Streaming generation must match generate_dataset chunk for chunk."""
+
+    def test_chunks_concatenate_to_full_dataset(self, multi_month_config):
+        config = replace(multi_month_config, include_concurrent_positions=True)
+        chunks = list(iter_dataset(config, chunk_rows=37))
+        assert all(len(chunk) <= 37 for chunk in chunks)
+        streamed = pd.concat(chunks, ignore_index=True)
+        full = generate_dataset(config)
+        # An all-null string column may infer a different dtype within one chunk
+        normalize = lambda df: df.astype(object).where(df.notna(), None)
+        assert normalize(streamed).equals(normalize(full))
+
+    def test_chunks_are_month_ordered(self, multi_month_config):
+        dates = [chunk["base_date"].iloc[0] for chunk in iter_dataset(multi_month_config, chunk_rows=30)]
+        assert dates == sorted(dates)
+
+    def test_arrow_batches_share_schema(self, multi_month_config):
+        pytest.importorskip("pyarrow")
+        batches = list(iter_dataset(multi_month_config, chunk_rows=50, as_arrow=True))
+        assert len({batch.schema for batch in batches}) == 1
+        assert sum(batch.num_rows for batch in batches) == len(generate_dataset(multi_month_config))
+
+    def test_invalid_chunk_rows(self, default_config):
+        with pytest.raises(ValueError):
+            next(iter_dataset(default_config, chunk_rows=0))
+
+
+class TestProgress:
+    def test_reports_every_step(self, multi_month_config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 30)
+        calls = []
+        df = generate_dataset(multi_month_config, progress=lambda *args: calls.append(args))
+        total = 4 * (1 + multi_month_config.num_months)
+        assert calls == [(done, total) for done in range(1, total + 1)]
+        pd.testing.assert_frame_equal(df, generate_dataset(multi_month_config))
+
+    def test_callback_can_cancel(self, multi_month_config):
+        def progress(done, total):
+            if done == 3:
+                raise GenerationCancelled()
+
+        with pytest.raises(GenerationCancelled):
+            generate_dataset(multi_month_config, progress=progress)
+
+    def test_cancel_does_not_wait_for_running_shards(self, multi_month_config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 50)
+        monkeypatch.setattr(generator, "_executor", lambda *args: ThreadPoolExecutor(2))
+        create_shard = generator._create_shard
+
+        def slow_create_shard(config, start, stop, seed_seq):
+            if start:
+                time.sleep(2)
+            return create_shard(config, start, stop, seed_seq)
+
+        monkeypatch.setattr(generator, "_create_shard", slow_create_shard)
+
+        def progress(done, total):
+            raise GenerationCancelled()
+
+        started = time.perf_counter()
+        with pytest.raises(GenerationCancelled):
+            generate_dataset(multi_month_config, progress=progress)
+        assert time.perf_counter() - started < 1
+
+    def test_stop_executor_terminates_running_workers(self, default_config):
+        executor = generator._executor(replace(default_config, workers=2), 2)
+        future = executor.submit(time.sleep, 60)
+        while not future.running():
+            time.sleep(0.01)
+        processes = list(executor._processes.values())
+        generator._stop_executor(executor)
+        for process in processes:
+            process.join(timeout=10)
+            assert process.exitcode is not None
+
+
+class TestAudit:
+    def test_audit_passes(self, default_config):
+        config = replace(default_config, audit=True)
+        pd.testing.assert_frame_equal(generate_dataset(config), generate_dataset(default_config))
+
+    def test_audit_failure_raises(self, default_config, monkeypatch):
+        monkeypatch.setattr(
+            generator, "audit_columns", lambda columns, **kwargs: {"Salary out of range": np.array([True])}
+        )
+        with pytest.raises(ValueError, match="Salary out of range"):
+            generate_dataset(replace(default_config, audit=True))
+
+
+class TestRandomState:
+    def test_concurrent_runs_do_not_interfere(self, multi_month_config):
+        expected = generate_dataset(multi_month_config)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(generate_dataset, [multi_month_config] * 4))
+        for df in results:
+            pd.testing.assert_frame_equal(df, expected)
+
+    def test_global_random_state_untouched(self, default_config):
+        before = np.random.get_state()[1].copy()
+        generate_dataset(default_config)
+        assert (np.random.get_state()[1] == before).all()
+
+
+class TestAsOfDate:
+    def test_snapshots_end_at_as_of_month(self, multi_month_config):
+        config = replace(multi_month_config, as_of_date=date(2023, 6, 15))
+        df = generate_dataset(config)
+        assert df["base_date"].min() == "2022-07-01"
+        assert df["base_date"].max() == "2023-06-01"
+        assert (df["hire_date"] <= "2023-06-15").all()
+
+    def test_same_seed_and_date_reproduce(self, default_config):
+        config = replace(default_config, as_of_date=date(2020, 2, 29))
+        pd.testing.assert_frame_equal(generate_dataset(config), generate_dataset(config))
+
+
+class TestMonthSelection:
+    """generate_dataset(months=...) and snapshot_at return rows of a full run."""
+
+    @pytest.fixture
+    def config(self, multi_month_config):
+        return replace(
+            multi_month_config,
+            num_months=30,
+            resignation_rate=0.3,
+            include_concurrent_positions=True,
+            as_of_date=date(2024, 6, 1),
+        )
+
+    @staticmethod
+    def _months(df, base_dates):
+        return df[df["base_date"].isin(base_dates)].reset_index(drop=True)
+
+    def test_slice_matches_full_run(self, config):
+        full = generate_dataset(config)
+        dates = sorted(full["base_date"].unique())
+        for months in [slice(12, 24), slice(-1, None), slice(None, 5), slice(3, 20, 4)]:
+            pd.testing.assert_frame_equal(
+                generate_dataset(config, months=months), self._months(full, dates[months])
+            )
+
+    def test_slice_matches_full_run_across_shards(self, config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 40)
+        full = generate_dataset(config)
+        dates = sorted(full["base_date"].unique())
+        pd.testing.assert_frame_equal(
+            generate_dataset(replace(config, workers=2), months=slice(20, 26)),
+            self._months(full, dates[20:26]),
+        )
+
+    def test_snapshot_at(self, config):
+        full = generate_dataset(config)
+        pd.testing.assert_frame_equal(
+            snapshot_at(config, date(2023, 9, 17)), self._months(full, ["2023-09-01"])
+        )
+        pd.testing.assert_frame_equal(
+            snapshot_at(config, "2024-06-01"), self._months(full, ["2024-06-01"])
+        )
+
+    def test_snapshot_at_outside_horizon(self, config):
+        with pytest.raises(ValueError):
+            snapshot_at(config, "2024-07-01")
+        with pytest.raises(ValueError):
+            snapshot_at(config, "2021-12-01")
+
+    def test_progress_counts_selected_months(self, config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 30)
+        calls = []
+        generate_dataset(config, progress=lambda *args: calls.append(args), months=slice(-3, None))
+        total = 4 * (1 + 3)
+        assert calls == [(done, total) for done in range(1, total + 1)]
+
+    def test_empty_selection(self, config):
+        assert generate_dataset(config, months=slice(5, 5)).empty
+
+    def test_months_must_be_slice(self, config):
+        with pytest.raises(TypeError):
+            generate_dataset(config, months=3)
+
+
+class TestScd2:
+    """generate_scd2 emits one row per change, consistent with the snapshots."""
+
+    SCD_FIELDS = ["valid_from", "valid_to", "is_current"]
+
+    @pytest.fixture
+    def config(self, multi_month_config):
+        return replace(
+            multi_month_config,
+            num_months=26,
+            resignation_rate=0.3,
+            include_concurrent_positions=True,
+            as_of_date=date(2024, 6, 1),
+        )
+
+    def test_zero_months_returns_empty_frame(self, config):
+        assert generate_scd2(replace(config, num_months=0)).empty
+
+    def test_versions_reproduce_every_snapshot(self, config):
+        full = generate_dataset(config)
+        scd = generate_scd2(config)
+        for base_date, month in full.groupby("base_date"):
+            valid = scd[(scd["valid_from"] <= base_date) & (scd["valid_to"] >= base_date)]
+            expected = month.drop(columns=["base_date"])
+            pd.testing.assert_frame_equal(
+                valid.drop(columns=self.SCD_FIELDS).reset_index(drop=True),
+                expected.reset_index(drop=True),
+            )
+
+    def test_new_version_only_on_change(self, config):
+        scd = generate_scd2(config)
+        values = scd.drop(columns=self.SCD_FIELDS).astype(str)
+        same_employee = scd["emp_id"].eq(scd["emp_id"].shift())
+        unchanged = (values == values.shift()).all(axis=1)
+        assert not (same_employee & unchanged).any()
+        assert len(scd) < len(generate_dataset(config))
+
+    def test_versions_are_contiguous(self, config):
+        scd = generate_scd2(config)
+        scd = scd[scd["is_primary_position"]].reset_index(drop=True)
+        assert scd.groupby("emp_id")["is_current"].sum().eq(1).all()
+        current = scd[scd["is_current"]]
+        assert (current["valid_to"] == current["resign_date"]).all()
+        assert (current["valid_to"] == "2999-12-31").any()
+        following = scd.groupby("emp_id")["valid_from"].shift(-1)
+        closed = ~scd["is_current"]
+        next_day = pd.to_datetime(scd.loc[closed, "valid_to"]) + pd.Timedelta(days=1)
+        assert (next_day.dt.strftime("%Y-%m-%d") == following[closed]).all()
+
+    def test_identical_across_worker_counts(self, config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 40)
+        pd.testing.assert_frame_equal(
+            generate_scd2(config), generate_scd2(replace(config, workers=2))
+        )
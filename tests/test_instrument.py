@@ -0,0 +1,56 @@
+"""Tests for generate_dataset phase instrumentation."""
+from dataclasses import replace
+
+import pandas as pd
+
+from hr_generator import generator
+from hr_generator.generator import generate_dataset
+from hr_generator.instrument import PhaseRecorder, phase_timer
+
+
+class TestPhaseTimer:
+    def test_disabled_without_observer(self):
+        with phase_timer(None)("anything") as stats:
+            stats["rows"] = 1
+
+    def test_start_and_end_events(self):
+        events = []
+        with phase_timer(events.append)("build", month=2) as stats:
+            stats["rows"] = 5
+        start, end = events
+        assert start == {"event": "start", "phase": "build", "month": 2}
+        assert end["rows"] == 5 and end["month"] == 2
+        assert end["wall_seconds"] >= 0 and end["cpu_seconds"] >= 0
+        assert "peak_memory_bytes" not in end
+
+
+class TestGenerateDatasetObserver:
+    def test_reports_every_phase(self, multi_month_config):
+        config = replace(multi_month_config, include_concurrent_positions=True)
+        recorder = PhaseRecorder()
+        df = generate_dataset(config, observer=recorder)
+        pd.testing.assert_frame_equal(df, generate_dataset(config))
+
+        totals = recorder.report()["totals"]
+        assert list(totals) == [
+            "load_profile", "create_base_employees", "forced_performance",
+            "build_timeline", "snapshot", "concurrent_positions", "build_frame",
+        ]
+        assert totals["create_base_employees"]["rows"] == config.employee_count
+        assert totals["build_timeline"]["rows"] == config.employee_count
+        assert totals["snapshot"]["count"] == config.num_months
+        assert totals["concurrent_positions"]["rows"] == totals["build_frame"]["rows"] == len(df)
+
+    def test_trace_memory(self, default_config):
+        with PhaseRecorder(trace_memory=True) as recorder:
+            generate_dataset(default_config, observer=recorder)
+        totals = recorder.report()["totals"]
+        assert all(total["peak_memory_bytes"] > 0 for total in totals.values())
+
+    def test_process_pool_reports_shards(self, multi_month_config, monkeypatch):
+        monkeypatch.setattr(generator, "SHARD_SIZE", 40)
+        recorder = PhaseRecorder()
+        df = generate_dataset(replace(multi_month_config, workers=2), observer=recorder)
+        totals = recorder.report()["totals"]
+        assert "snapshot" not in totals
+        assert totals["simulate_shards"]["rows"] == len(df)
@@ -0,0 +1,46 @@
+"""Tests for background generation jobs."""
+import threading
+
+import pandas as pd
+
+from hr_generator.generator import generate_dataset
+from hr_generator.jobs import GenerationJob
+
+
+class TestGenerationJob:
+    def test_runs_to_completion(self, multi_month_config):
+        job = GenerationJob(multi_month_config, generate=generate_dataset).start()
+        job.wait()
+        assert not job.running
+        assert job.error is None
+        assert job.fraction == 1.0
+        pd.testing.assert_frame_equal(job.result, generate_dataset(multi_month_config))
+
+    def test_cancel_stops_generation(self, multi_month_config):
+        started = threading.Event()
+        release = threading.Event()
+
+        def generate(config, progress):
+            progress(1, 3)
+            started.set()
+            release.wait()
+            progress(2, 3)
+            return pd.DataFrame({"x": [1]})
+
+        job = GenerationJob(multi_month_config, generate=generate).start()
+        started.wait()
+        job.cancel()
+        release.set()
+        job.wait()
+        assert job.cancelled
+        assert job.result is None
+        assert job.error is None
+        assert (job.done, job.total) == (1, 3)
+
+    def test_error_is_kept(self, default_config):
+        def generate(config, progress):
+            raise RuntimeError("boom")
+
+        job = GenerationJob(default_config, generate=generate).start()
+        job.wait()
+        assert isinstance(job.error, RuntimeError)
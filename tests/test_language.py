@@ -0,0 +1,62 @@
+"""Tests for the precompiled LanguageProfile."""
+import numpy as np
+import pytest
+
+from hr_generator.config import LANGUAGE_DATA
+from hr_generator.language import (
+    EXECUTIVE,
+    DIRECTOR,
+    MANAGER,
+    as_profile,
+    get_profile,
+)
+
+
+class TestLanguageProfile:
+    def test_cached_per_language(self):
+        assert get_profile("English") is get_profile("English")
+        assert as_profile(LANGUAGE_DATA["Japanese"]) is get_profile("Japanese")
+
+    def test_immutable(self):
+        profile = get_profile("English")
+        with pytest.raises(AttributeError):
+            profile.language = "Japanese"
+        with pytest.raises(ValueError):
+            profile.position_flags[0] = EXECUTIVE
+        with pytest.raises(TypeError):
+            profile.codes["position"]["Intern"] = 99
+
+    def test_position_tables(self):
+        profile = get_profile("English")
+        assert profile.position_index["Manager"] == 2
+        assert list(profile.position_grades) == ["Lv1", "Lv2", "Lv3", "Lv4", "Lv5", "Lv6"]
+        flags = dict(zip(profile.position_choices, profile.position_flags))
+        assert flags["Staff"] == 0
+        assert flags["Manager"] == MANAGER
+        assert flags["General Manager"] == DIRECTOR
+        assert flags["VP"] == flags["C-level"] == EXECUTIVE
+
+    def test_dept_keys(self):
+        assert get_profile("English").dept_keys == ("Sales", "Engineering", "HR", "Finance")
+        assert get_profile("Japanese").dept_keys == ("Sales", "Engineering", "HR", "Finance")
+
+    def test_codes_match_categories(self):
+        profile = get_profile("Japanese")
+        for field, values in profile.categories.items():
+            assert [profile.codes[field][v] for v in values] == list(range(len(values)))
+
+    def test_category_codes(self):
+        profile = get_profile("English")
+        values = np.array([*profile.org_lv2_choices[::-1], None, "Nowhere"], dtype=object)
+        expected = [*range(len(profile.org_lv2_choices))][::-1] + [-1, -1]
+        assert profile.category_codes("org_lv2", values).tolist() == expected
+
+    def test_cumulative_weights(self):
+        profile = get_profile("English")
+        assert list(profile.emp_type_cum_weights) == [70, 90, 100]
+        assert profile.org_lv2_cum_weights[-1] == 100
+
+    def test_custom_lang_data_compiles(self):
+        profile = as_profile(LANGUAGE_DATA["English"].copy())
+        assert profile.language is None
+        assert list(profile.position_choices) == LANGUAGE_DATA["English"]["positions"]["choices"]
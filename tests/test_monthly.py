@@ -1,7 +1,11 @@
 """Tests for monthly simulation logic - P0 and P2."""
 from dataclasses import replace
 
+import numpy as np
+
+from hr_generator.batch import NO_RESIGN_DATE, create_employees_batch, columns_to_records
 from hr_generator.generator import generate_dataset
+from hr_generator.monthly import generate_monthly_snapshot, simulate_month
 
 
 class TestMonthlyResignation:
@@ -47,3 +51,52 @@ class TestMonthlyPromotions:
         executives = df[df["position"].isin(lang_data_positions)]
         if len(executives) > 0:
             assert executives["org_lv2"].isna().all() | (executives["org_lv2"] == "").all() | (executives["org_lv2"].isnull()).all()
+
+
+class TestSimulateMonth:
+    """The struct-of-arrays simulator must honour the same rules as the dict API."""
+
+    def _state(self, config, lang_data, n=300):
+        return create_employees_batch(config, lang_data, n, np.random.default_rng(1))
+
+    def test_resigned_before_month_are_excluded(self, multi_month_config, english_lang_data):
+        state = self._state(multi_month_config, english_lang_data)
+        state["resign_date"][:10] = "2020-01-31"
+        active = simulate_month(
+            state, 0, "2024-01-01", multi_month_config, english_lang_data,
+            np.random.default_rng(0),
+        )
+        assert not set(range(10)) & set(active.tolist())
+        assert len(active) == 290
+
+    def test_resignations_get_reason_and_month_end_date(self, multi_month_config, english_lang_data):
+        config = replace(multi_month_config, resignation_rate=0.99)
+        state = self._state(config, english_lang_data)
+        simulate_month(state, 0, "2024-02-01", config, english_lang_data, np.random.default_rng(0))
+        resigned = state["resign_date"] != NO_RESIGN_DATE
+        assert resigned.any()
+        assert set(state["resign_date"][resigned]) == {np.datetime64("2024-02-29")}
+        assert all(r is not None for r in state["resignation_reason"][resigned])
+        assert all(r is None for r in state["resignation_reason"][~resigned])
+
+    def test_temporary_never_resign_or_drift(self, multi_month_config, english_lang_data):
+        config = replace(multi_month_config, resignation_rate=0.99)
+        state = self._state(config, english_lang_data)
+        temps = state["emp_type"] == "Temporary"
+        rng = np.random.default_rng(0)
+        for offset in range(12):
+            simulate_month(state, offset, f"2024-{offset + 1:02d}-01", config, english_lang_data, rng)
+        assert (state["resign_date"][temps] == NO_RESIGN_DATE).all()
+        assert np.isnan(state["engagement_score"][temps]).all()
+
+    def test_dict_snapshot_updates_base_in_place(self, multi_month_config, english_lang_data):
+        config = replace(multi_month_config, resignation_rate=0.99)
+        base = columns_to_records(self._state(config, english_lang_data, n=50))
+        rows = generate_monthly_snapshot(
+            base, 0, "2024-03-01", config, english_lang_data, np.random.default_rng(0)
+        )
+        assert len(rows) == 50
+        assert all(row["base_date"] == "2024-03-01" for row in rows)
+        for row, emp in zip(rows, base):
+            assert row["resign_date"] == emp["resign_date"]
+            assert emp["engagement_score"] is None or isinstance(emp["engagement_score"], int)
@@ -0,0 +1,58 @@
+"""Tests for the vectorized name sampler."""
+import numpy as np
+import pytest
+
+from hr_generator.batch import create_employees_batch
+from hr_generator.names import name_tables, sample_names
+
+
+class TestNameTables:
+    def test_english_order(self):
+        tables = name_tables("en_US")
+        assert not tables["last_first"]
+        assert "Smith" in set(tables["last"])
+
+    def test_japanese_order(self):
+        assert name_tables("ja_JP")["last_first"]
+
+
+class TestSampleNames:
+    def test_english_names(self):
+        names = sample_names(np.random.default_rng(0), "en_US", 500)
+        assert len(names) == 500
+        assert all(len(name.split(" ")) == 2 for name in names)
+
+    def test_japanese_names_family_name_first(self):
+        tables = name_tables("ja_JP")
+        names = sample_names(np.random.default_rng(0), "ja_JP", 500)
+        assert all(name.split(" ")[0] in set(tables["last"]) for name in names)
+
+    def test_female_first_names(self):
+        tables = name_tables("ja_JP")
+        female = set(tables["first"][tables["female"][0]])
+        names = sample_names(np.random.default_rng(0), "ja_JP", 200, is_female=np.ones(200, bool))
+        assert all(name.split(" ")[1] in female for name in names)
+
+    def test_same_seed_same_names(self):
+        a = sample_names(np.random.default_rng(7), "en_US", 100)
+        b = sample_names(np.random.default_rng(7), "en_US", 100)
+        assert list(a) == list(b)
+
+    def test_unique(self):
+        names = sample_names(np.random.default_rng(0), "ja_JP", 2000, unique=True)
+        assert len(set(names)) == 2000
+
+    def test_unique_over_capacity_raises(self):
+        with pytest.raises(ValueError):
+            sample_names(
+                np.random.default_rng(0), "ja_JP", 5000, is_female=np.zeros(5000, bool), unique=True
+            )
+
+    def test_batch_names_follow_gender(self, default_config, english_lang_data):
+        tables = name_tables("en_US")
+        male_only = set(tables["first"][tables["male"][0]]) - set(tables["first"][tables["female"][0]])
+        columns = create_employees_batch(
+            default_config, english_lang_data, 300, np.random.default_rng(0)
+        )
+        first = np.array([name.split(" ")[0] for name in columns["name"]], dtype=object)
+        assert not np.isin(first[columns["gender"] == "Female"], list(male_only)).any()
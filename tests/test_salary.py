@@ -1,5 +1,5 @@
 """Tests for salary calculation and label - P1 and P2."""
-import random
+import numpy as np
 
 from hr_generator.employee import calculate_salary, adjust_salary_by_performance
 from hr_generator.config import TRANSLATIONS, JOB_GRADE_SALARY_BANDS
@@ -33,10 +33,14 @@ class TestCalculateSalary:
     def test_salary_varies_within_grade(self):
         """Same grade should produce different salaries (random variation)."""
         salary_range = (4000000, 10000000)
-        random.seed(None)
         salaries = {calculate_salary(salary_range, "Lv3") for _ in range(50)}
         assert len(salaries) > 1, "Salary should vary within the same grade"
 
+    def test_seeded_rng_reproducible(self):
+        salary_range = (4000000, 10000000)
+        first = calculate_salary(salary_range, "Lv3", rng=np.random.default_rng(1))
+        assert first == calculate_salary(salary_range, "Lv3", rng=np.random.default_rng(1))
+
 
 class TestAdjustSalaryByPerformance:
     def test_s_performance_increases(self):
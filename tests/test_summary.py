@@ -0,0 +1,31 @@
+"""Tests for the app's KPI and chart aggregates."""
+from dataclasses import replace
+
+from hr_generator.generator import generate_dataset
+from hr_generator.summary import summarize_dataset
+
+
+class TestSummarizeDataset:
+    def test_kpis(self, multi_month_config):
+        config = replace(multi_month_config, include_concurrent_positions=True,
+                         concurrent_position_rate=0.3)
+        df = generate_dataset(config)
+        kpis = summarize_dataset(df, point_limit=5000)["kpis"]
+        assert kpis["total_rows"] == len(df)
+        assert kpis["headcount"] == config.employee_count
+        assert kpis["months"] == config.num_months
+        resigned = df.loc[df["resign_date"] != "2999-12-31", "emp_id"].nunique()
+        assert kpis["resignations"] == resigned
+
+    def test_chart_frames_cover_first_month(self, default_config):
+        df = generate_dataset(default_config)
+        summary = summarize_dataset(df, point_limit=5000)
+        assert summary["gender"]["Count"].sum() == default_config.employee_count
+        assert list(summary["org"]["Count"]) == sorted(summary["org"]["Count"])
+        assert len(summary["salary"]) == df["salary"].notna().sum()
+
+    def test_salary_points_are_sampled(self, default_config):
+        df = generate_dataset(default_config)
+        salary = summarize_dataset(df, point_limit=50)["salary"]
+        assert len(salary) == 50
+        assert list(salary.columns) == ["position", "salary"]
@@ -0,0 +1,83 @@
+"""Tests for the event-sourced employee timeline."""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from hr_generator.batch import assign_forced_performance_batch, create_employees_batch
+from hr_generator.engine import columns_to_frame, take_columns
+from hr_generator.generator import _base_dates
+from hr_generator.models import resolve_as_of_date
+from hr_generator.monthly import simulate_month
+from hr_generator.timeline import build_timeline, month_seed, shard_seed, snapshot
+
+
+def _setup(config, lang_data, n=400):
+    config = resolve_as_of_date(replace(config, num_months=30, resignation_rate=0.3))
+    state = create_employees_batch(config, lang_data, n, np.random.default_rng(3))
+    assign_forced_performance_batch(state)
+    return config, state, _base_dates(config)
+
+
+class TestSnapshot:
+    def test_matches_month_by_month_simulation(self, multi_month_config, english_lang_data):
+        config, state, base_dates = _setup(multi_month_config, english_lang_data)
+        seed_seq = np.random.SeedSequence(7)
+        timeline = build_timeline(state, base_dates, config, english_lang_data, seed_seq)
+
+        work = take_columns(state, slice(None))
+        for month_offset, base_date in enumerate(base_dates):
+            rng = np.random.default_rng(month_seed(seed_seq, month_offset))
+            active = simulate_month(work, month_offset, base_date, config, english_lang_data, rng)
+            expected = take_columns(work, active)
+            expected["base_date"] = np.full(len(active), base_date)
+            pd.testing.assert_frame_equal(
+                columns_to_frame(snapshot(timeline, month_offset)), columns_to_frame(expected)
+            )
+
+    def test_months_in_any_order(self, multi_month_config, english_lang_data):
+        config, state, base_dates = _setup(multi_month_config, english_lang_data)
+        timeline = build_timeline(
+            state, base_dates, config, english_lang_data, np.random.SeedSequence(7)
+        )
+        in_order = [columns_to_frame(snapshot(timeline, m)) for m in range(len(base_dates))]
+        for m in [29, 0, 23, 11, 12, 5]:
+            pd.testing.assert_frame_equal(columns_to_frame(snapshot(timeline, m)), in_order[m])
+
+    def test_state_is_not_modified(self, multi_month_config, english_lang_data):
+        config, state, base_dates = _setup(multi_month_config, english_lang_data)
+        before = columns_to_frame(take_columns(state, slice(None)))
+        build_timeline(state, base_dates, config, english_lang_data, np.random.SeedSequence(7))
+        pd.testing.assert_frame_equal(columns_to_frame(state), before)
+
+    def test_resigned_employees_leave_after_their_month(self, multi_month_config, english_lang_data):
+        config, state, base_dates = _setup(multi_month_config, english_lang_data)
+        timeline = build_timeline(
+            state, base_dates, config, english_lang_data, np.random.SeedSequence(7)
+        )
+        resigned_at = timeline["resigned_at"]
+        month = 20
+        ids = set(snapshot(timeline, month)["emp_id"])
+        assert ids == set(state["emp_id"][resigned_at >= month])
+        assert (resigned_at < month).any()
+
+
+class TestMonthSeed:
+    def test_independent_of_spawn_history(self):
+        seq = np.random.SeedSequence(11)
+        first = month_seed(seq, 3).generate_state(4)
+        seq.spawn(5)
+        np.testing.assert_array_equal(month_seed(seq, 3).generate_state(4), first)
+
+    def test_months_and_streams_differ(self):
+        seq = np.random.SeedSequence(11)
+        states = {
+            tuple(month_seed(seq, m, stream).generate_state(2))
+            for m in range(3) for stream in range(2)
+        }
+        assert len(states) == 6
+
+    def test_shard_streams_differ_from_month_streams(self):
+        seq = np.random.SeedSequence(11)
+        months = {tuple(month_seed(seq, m, s).generate_state(2)) for m in range(3) for s in range(2)}
+        assert tuple(shard_seed(seq, 0).generate_state(2)) not in months